@@ -0,0 +1,341 @@
+import bisect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from brick_model_summarizer.batch import find_models, summarize_file
+
+
+# Bucket lower bounds; the last bucket is open-ended
+COUNT_EDGES = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+RATIO_EDGES = tuple(i / 10 for i in range(11))
+AREA_EDGES = (0, 5000, 10000, 25000, 50000, 100000, 250000, 500000, 1000000)
+
+# Per-model sensor coverage: (component, numerator field, denominator fields).
+# The AHU numerators count matching points rather than AHUs, so an AHU with
+# several such sensors can push the ratio past 1; ratios are capped at 1.
+COVERAGE_RATIOS = {
+    "ahu_supply_air_temp_sensor_coverage": (
+        "ahu_information",
+        "ahus_with_supply_air_temp_sensors",
+        ("total_ahus",),
+    ),
+    "ahu_return_air_temp_sensor_coverage": (
+        "ahu_information",
+        "ahus_with_return_air_temp_sensors",
+        ("total_ahus",),
+    ),
+    "ahu_mixing_air_temp_sensor_coverage": (
+        "ahu_information",
+        "ahus_with_mixing_air_temp_sensors",
+        ("total_ahus",),
+    ),
+    "ahu_static_pressure_sensor_coverage": (
+        "ahu_information",
+        "ahus_with_static_pressure_sensors",
+        ("total_ahus",),
+    ),
+    "ahu_air_flow_sensor_coverage": (
+        "ahu_information",
+        "ahus_with_air_flow_sensors",
+        ("total_ahus",),
+    ),
+    "vav_air_flow_sensor_coverage": (
+        "zone_information",
+        "vav_boxes_with_air_flow_sensors",
+        (
+            "total_variable_air_volume_boxes",
+            "total_variable_air_volume_boxes_with_reheat",
+        ),
+    ),
+    "vav_supply_air_temp_sensor_coverage": (
+        "zone_information",
+        "vav_boxes_with_supply_air_temp_sensors",
+        (
+            "total_variable_air_volume_boxes",
+            "total_variable_air_volume_boxes_with_reheat",
+        ),
+    ),
+}
+
+VAVS_PER_AHU = "vav_boxes_per_ahu"
+# Components keyed by AHU name rather than by field
+PER_AHU_COMPONENTS = {"number_of_vav_boxes_per_ahu"}
+BUILDING_AREA = "building_information.building_area_sq_ft"
+
+HISTOGRAM_EDGES = {BUILDING_AREA: AREA_EDGES}
+HISTOGRAM_EDGES.update({f"coverage.{name}": RATIO_EDGES for name in COVERAGE_RATIOS})
+
+
+class Histogram:
+    """Count, sum, min, max and fixed-bucket counts of a numeric field."""
+
+    def __init__(self, edges=COUNT_EDGES):
+        self.edges = tuple(edges)
+        self.buckets = [0] * len(self.edges)
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """Add one value; values below the first edge go to the first bucket."""
+        self.buckets[max(bisect.bisect_right(self.edges, value) - 1, 0)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        """Add the values of other, which must use the same edges."""
+        if other.edges != self.edges:
+            raise ValueError("Cannot merge histograms with different edges")
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.count += other.count
+        self.sum += other.sum
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        return self
+
+    def quantile(self, q):
+        """Estimate the q-quantile by interpolating inside its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket in enumerate(self.buckets):
+            if bucket and seen + bucket >= rank:
+                low = max(self.edges[i], self.min)
+                high = self.edges[i + 1] if i + 1 < len(self.edges) else self.max
+                high = min(high, self.max)
+                if high <= low:
+                    return low
+                fraction = (rank - seen) / bucket
+                return low + (high - low) * fraction
+            seen += bucket
+        return self.max
+
+    def to_dict(self):
+        return {
+            "edges": list(self.edges),
+            "buckets": self.buckets,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls(data["edges"])
+        histogram.buckets = list(data["buckets"])
+        histogram.count = data["count"]
+        histogram.sum = data["sum"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
+
+    def report(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "histogram": dict(zip(map(str, self.edges), self.buckets)),
+        }
+
+
+def _area_sq_ft(value):
+    """Return the area of a building_area string given in sq ft, or None."""
+    if isinstance(value, str) and value.endswith(" sq ft"):
+        try:
+            return float(value[: -len(" sq ft")])
+        except ValueError:
+            return None
+    return None
+
+
+class PortfolioAggregate:
+    """
+    Portfolio-wide statistics that can be built per model and merged.
+
+    Every numeric field of a summary ("component.field") gets a Histogram,
+    every boolean field a count of models where it is true, and fields
+    reported as "not_available" a missing count. On top of the raw fields
+    it tracks the VAV boxes (of all types) per AHU, the building area in sq ft and the
+    per-model COVERAGE_RATIOS. Merging only adds counts and combines
+    min/max, so partial aggregates from any number of workers can be merged
+    in any order and grouping with the same result, and memory does not
+    grow with the number of models.
+    """
+
+    def __init__(self):
+        self.models = 0
+        self.failed = 0
+        self.numeric = {}
+        self.presence = {}
+        self.missing = {}
+
+    def _histogram(self, key):
+        if key not in self.numeric:
+            self.numeric[key] = Histogram(HISTOGRAM_EDGES.get(key, COUNT_EDGES))
+        return self.numeric[key]
+
+    def add_summary(self, summary):
+        """Add the summarize_model output of one model."""
+        self.models += 1
+        for component, fields in summary.items():
+            if component in PER_AHU_COMPONENTS or not isinstance(fields, dict):
+                continue
+            for field, value in fields.items():
+                key = f"{component}.{field}"
+                if isinstance(value, bool):
+                    true, total = self.presence.get(key, (0, 0))
+                    self.presence[key] = (true + value, total + 1)
+                elif isinstance(value, (int, float)):
+                    self._histogram(key).add(value)
+                elif value == "not_available":
+                    self.missing[key] = self.missing.get(key, 0) + 1
+
+        per_ahu = summary.get("number_of_vav_boxes_per_ahu")
+        if per_ahu is None:
+            zones = summary.get("zone_information") or {}
+            per_ahu = zones.get("number_of_vav_boxes_per_ahu") or {}
+        for counts in per_ahu.values():
+            # VAV boxes of every type, e.g. {"Variable_Air_Volume_Box": n, ...}
+            if isinstance(counts, dict):
+                counts = sum(counts.values())
+            self._histogram(VAVS_PER_AHU).add(counts)
+        building = summary.get("building_information") or {}
+        area = _area_sq_ft(building.get("building_area"))
+        if area is not None:
+            self._histogram(BUILDING_AREA).add(area)
+        for name, (component, numerator, denominators) in COVERAGE_RATIOS.items():
+            fields = summary.get(component) or {}
+            total = sum(fields.get(denominator, 0) for denominator in denominators)
+            if total:
+                self._histogram(f"coverage.{name}").add(
+                    min(fields.get(numerator, 0) / total, 1.0)
+                )
+        return self
+
+    def add_record(self, record):
+        """Add a batch record, counting records with an error as failed."""
+        if "error" in record:
+            self.failed += 1
+        else:
+            self.add_summary(record["summary"])
+        return self
+
+    def merge(self, other):
+        """Fold another aggregate into this one and return self."""
+        self.models += other.models
+        self.failed += other.failed
+        for key, histogram in other.numeric.items():
+            if key in self.numeric:
+                self.numeric[key].merge(histogram)
+            else:
+                self.numeric[key] = Histogram.from_dict(histogram.to_dict())
+        for key, (true, total) in other.presence.items():
+            own_true, own_total = self.presence.get(key, (0, 0))
+            self.presence[key] = (own_true + true, own_total + total)
+        for key, count in other.missing.items():
+            self.missing[key] = self.missing.get(key, 0) + count
+        return self
+
+    def to_dict(self):
+        """Return a JSON-compatible form, for shipping or saving partials."""
+        return {
+            "models": self.models,
+            "failed": self.failed,
+            "numeric": {key: h.to_dict() for key, h in self.numeric.items()},
+            "presence": {key: list(value) for key, value in self.presence.items()},
+            "missing": self.missing,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        aggregate = cls()
+        aggregate.models = data["models"]
+        aggregate.failed = data["failed"]
+        aggregate.numeric = {
+            key: Histogram.from_dict(value) for key, value in data["numeric"].items()
+        }
+        aggregate.presence = {
+            key: tuple(value) for key, value in data["presence"].items()
+        }
+        aggregate.missing = dict(data["missing"])
+        return aggregate
+
+    def report(self):
+        """Return the portfolio statistics, with rates and quantiles."""
+        return {
+            "models": self.models,
+            "failed": self.failed,
+            "numeric": {
+                key: self.numeric[key].report() for key in sorted(self.numeric)
+            },
+            "presence": {
+                key: {"true": true, "count": total, "rate": true / total}
+                for key, (true, total) in sorted(self.presence.items())
+            },
+            "missing": dict(sorted(self.missing.items())),
+        }
+
+
+def merge_aggregates(aggregates):
+    """Merge an iterable of PortfolioAggregates into a new one."""
+    merged = PortfolioAggregate()
+    for aggregate in aggregates:
+        merged.merge(aggregate)
+    return merged
+
+
+def aggregate_records(path):
+    """Aggregate a JSON Lines file written by the batch summarizer."""
+    aggregate = PortfolioAggregate()
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                aggregate.add_record(json.loads(line))
+    return aggregate
+
+
+def _aggregate_chunk(models, components):
+    aggregate = PortfolioAggregate()
+    for model in models:
+        aggregate.add_record(summarize_file(model, components))
+    return aggregate.to_dict()
+
+
+def aggregate_portfolio(source, workers=None, components=None, chunk_size=16):
+    """
+    Aggregate every model in source without keeping the summaries.
+
+    Models are split into chunks of chunk_size; each worker process
+    summarizes a chunk into a partial aggregate, and the partials are merged
+    as they finish. workers=1 runs in-process.
+    """
+    models = find_models(source)
+    chunks = [
+        models[start : start + chunk_size]
+        for start in range(0, len(models), chunk_size)
+    ]
+    if workers == 1:
+        partials = (_aggregate_chunk(chunk, components) for chunk in chunks)
+        return merge_aggregates(map(PortfolioAggregate.from_dict, partials))
+
+    workers = workers or os.cpu_count() or 1
+    merged = PortfolioAggregate()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_aggregate_chunk, chunk, components) for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            merged.merge(PortfolioAggregate.from_dict(future.result()))
+    return merged
@@ -1,6 +1,36 @@
-from brick_model_summarizer.utils import BRICK
+import logging
 
-DEBUG = 1
+from brick_model_summarizer.utils import BRICK
+from brick_model_summarizer.graph_index import get_graph_index
+from brick_model_summarizer.queries import instrumented
+from brick_model_summarizer.point_matcher import (
+    AHU_POINT_IDENTIFIERS,
+    match_equipment_points,
+)
+
+# AHU classification details are logged at DEBUG level
+logger = logging.getLogger(__name__)
+
+# Point identifier -> AHU feature counter it increments
+AHU_FEATURE_COUNTERS = {
+    "cooling_coil": "cooling_coil_count",
+    "heating_coil": "heating_coil_count",
+    "return_fan": "return_fan_count",
+    "supply_fan": "supply_fan_count",
+    "return_air_temperature_sensor": "return_temp_sensor_count",
+    "mixed_air_temperature_sensor": "mixing_temp_sensor_count",
+    "supply_air_temperature_sensor": "supply_temp_sensor_count",
+    "supply_air_temperature_setpoint": "supply_temp_setpoint_count",
+    "supply_air_static_pressure_sensor": "static_pressure_sensor_count",
+    "supply_air_static_pressure_setpoint": "static_pressure_setpoint_count",
+    "air_flow_sensor": "air_flow_sensor_count",
+    "air_flow_setpoint": "air_flow_setpoint_count",
+    "active_chilled_beam": "active_chilled_beam_count",
+    "chilled_beam": "chilled_beam_count",
+    "passive_chilled_beam": "passive_chilled_beam_count",
+    "heat_wheel": "heat_wheel_count",
+    "heat_wheel_vfd": "heat_wheel_vfd_count",
+}
 
 
 def identify_ahu_equipment(graph):
@@ -16,20 +46,13 @@ def identify_ahu_equipment(graph):
     return ahu_equipment
 
 
+@instrumented("ahu.count")
 def count_ahus(graph):
     """Count the total number of Air_Handling_Units in the building model."""
-    query = """
-    PREFIX brick: <https://brickschema.org/schema/Brick#>
-    SELECT (COUNT(?ahu) AS ?ahu_count) WHERE {
-        ?ahu a brick:Air_Handling_Unit .
-    }
-    """
-    results = graph.query(query)
-    for row in results:
-        return int(row["ahu_count"])
-    return 0
+    return get_graph_index(graph).count(BRICK.Air_Handling_Unit)
 
 
+@instrumented("ahu.features")
 def count_ahu_features(graph):
     """Count AHUs with specific features and classify them as VAV or CV."""
     features = {
@@ -54,123 +77,42 @@ def count_ahu_features(graph):
         "heat_wheel_vfd_count": 0,
     }
 
-    query = """
-    PREFIX brick: <https://brickschema.org/schema/Brick#>
-    SELECT ?ahu ?point WHERE {
-        ?ahu a brick:Air_Handling_Unit .
-        ?ahu brick:hasPoint ?point .
-        FILTER(
-            CONTAINS(LCASE(STR(?point)), "cooling_coil") ||
-            CONTAINS(LCASE(STR(?point)), "heating_coil") ||
-            CONTAINS(LCASE(STR(?point)), "return_fan") ||
-            CONTAINS(LCASE(STR(?point)), "supply_fan") ||
-            CONTAINS(LCASE(STR(?point)), "return_air_temperature_sensor") ||
-            CONTAINS(LCASE(STR(?point)), "mixed_air_temperature_sensor") ||
-            CONTAINS(LCASE(STR(?point)), "supply_air_temperature_sensor") ||
-            CONTAINS(LCASE(STR(?point)), "supply_air_temperature_setpoint") ||
-            CONTAINS(LCASE(STR(?point)), "supply_air_static_pressure_sensor") ||
-            CONTAINS(LCASE(STR(?point)), "supply_air_static_pressure_setpoint") ||
-            CONTAINS(LCASE(STR(?point)), "air_flow_sensor") ||
-            CONTAINS(LCASE(STR(?point)), "air_flow_setpoint") ||
-            CONTAINS(LCASE(STR(?point)), "active_chilled_beam") ||
-            CONTAINS(LCASE(STR(?point)), "chilled_beam") ||
-            CONTAINS(LCASE(STR(?point)), "passive_chilled_beam") ||
-            CONTAINS(LCASE(STR(?point)), "heat_wheel") ||
-            CONTAINS(LCASE(STR(?point)), "heat_wheel_vfd")
-        )
-    }
-    """
-    if DEBUG:
-        print()
-        print("=== Starting AHU DEBUG ===")
-        print()
-
-    ahu_points = {}
-    results = graph.query(query)
-    for row in results:
-        ahu = str(row.ahu)
-        point = str(row.point).lower()
-        if ahu not in ahu_points:
-            ahu_points[ahu] = []
-
-        ahu_points[ahu].append(point)
-
-        # Increment feature counters and log if DEBUG
-        if "cooling_coil" in point:
-            features["cooling_coil_count"] += 1
-
-        if "heating_coil" in point:
-            features["heating_coil_count"] += 1
-
-        if "return_fan" in point:
-            features["return_fan_count"] += 1
-
-        if "supply_fan" in point:
-            features["supply_fan_count"] += 1
-
-        if "return_air_temperature_sensor" in point:
-            features["return_temp_sensor_count"] += 1
+    index = get_graph_index(graph)
+    equipment_hits = match_equipment_points(graph)
 
-        if "mixed_air_temperature_sensor" in point:
-            features["mixing_temp_sensor_count"] += 1
+    logger.debug("=== Starting AHU DEBUG ===")
 
-        if "supply_air_temperature_sensor" in point:
-            features["supply_temp_sensor_count"] += 1
-
-        if "supply_air_temperature_setpoint" in point:
-            features["supply_temp_setpoint_count"] += 1
-
-        if "supply_air_static_pressure_sensor" in point:
-            features["static_pressure_sensor_count"] += 1
-
-        if "supply_air_static_pressure_setpoint" in point:
-            features["static_pressure_setpoint_count"] += 1
-
-        if "air_flow_sensor" in point:
-            features["air_flow_sensor_count"] += 1
-
-        if "air_flow_setpoint" in point:
-            features["air_flow_setpoint_count"] += 1
-
-        if "active_chilled_beam" in point:
-            features["active_chilled_beam_count"] += 1
-
-        if "chilled_beam" in point:
-            features["chilled_beam_count"] += 1
+    ahu_points = {}
+    for ahu_node in index.subjects_of_type(BRICK.Air_Handling_Unit):
+        for point_node, hits in equipment_hits.get(ahu_node, ()):
+            ahu_hits = hits.intersection(AHU_POINT_IDENTIFIERS)
+            if not ahu_hits:
+                continue
 
-        if "passive_chilled_beam" in point:
-            features["passive_chilled_beam_count"] += 1
+            ahu = str(ahu_node)
+            if ahu not in ahu_points:
+                ahu_points[ahu] = []
 
-        if "heat_wheel" in point:
-            features["heat_wheel_count"] += 1
+            ahu_points[ahu].append((str(point_node).lower(), ahu_hits))
 
-        if "heat_wheel_vfd" in point:
-            features["heat_wheel_vfd_count"] += 1
+            # Increment feature counters
+            for identifier in ahu_hits:
+                features[AHU_FEATURE_COUNTERS[identifier]] += 1
 
     for ahu, points in ahu_points.items():
-        # Print a blank line to separate AHUs
-        if DEBUG:
-            print()
-
-        if any("supply_air_static_pressure_sensor" in point for point in points):
+        if any("supply_air_static_pressure_sensor" in hits for _, hits in points):
             features["vav_count"] += 1
-            if DEBUG:
-                print(f"{ahu}: Classified as VAV AHU")
+            logger.debug("%s: Classified as VAV AHU", ahu)
         else:
             features["cv_count"] += 1
-            if DEBUG:
-                print(f"{ahu}: Classified as CV AHU")
-
-        if DEBUG:
-            # Print each point for the AHU
-            for point in points:
-                print(f"  Detected Point: {point}")
-
-    if DEBUG:
-        print()
-        print("=== AHU DEBUG Summary ===")
-        print(f"Processed AHU's: {len(ahu_points)}")
-        print()
+            logger.debug("%s: Classified as CV AHU", ahu)
+
+        # Log each point for the AHU
+        for point, _ in points:
+            logger.debug("  Detected Point: %s", point)
+
+    logger.debug("=== AHU DEBUG Summary ===")
+    logger.debug("Processed AHU's: %d", len(ahu_points))
 
     return features
 
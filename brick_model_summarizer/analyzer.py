@@ -1,5 +1,8 @@
+import csv
 import os
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 
 def parse_building_area(area_str):
@@ -22,249 +25,295 @@ def parse_number_of_floors(floor_str):
     return 0  # Default to 0 for "Not available" or invalid values
 
 
-def analyze_csv(file_path):
+# Summary CSV fields: first row whose Subcategory contains the pattern wins
+CSV_FIELDS = {
+    "building_area": "Building Area",
+    "num_floors": "Number of Floors",
+    "total_ahu_count": "Total AHUs",
+    "vav_count": "Variable Air Volume AHUs",
+    "cv_count": "Constant Volume AHUs",
+    "cooling_coils_count": "AHUs with Cooling Coil",
+}
+
+
+def read_csv_fields(file_path, fields=CSV_FIELDS):
     """
-    Analyze a single CSV file to extract relevant building information.
+    Return {field: Details} for the first row matching each field's pattern.
+
+    The CSV is streamed row by row and reading stops as soon as every field
+    has been found. Fields that never match are left out.
     """
+    found = {}
+    with open(file_path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        missing = {"Subcategory", "Details"} - set(reader.fieldnames or ())
+        if missing:
+            raise KeyError(", ".join(sorted(missing)))
+        pending = dict(fields)
+        for row in reader:
+            subcategory = row["Subcategory"] or ""
+            for field, pattern in list(pending.items()):
+                if pattern in subcategory:
+                    found[field] = row["Details"]
+                    del pending[field]
+            if not pending:
+                break
+    return found
+
+
+def parse_count(value):
+    """Convert a Details count such as '3' or '3.0' to an integer."""
     try:
-        print(f"Debug: Reading CSV file {file_path}")
-        df = pd.read_csv(file_path)
-        print("Debug: CSV read successfully. Data preview:")
-        print(df.head())  # Print the first few rows for debugging
-
-        # Safely parse building area and number of floors
-        try:
-            building_area_row = df.loc[
-                df["Subcategory"].str.contains("Building Area", na=False)
-            ]
-            building_area_str = (
-                building_area_row["Details"].values[0]
-                if not building_area_row.empty
-                else "Not available"
-            )
-        except Exception as e:
-            print(f"Debug: Failed to parse Building Area - {e}")
-            building_area_str = "Not available"
+        return int(value)
+    except ValueError:
+        return int(float(value))
 
-        try:
-            num_floors_row = df.loc[
-                df["Subcategory"].str.contains("Number of Floors", na=False)
-            ]
-            num_floors_str = (
-                num_floors_row["Details"].values[0]
-                if not num_floors_row.empty
-                else "Not available"
-            )
-        except Exception as e:
-            print(f"Debug: Failed to parse Number of Floors - {e}")
-            num_floors_str = "Not available"
 
-        # Parse the extracted values
-        floor_area = parse_building_area(building_area_str)
-        num_floors = parse_number_of_floors(num_floors_str)
+def analyze_csv(file_path):
+    """
+    Analyze a single CSV file to extract relevant building information.
+    """
+    try:
+        details = read_csv_fields(file_path)
 
-        print(f"Debug: Parsed floor area: {floor_area}, number of floors: {num_floors}")
+        floor_area = parse_building_area(details.get("building_area", "Not available"))
+        num_floors = parse_number_of_floors(details.get("num_floors", "Not available"))
 
         # Extract AHU and equipment data
-        total_ahu_row = df.loc[df["Subcategory"].str.contains("Total AHUs", na=False)]
-        total_ahu_count = (
-            int(total_ahu_row["Details"].values[0]) if not total_ahu_row.empty else 0
-        )
-
-        vav_row = df.loc[
-            df["Subcategory"].str.contains("Variable Air Volume AHUs", na=False)
-        ]
-        vav_count = int(vav_row["Details"].values[0]) if not vav_row.empty else 0
-
-        cv_row = df.loc[
-            df["Subcategory"].str.contains("Constant Volume AHUs", na=False)
-        ]
-        cv_count = int(cv_row["Details"].values[0]) if not cv_row.empty else 0
-
-        # Equipment counts (e.g., Cooling Coils, Supply Fans)
-        cooling_coils_row = df.loc[
-            df["Subcategory"].str.contains("AHUs with Cooling Coil", na=False)
-        ]
-        cooling_coils_count = (
-            int(cooling_coils_row["Details"].values[0])
-            if not cooling_coils_row.empty
-            else 0
-        )
+        counts = {
+            field: parse_count(details[field]) if field in details else 0
+            for field in (
+                "total_ahu_count",
+                "vav_count",
+                "cv_count",
+                "cooling_coils_count",
+            )
+        }
 
         # Construct summary
-        summary = {
+        return {
             "filename": os.path.basename(file_path),
             "floor_area": floor_area,
             "num_floors": num_floors,
-            "total_ahu_count": total_ahu_count,
-            "vav_count": vav_count,
-            "cv_count": cv_count,
+            "total_ahu_count": counts["total_ahu_count"],
+            "vav_count": counts["vav_count"],
+            "cv_count": counts["cv_count"],
             "equipment_counts": {
-                "Cooling Coils": cooling_coils_count,
+                "Cooling Coils": counts["cooling_coils_count"],
                 "Heating Coils": 0,  # Add logic for heating coils if necessary
                 "Supply Fans": 0,  # Add logic for supply fans if necessary
                 "Return Fans": 0,  # Add logic for return fans if necessary
             },
         }
 
-        print(f"Debug: Extracted summary: {summary}")
-        return summary
-
     except Exception as e:
         print(f"Error reading CSV {file_path}: {e}")
         return None
 
 
+# Building types, first match wins; bands are inclusive
+BUILDING_TYPES = [
+    {
+        "name": "Large Office",
+        "min_area": 498588,
+        "max_area": float("inf"),
+        "min_floors": 12,
+        "max_floors": float("inf"),
+    },
+    {
+        "name": "Medium Office",
+        "min_area": 53628,
+        "max_area": 498587,
+        "min_floors": 3,
+        "max_floors": 11,
+    },
+    {
+        "name": "Small Office",
+        "min_area": 0,
+        "max_area": 53627,
+        "min_floors": 1,
+        "max_floors": 2,
+    },
+    # Add other building types here
+]
+UNKNOWN_BUILDING_TYPE = "Unknown Building Type"
+
+# Equipment ECMs: (summary field, threshold, ECM suggested above the threshold)
+EQUIPMENT_ECM_RULES = [
+    (
+        "vav_count",
+        0,
+        "Implement Demand Control Ventilation (DCV) for VAV systems.",
+    ),
+    (
+        "cv_count",
+        0,
+        "Convert CV systems to VAV systems for better efficiency.",
+    ),
+    (
+        "equipment_counts.Cooling Coils",
+        5,
+        "Optimize cooling coil operation during low-load periods.",
+    ),
+    (
+        "equipment_counts.Supply Fans",
+        5,
+        "Add variable frequency drives (VFDs) to supply fans.",
+    ),
+]
+
+OFFICE_ECMS = [
+    "Implement load-based staging of RTUs to minimize energy demand during low-occupancy periods.",
+    "Adjust thermostat setpoints to align cooling schedules with office hours.",
+    "Operate economizers to leverage outdoor air for free cooling when conditions permit.",
+]
+SCHOOL_ECMS = [
+    "Adjust ventilation rates based on occupancy using Demand Control Ventilation (DCV).",
+    "Implement seasonal cooling and heating setpoints to match school schedules, reducing unnecessary runtime.",
+    "Utilize economizer modes to minimize mechanical cooling when outdoor conditions are favorable.",
+]
+HEALTH_CARE_ECMS = [
+    "Optimize chilled water temperatures based on ambient conditions to improve chiller COP.",
+    "Employ Variable-Speed Drives (VSDs) for pumps and fans to match HVAC operation with real-time demand.",
+    "Use predictive maintenance and BAS data to avoid running equipment at unnecessarily high capacities.",
+]
+HOTEL_ECMS = [
+    "Adjust room temperature setpoints based on occupancy data to minimize energy use.",
+    "Reclaim waste heat from chillers to produce domestic hot water efficiently.",
+    "Participate in demand response programs by pre-conditioning spaces before peak hours.",
+]
+
+# Building type ECMs, suggested after the equipment ECMs
+BUILDING_TYPE_ECMS = {
+    "Small Office": OFFICE_ECMS,
+    "Medium Office": OFFICE_ECMS
+    + [
+        "Optimize HVAC scheduling to match occupancy levels.",
+        "Upgrade BAS to improve zoning and control.",
+    ],
+    "Large Office": [
+        "Optimize chilled water and condenser water temperatures to match cooling loads while maintaining efficiency.",
+        "Equip chillers, pumps, and cooling towers with Variable Frequency Drives (VFDs) to modulate speed based on demand.",
+        "Use demand-based staging to balance chiller loads, preventing unnecessary energy use and extending equipment life.",
+    ],
+    "Retail (Stand-alone or Strip Mall)": [
+        "Schedule HVAC operation to coincide with business hours, reducing energy consumption during off-hours.",
+        "Implement occupancy sensors to adjust temperature dynamically based on foot traffic and occupancy levels.",
+    ],
+    "Primary School": SCHOOL_ECMS,
+    "Secondary School": SCHOOL_ECMS,
+    "Hospital": HEALTH_CARE_ECMS,
+    "Outpatient Health Care": HEALTH_CARE_ECMS,
+    "Small Hotel": HOTEL_ECMS,
+    "Large Hotel": HOTEL_ECMS,
+    "Warehouse (Non-Refrigerated)": [
+        "Use occupancy sensors to control lighting and HVAC systems in warehouse zones.",
+        "Maintain minimal HVAC levels to prevent excessive temperature fluctuations, preserving product quality.",
+    ],
+    "Quick Service & Full Service Restaurants": [
+        "Use heat exchangers on exhaust systems to reclaim energy.",
+        "Optimize ventilation rates based on kitchen activity to balance comfort and energy use.",
+    ],
+    "Apartments (Mid-Rise and High-Rise)": [
+        "Monitor water use for cooling towers to improve efficiency.",
+        "Adjust HVAC operation in common areas based on real-time occupancy data.",
+    ],
+}
+
+OFFICE_KPIS = [
+    "Run Time Reduction: Measure total runtime of HVAC equipment.",
+    "Energy per Occupied Area: Track energy consumption (kWh) relative to building occupancy.",
+]
+SCHOOL_KPIS = [
+    "Ventilation Rate Compliance: Ensure required air changes per hour are met.",
+    "Chiller Efficiency: Monitor energy consumption per ton of cooling to optimize high-demand operations.",
+]
+HEALTH_CARE_KPIS = [
+    "Critical Systems Uptime: Ensure continuous HVAC operation to maintain patient care environments.",
+    "Energy per Bed: Track energy usage efficiency in relation to hospital capacity.",
+    "Thermal Storage Utilization: Measure peak shaving efficiency by storing chilled water during off-peak hours.",
+]
+HOTEL_KPIS = [
+    "Energy per Occupied Room: Align HVAC energy use with room occupancy.",
+    "Guest Comfort Compliance: Maintain preferred temperature and humidity ranges in guest areas.",
+    "COP and Load Tracking: Monitor and optimize chiller performance.",
+]
+
+BUILDING_TYPE_KPIS = {
+    "Small Office": OFFICE_KPIS,
+    "Medium Office": OFFICE_KPIS,
+    "Large Office": [
+        "Energy Use Intensity (EUI): Calculate kWh per square foot of building space.",
+        "Peak Demand Reduction: Reduce peak power during occupied hours.",
+        "Chiller Plant Coefficient of Performance (COP): Monitor chiller efficiency through load and water temperature adjustments.",
+    ],
+    "Retail (Stand-alone or Strip Mall)": [
+        "Revenue per kWh: Assess energy efficiency in terms of sales generated per unit of energy consumed.",
+        "Lighting and HVAC Energy Monitoring: Measure separately to optimize systems for different store types.",
+    ],
+    "Primary School": SCHOOL_KPIS,
+    "Secondary School": SCHOOL_KPIS,
+    "Hospital": HEALTH_CARE_KPIS,
+    "Outpatient Health Care": HEALTH_CARE_KPIS,
+    "Small Hotel": HOTEL_KPIS,
+    "Large Hotel": HOTEL_KPIS,
+    "Warehouse (Non-Refrigerated)": [
+        "Lighting Utilization Efficiency: Reduce lighting energy through smart controls.",
+        "Temperature Compliance: Ensure storage conditions meet product requirements.",
+    ],
+    "Quick Service & Full Service Restaurants": [
+        "Utility Cost per Meal: Calculate HVAC and water costs per meal served.",
+        "Ventilation Efficacy: Monitor energy use against peak occupancy levels.",
+    ],
+    "Apartments (Mid-Rise and High-Rise)": [
+        "Energy per Occupied Unit: Measure energy use efficiency at the tenant level.",
+        "Water Usage per Unit: Track water conservation metrics for cooling and domestic purposes.",
+    ],
+}
+
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
 def determine_building_type(summary):
     """
     Determine the building type based on floor area and number of floors.
     """
-    # Sample data for building type determination
-    building_types = [
-        {
-            "name": "Large Office",
-            "min_area": 498588,
-            "max_area": float("inf"),
-            "min_floors": 12,
-            "max_floors": float("inf"),
-        },
-        {
-            "name": "Medium Office",
-            "min_area": 53628,
-            "max_area": 498587,
-            "min_floors": 3,
-            "max_floors": 11,
-        },
-        {
-            "name": "Small Office",
-            "min_area": 0,
-            "max_area": 53627,
-            "min_floors": 1,
-            "max_floors": 2,
-        },
-        # Add other building types here
-    ]
-
-    # Retrieve building floor area and number of floors from summary
-    try:
-        floor_area = int(
-            summary.get("floor_area", 0)
-        )  # Ensure this value is an integer
-    except ValueError:
-        floor_area = 0
-
-    try:
-        num_floors = int(
-            summary.get("num_floors", 0)
-        )  # Ensure this value is an integer
-    except ValueError:
-        num_floors = 0
+    floor_area = _as_int(summary.get("floor_area", 0))
+    num_floors = _as_int(summary.get("num_floors", 0))
 
-    # Determine the building type
-    for building in building_types:
+    for building in BUILDING_TYPES:
         if (
             building["min_area"] <= floor_area <= building["max_area"]
             and building["min_floors"] <= num_floors <= building["max_floors"]
         ):
             return building["name"]
 
-    return "Unknown Building Type"
+    return UNKNOWN_BUILDING_TYPE
+
+
+def _summary_value(summary, field):
+    """Look up a field, reading "parent.child" fields from nested dicts."""
+    if "." in field:
+        parent, child = field.split(".", 1)
+        return summary.get(parent, {}).get(child, 0)
+    return summary[field]
 
 
 def suggest_ecms(summary):
     """
     Suggest Energy Conservation Measures (ECMs) based on the summary.
     """
-    ecms = []
-
-    # Equipment-specific ECMs
-    if summary["vav_count"] > 0:
-        ecms.append("Implement Demand Control Ventilation (DCV) for VAV systems.")
-    if summary["cv_count"] > 0:
-        ecms.append("Convert CV systems to VAV systems for better efficiency.")
-    if summary["equipment_counts"].get("Cooling Coils", 0) > 5:
-        ecms.append("Optimize cooling coil operation during low-load periods.")
-    if summary["equipment_counts"].get("Supply Fans", 0) > 5:
-        ecms.append("Add variable frequency drives (VFDs) to supply fans.")
-
-    # Building type-specific ECMs
-    building_type = determine_building_type(summary)
-    if building_type in ["Small Office", "Medium Office"]:
-        ecms.extend(
-            [
-                "Implement load-based staging of RTUs to minimize energy demand during low-occupancy periods.",
-                "Adjust thermostat setpoints to align cooling schedules with office hours.",
-                "Operate economizers to leverage outdoor air for free cooling when conditions permit.",
-            ]
-        )
-    if building_type == "Medium Office":
-        ecms.extend(
-            [
-                "Optimize HVAC scheduling to match occupancy levels.",
-                "Upgrade BAS to improve zoning and control.",
-            ]
-        )
-    elif building_type == "Large Office":
-        ecms.extend(
-            [
-                "Optimize chilled water and condenser water temperatures to match cooling loads while maintaining efficiency.",
-                "Equip chillers, pumps, and cooling towers with Variable Frequency Drives (VFDs) to modulate speed based on demand.",
-                "Use demand-based staging to balance chiller loads, preventing unnecessary energy use and extending equipment life.",
-            ]
-        )
-    elif building_type == "Retail (Stand-alone or Strip Mall)":
-        ecms.extend(
-            [
-                "Schedule HVAC operation to coincide with business hours, reducing energy consumption during off-hours.",
-                "Implement occupancy sensors to adjust temperature dynamically based on foot traffic and occupancy levels.",
-            ]
-        )
-    elif building_type in ["Primary School", "Secondary School"]:
-        ecms.extend(
-            [
-                "Adjust ventilation rates based on occupancy using Demand Control Ventilation (DCV).",
-                "Implement seasonal cooling and heating setpoints to match school schedules, reducing unnecessary runtime.",
-                "Utilize economizer modes to minimize mechanical cooling when outdoor conditions are favorable.",
-            ]
-        )
-    elif building_type in ["Hospital", "Outpatient Health Care"]:
-        ecms.extend(
-            [
-                "Optimize chilled water temperatures based on ambient conditions to improve chiller COP.",
-                "Employ Variable-Speed Drives (VSDs) for pumps and fans to match HVAC operation with real-time demand.",
-                "Use predictive maintenance and BAS data to avoid running equipment at unnecessarily high capacities.",
-            ]
-        )
-    elif building_type in ["Small Hotel", "Large Hotel"]:
-        ecms.extend(
-            [
-                "Adjust room temperature setpoints based on occupancy data to minimize energy use.",
-                "Reclaim waste heat from chillers to produce domestic hot water efficiently.",
-                "Participate in demand response programs by pre-conditioning spaces before peak hours.",
-            ]
-        )
-    elif building_type == "Warehouse (Non-Refrigerated)":
-        ecms.extend(
-            [
-                "Use occupancy sensors to control lighting and HVAC systems in warehouse zones.",
-                "Maintain minimal HVAC levels to prevent excessive temperature fluctuations, preserving product quality.",
-            ]
-        )
-    elif building_type == "Quick Service & Full Service Restaurants":
-        ecms.extend(
-            [
-                "Use heat exchangers on exhaust systems to reclaim energy.",
-                "Optimize ventilation rates based on kitchen activity to balance comfort and energy use.",
-            ]
-        )
-    elif building_type == "Apartments (Mid-Rise and High-Rise)":
-        ecms.extend(
-            [
-                "Monitor water use for cooling towers to improve efficiency.",
-                "Adjust HVAC operation in common areas based on real-time occupancy data.",
-            ]
-        )
-
+    ecms = [
+        ecm
+        for field, threshold, ecm in EQUIPMENT_ECM_RULES
+        if _summary_value(summary, field) > threshold
+    ]
+    ecms.extend(BUILDING_TYPE_ECMS.get(determine_building_type(summary), []))
     return ecms
 
 
@@ -272,102 +321,131 @@ def suggest_kpis(building_type):
     """
     Suggest Key Performance Indicators (KPIs) based on the building type.
     """
-    kpis = []
-
-    if building_type in ["Small Office", "Medium Office"]:
-        kpis.extend(
-            [
-                "Run Time Reduction: Measure total runtime of HVAC equipment.",
-                "Energy per Occupied Area: Track energy consumption (kWh) relative to building occupancy.",
-            ]
-        )
-    elif building_type == "Large Office":
-        kpis.extend(
-            [
-                "Energy Use Intensity (EUI): Calculate kWh per square foot of building space.",
-                "Peak Demand Reduction: Reduce peak power during occupied hours.",
-                "Chiller Plant Coefficient of Performance (COP): Monitor chiller efficiency through load and water temperature adjustments.",
-            ]
-        )
-    elif building_type == "Retail (Stand-alone or Strip Mall)":
-        kpis.extend(
-            [
-                "Revenue per kWh: Assess energy efficiency in terms of sales generated per unit of energy consumed.",
-                "Lighting and HVAC Energy Monitoring: Measure separately to optimize systems for different store types.",
-            ]
-        )
-    elif building_type in ["Primary School", "Secondary School"]:
-        kpis.extend(
-            [
-                "Ventilation Rate Compliance: Ensure required air changes per hour are met.",
-                "Chiller Efficiency: Monitor energy consumption per ton of cooling to optimize high-demand operations.",
-            ]
-        )
-    elif building_type in ["Hospital", "Outpatient Health Care"]:
-        kpis.extend(
-            [
-                "Critical Systems Uptime: Ensure continuous HVAC operation to maintain patient care environments.",
-                "Energy per Bed: Track energy usage efficiency in relation to hospital capacity.",
-                "Thermal Storage Utilization: Measure peak shaving efficiency by storing chilled water during off-peak hours.",
-            ]
-        )
-    elif building_type in ["Small Hotel", "Large Hotel"]:
-        kpis.extend(
-            [
-                "Energy per Occupied Room: Align HVAC energy use with room occupancy.",
-                "Guest Comfort Compliance: Maintain preferred temperature and humidity ranges in guest areas.",
-                "COP and Load Tracking: Monitor and optimize chiller performance.",
-            ]
-        )
-    elif building_type == "Warehouse (Non-Refrigerated)":
-        kpis.extend(
-            [
-                "Lighting Utilization Efficiency: Reduce lighting energy through smart controls.",
-                "Temperature Compliance: Ensure storage conditions meet product requirements.",
-            ]
-        )
-    elif building_type == "Quick Service & Full Service Restaurants":
-        kpis.extend(
-            [
-                "Utility Cost per Meal: Calculate HVAC and water costs per meal served.",
-                "Ventilation Efficacy: Monitor energy use against peak occupancy levels.",
-            ]
-        )
-    elif building_type == "Apartments (Mid-Rise and High-Rise)":
-        kpis.extend(
-            [
-                "Energy per Occupied Unit: Measure energy use efficiency at the tenant level.",
-                "Water Usage per Unit: Track water conservation metrics for cooling and domestic purposes.",
-            ]
+    return list(BUILDING_TYPE_KPIS.get(building_type, []))
+
+
+def summaries_to_frame(summaries):
+    """Flatten analyze_csv summaries into a DataFrame, one row per building."""
+    import pandas as pd
+
+    return pd.json_normalize(list(summaries))
+
+
+def _numeric_column(frame, column):
+    import pandas as pd
+
+    if column not in frame:
+        return np.zeros(len(frame))
+    values = pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=float)
+    return np.nan_to_num(values, nan=0.0)
+
+
+def classify_buildings(frame):
+    """
+    Apply the building type, ECM and KPI rules to a DataFrame of summaries.
+
+    frame has one row per building with the analyze_csv fields as columns,
+    nested fields flattened as "equipment_counts.Cooling Coils" (see
+    summaries_to_frame). Every rule is evaluated as a mask over all rows at
+    once, and the ECM and KPI lists are built once per distinct combination
+    of matched rules rather than once per building. Returns a DataFrame with
+    the same index and the matched_building_type, ecms and kpis columns.
+    """
+    import pandas as pd
+
+    rows = len(frame)
+    # Truncate like int() and treat unparsable values as 0
+    floor_area = np.trunc(_numeric_column(frame, "floor_area"))
+    num_floors = np.trunc(_numeric_column(frame, "num_floors"))
+
+    # Index into BUILDING_TYPES, len(BUILDING_TYPES) meaning unknown;
+    # rules are applied last to first so the first match wins
+    type_index = np.full(rows, len(BUILDING_TYPES))
+    for position in range(len(BUILDING_TYPES) - 1, -1, -1):
+        building = BUILDING_TYPES[position]
+        match = (
+            (floor_area >= building["min_area"])
+            & (floor_area <= building["max_area"])
+            & (num_floors >= building["min_floors"])
+            & (num_floors <= building["max_floors"])
         )
+        type_index[match] = position
+    type_names = np.array(
+        [building["name"] for building in BUILDING_TYPES] + [UNKNOWN_BUILDING_TYPE],
+        dtype=object,
+    )
+
+    # One bit per equipment rule, then one key per rule/type combination
+    rule_bits = np.zeros(rows, dtype=np.int64)
+    for bit, (field, threshold, _) in enumerate(EQUIPMENT_ECM_RULES):
+        matched = _numeric_column(frame, field) > threshold
+        rule_bits |= matched.astype(np.int64) << bit
+    keys = rule_bits * len(type_names) + type_index
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+
+    ecm_lists = []
+    kpi_lists = []
+    for key in unique_keys:
+        bits, position = divmod(int(key), len(type_names))
+        building_type = type_names[position]
+        ecms = [
+            ecm
+            for bit, (_, _, ecm) in enumerate(EQUIPMENT_ECM_RULES)
+            if bits >> bit & 1
+        ]
+        ecms.extend(BUILDING_TYPE_ECMS.get(building_type, []))
+        ecm_lists.append(ecms)
+        kpi_lists.append(suggest_kpis(building_type))
 
-    return kpis
+    def expand(lists):
+        # Copy per row so callers can edit one building's list
+        return [list(lists[i]) for i in inverse]
+
+    return pd.DataFrame(
+        {
+            "matched_building_type": type_names[type_index],
+            "ecms": expand(ecm_lists),
+            "kpis": expand(kpi_lists),
+        },
+        index=frame.index,
+    )
+
+
+def analyze_building(csv_file):
+    """Analyze one CSV and add its matched building type and suggested ECMs."""
+    summary = analyze_csv(csv_file)
+    if summary:
+        summary["matched_building_type"] = determine_building_type(summary)
+        summary["ecms"] = suggest_ecms(summary)
+    return summary
 
 
-def process_all_csvs(directory):
+def process_all_csvs(directory, workers=None, chunksize=16):
     """
     Process all CSV files in the specified directory.
+
+    Files are analyzed in a process pool of `workers` processes (workers=1
+    runs in-process). Summaries come back in directory order, files that
+    could not be read are left out.
     """
     csv_files = [
         os.path.join(directory, f) for f in os.listdir(directory) if f.endswith(".csv")
     ]
-    all_summaries = []
+    if workers == 1 or len(csv_files) <= 1:
+        summaries = map(analyze_building, csv_files)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            summaries = list(
+                executor.map(analyze_building, csv_files, chunksize=chunksize)
+            )
 
-    for csv_file in csv_files:
+    all_summaries = []
+    for csv_file, summary in zip(csv_files, summaries):
         print(f"Processing CSV: {csv_file}")
-        summary = analyze_csv(csv_file)
-
         if summary:
-            # Determine building type
-            building_type = determine_building_type(summary)
-            summary["matched_building_type"] = building_type
-            print(f"Detected Building Type: {building_type}")
-
-            # Suggest ECMs
-            ecms = suggest_ecms(summary)
-            summary["ecms"] = ecms
+            print(f"Detected Building Type: {summary['matched_building_type']}")
             print("Suggested ECMs:")
-            for ecm in ecms:
+            for ecm in summary["ecms"]:
                 print(f" - {ecm}")
 
             all_summaries.append(summary)
@@ -0,0 +1,418 @@
+import argparse
+import glob
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from brick_model_summarizer.version import __version__
+from brick_model_summarizer.graph_cache import file_content_hash
+from brick_model_summarizer.graph_index import guess_format, load_graph_index
+from brick_model_summarizer.match_cache import set_default_match_cache
+from brick_model_summarizer.summary import summarize_model
+
+
+MODEL_EXTENSIONS = (".ttl", ".nt")
+MANIFEST_SUFFIX = ".manifest"
+# Bump when the layout of the incremental state file changes.
+STATE_FORMAT_VERSION = 1
+JOURNAL_SUFFIX = ".journal"
+
+
+def find_models(source):
+    """
+    Return the sorted model files for a directory, a glob pattern or a list.
+
+    Directories are searched recursively for .ttl and .nt files.
+    """
+    if isinstance(source, (list, tuple)):
+        return sorted({os.path.abspath(path) for path in source})
+    source = os.fspath(source)
+    if os.path.isdir(source):
+        paths = [
+            os.path.join(root, name)
+            for root, _, names in os.walk(source)
+            for name in names
+            if name.endswith(MODEL_EXTENSIONS)
+        ]
+    else:
+        paths = glob.glob(source, recursive=True)
+    return sorted({os.path.abspath(path) for path in paths if os.path.isfile(path)})
+
+
+def file_fingerprint(model_path):
+    """Return the size, modification time and content hash of a file."""
+    stat = os.stat(model_path)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": file_content_hash(model_path),
+    }
+
+
+def summarize_file(model_path, components=None, fingerprint=False):
+    """
+    Summarize one model file into a JSON-compatible record.
+
+    Failures are reported in the record instead of raised, so one broken
+    model does not stop a batch. With fingerprint=True the record also
+    holds the file_fingerprint taken before the file was parsed, unless the
+    file could not be read.
+    """
+    start = time.perf_counter()
+    record = {"model": model_path}
+    return summarize_into(
+        record, model_path, components, start, fingerprint=fingerprint
+    )
+
+
+def summarize_data(name, data, components=None):
+    """Summarize a model held in memory as bytes, named like its file."""
+    start = time.perf_counter()
+    return summarize_into(
+        {"model": name},
+        io.BytesIO(data),
+        components,
+        start,
+        format=guess_format(name),
+    )
+
+
+def summarize_into(record, source, components, start, format=None, fingerprint=False):
+    """Parse source into an index and add its summary (or error) to record."""
+    try:
+        if fingerprint:
+            record["file"] = file_fingerprint(source)
+        record["summary"] = summarize_model(
+            load_graph_index(source, format), components
+        )
+    except Exception as error:
+        record["error"] = f"{type(error).__name__}: {error}"
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+def _init_worker(match_cache_path):
+    if match_cache_path:
+        set_default_match_cache(match_cache_path)
+
+
+def summarize_files(
+    models, components=None, workers=None, match_cache_path=None, fingerprint=False
+):
+    """
+    Yield the summarize_file record of every model as soon as it finishes.
+
+    Models are summarized in a process pool of `workers` processes;
+    workers=1 runs them in-process, in order.
+    """
+    if workers == 1:
+        _init_worker(match_cache_path)
+        for model in models:
+            yield summarize_file(model, components, fingerprint)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(match_cache_path,),
+    ) as executor:
+        futures = [
+            executor.submit(summarize_file, model, components, fingerprint)
+            for model in models
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def read_manifest(manifest_path):
+    """Return {model: status} for every model recorded in a manifest."""
+    done = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as file:
+            for line in file:
+                if line.endswith("\n"):
+                    entry = json.loads(line)
+                    done[entry["model"]] = entry["status"]
+    return done
+
+
+def _recover_output(output_path, manifest_path, done):
+    """
+    Reconcile the output with the manifest after an interrupted run.
+
+    A partially written last line is cut off, and models whose result line
+    was written but not yet checkpointed are added to the manifest.
+    """
+    if not os.path.exists(output_path):
+        return
+    with open(output_path, "rb+") as file:
+        data = file.read()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            file.truncate(complete)
+    with open(manifest_path, "a", encoding="utf-8") as manifest:
+        for line in data[:complete].splitlines():
+            record = json.loads(line)
+            if record["model"] not in done:
+                status = "error" if "error" in record else "ok"
+                done[record["model"]] = status
+                manifest.write(json.dumps({"model": record["model"], "status": status}))
+                manifest.write("\n")
+
+
+def summarize_portfolio(
+    source,
+    output_path,
+    workers=None,
+    components=None,
+    manifest_path=None,
+    retry_failed=False,
+    match_cache_path=None,
+):
+    """
+    Summarize every model in source and stream one JSON line per model.
+
+    Models are summarized in a process pool of `workers` processes
+    (workers=1 runs in-process) and each record is appended to output_path
+    as soon as it finishes. The manifest (output_path + ".manifest" by
+    default) checkpoints every finished model, so rerunning the same call
+    after an interruption skips the models already done. Failed models are
+    skipped too unless retry_failed is True. A match_cache_path shares one
+    fuzzy-match cache between all workers.
+
+    Returns counts of the models found, skipped, summarized and failed.
+    """
+    output_path = os.fspath(output_path)
+    manifest_path = manifest_path or output_path + MANIFEST_SUFFIX
+    models = find_models(source)
+
+    done = read_manifest(manifest_path)
+    _recover_output(output_path, manifest_path, done)
+    pending = [
+        model
+        for model in models
+        if model not in done or (retry_failed and done[model] == "error")
+    ]
+    stats = {
+        "models": len(models),
+        "skipped": len(models) - len(pending),
+        "summarized": 0,
+        "failed": 0,
+    }
+
+    with open(output_path, "a", encoding="utf-8") as output, open(
+        manifest_path, "a", encoding="utf-8"
+    ) as manifest:
+
+        def write(record):
+            status = "error" if "error" in record else "ok"
+            stats["failed" if status == "error" else "summarized"] += 1
+            # Result first, then the checkpoint, so a crash in between is
+            # repaired by _recover_output instead of losing the result
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+            manifest.write(json.dumps({"model": record["model"], "status": status}))
+            manifest.write("\n")
+            manifest.flush()
+
+        for record in summarize_files(pending, components, workers, match_cache_path):
+            write(record)
+    return stats
+
+
+def load_state(state_path):
+    """
+    Return the incremental state saved at state_path, or an empty state.
+
+    Entries checkpointed to the journal by an interrupted run are replayed
+    on top of the saved state.
+    """
+    state = None
+    if os.path.exists(state_path):
+        with open(state_path, encoding="utf-8") as file:
+            state = json.load(file)
+    if state is None or state.get("format") != STATE_FORMAT_VERSION:
+        state = {"format": STATE_FORMAT_VERSION, "models": {}}
+    journal_path = state_path + JOURNAL_SUFFIX
+    if os.path.exists(journal_path):
+        with open(journal_path, encoding="utf-8") as file:
+            for line in file:
+                if line.endswith("\n"):
+                    update = json.loads(line)
+                    state["models"][update["model"]] = update["entry"]
+    return state
+
+
+def _write_atomic(path, lines):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.writelines(lines)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def save_state(state, state_path):
+    """Write the incremental state atomically and drop its journal."""
+    _write_atomic(state_path, [json.dumps(state)])
+    journal_path = state_path + JOURNAL_SUFFIX
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+
+
+def _is_unchanged(model, entry, components, retry_failed=False):
+    """Return True if entry still describes model, refreshing its mtime."""
+    if entry is None or entry["file"] is None:
+        return False
+    if retry_failed and "error" in entry["record"]:
+        return False
+    if entry["package"] != __version__ or entry["components"] != components:
+        return False
+    try:
+        stat = os.stat(model)
+        if entry["file"]["size"] != stat.st_size:
+            return False
+        if entry["file"]["mtime_ns"] == stat.st_mtime_ns:
+            return True
+        # Touched but maybe not modified: compare contents
+        if file_content_hash(model) != entry["file"]["sha256"]:
+            return False
+    except OSError:
+        # Gone or unreadable: let the summary record the error
+        return False
+    entry["file"]["mtime_ns"] = stat.st_mtime_ns
+    return True
+
+
+def summarize_incremental(
+    source,
+    state_path,
+    output_path=None,
+    workers=None,
+    components=None,
+    retry_failed=False,
+    match_cache_path=None,
+):
+    """
+    Summarize only the models in source that are new or changed since last run.
+
+    The state file keeps, for every model, its size, modification time,
+    content hash, the package version and components it was summarized with,
+    and its last record. Files whose size and mtime are unchanged are
+    skipped without being read; files that were only touched are hashed and
+    skipped if their content is the same. Models whose last run failed are
+    also skipped until they change, unless retry_failed is True. Everything
+    else is summarized in a process pool, and models that no longer exist
+    are dropped. New records are appended to a journal next to the state
+    file as they arrive, so an interrupted run keeps its progress, and the
+    state file itself is rewritten once at the end of the run.
+
+    When output_path is given, a JSON Lines snapshot with the current record
+    of every model is written there. Returns counts of the models found,
+    unchanged, summarized, failed and removed.
+    """
+    state_path = os.fspath(state_path)
+    models = find_models(source)
+    state = load_state(state_path)
+    entries = state["models"]
+
+    removed = set(entries) - set(models)
+    for model in removed:
+        del entries[model]
+    pending = [
+        model
+        for model in models
+        if not _is_unchanged(model, entries.get(model), components, retry_failed)
+    ]
+    stats = {
+        "models": len(models),
+        "unchanged": len(models) - len(pending),
+        "summarized": 0,
+        "failed": 0,
+        "removed": len(removed),
+    }
+
+    try:
+        records = summarize_files(
+            pending, components, workers, match_cache_path, fingerprint=True
+        )
+        with open(state_path + JOURNAL_SUFFIX, "a", encoding="utf-8") as journal:
+            for record in records:
+                stats["failed" if "error" in record else "summarized"] += 1
+                entry = {
+                    "file": record.pop("file", None),
+                    "package": __version__,
+                    "components": components,
+                    "record": record,
+                }
+                entries[record["model"]] = entry
+                journal.write(json.dumps({"model": record["model"], "entry": entry}))
+                journal.write("\n")
+                journal.flush()
+    finally:
+        save_state(state, state_path)
+
+    if output_path is not None:
+        _write_atomic(
+            output_path,
+            [json.dumps(entries[model]["record"]) + "\n" for model in models],
+        )
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Summarize a portfolio of Brick models into a JSON Lines file."
+    )
+    parser.add_argument("source", help="directory or glob pattern of .ttl/.nt models")
+    parser.add_argument("-o", "--output", required=True, help="JSON Lines output file")
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument(
+        "-c", "--component", action="append", dest="components", default=None
+    )
+    parser.add_argument("--manifest", default=None)
+    parser.add_argument("--retry-failed", action="store_true")
+    parser.add_argument("--match-cache", default=None)
+    parser.add_argument(
+        "--state",
+        default=None,
+        help="incremental mode: only summarize models changed since the run "
+        "that wrote this state file, then write every model's record to --output",
+    )
+    args = parser.parse_args(argv)
+
+    if args.state:
+        stats = summarize_incremental(
+            args.source,
+            args.state,
+            output_path=args.output,
+            workers=args.workers,
+            components=args.components,
+            retry_failed=args.retry_failed,
+            match_cache_path=args.match_cache,
+        )
+        print(json.dumps(stats), file=sys.stderr)
+        return
+
+    stats = summarize_portfolio(
+        args.source,
+        args.output,
+        workers=args.workers,
+        components=args.components,
+        manifest_path=args.manifest,
+        retry_failed=args.retry_failed,
+        match_cache_path=args.match_cache,
+    )
+    print(json.dumps(stats), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
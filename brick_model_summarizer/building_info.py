@@ -1,81 +1,56 @@
 from brick_model_summarizer.utils import BRICK, UNIT
+from brick_model_summarizer.graph_index import get_graph_index
+from brick_model_summarizer.queries import instrumented
 
 
+@instrumented("building.area")
 def query_building_area(graph):
     """Query the building area in square feet and handle type information."""
-    area_query = """
-    PREFIX brick: <https://brickschema.org/schema/Brick#>
-    PREFIX unit: <https://qudt.org/vocab/unit#>
-    SELECT ?value ?units WHERE {
-        ?building a brick:Building ;
-                  brick:area ?area .
-        ?area brick:hasUnits ?units ;
-              brick:value ?value .
-    }
-    """
-    area_results = graph.query(area_query)
-    for row in area_results:
-        area_value_raw = str(row.value)
-        if "^^" in area_value_raw:
-            area_value = area_value_raw.split("^^")[0]
-        else:
-            area_value = area_value_raw
-
-        try:
-            area_value = int(area_value)
-        except ValueError:
-            pass
-
-        area_units = (
-            "sq ft"
-            if str(row.units) == "http://qudt.org/vocab/unit/FT_2"
-            else str(row.units)
-        )
-        return area_value, area_units
+    index = get_graph_index(graph)
+    for building in index.subjects_of_type(BRICK.Building):
+        for area in index.objects(building, BRICK.area):
+            units = index.objects(area, BRICK.hasUnits)
+            values = index.objects(area, BRICK.value)
+            if not units or not values:
+                continue
+
+            area_value_raw = str(values[0])
+            if "^^" in area_value_raw:
+                area_value = area_value_raw.split("^^")[0]
+            else:
+                area_value = area_value_raw
+
+            try:
+                area_value = int(area_value)
+            except ValueError:
+                pass
+
+            area_units = (
+                "sq ft"
+                if str(units[0]) == "http://qudt.org/vocab/unit/FT_2"
+                else str(units[0])
+            )
+            return area_value, area_units
 
     return None, None
 
 
+@instrumented("building.floors")
 def query_building_floors(graph):
     """Query the number of floors in the building."""
-    floors_query = """
-    PREFIX brick: <https://brickschema.org/schema/Brick#>
-    SELECT (COUNT(DISTINCT ?floor) AS ?floor_count) WHERE {
-        ?floor a brick:Floor .
-    }
-    """
-    floors_results = graph.query(floors_query)
-    for row in floors_results:
-        return int(row.floor_count)
-    return 0
+    return get_graph_index(graph).count(BRICK.Floor)
 
 
+@instrumented("building.hvac_equipment")
 def query_hvac_equipment(graph):
     """Query the number of HVAC equipment in the building."""
-    hvac_query = """
-    PREFIX brick: <https://brickschema.org/schema/Brick#>
-    SELECT (COUNT(DISTINCT ?equipment) AS ?equipment_count) WHERE {
-        ?equipment a brick:HVAC_Equipment .
-    }
-    """
-    hvac_results = graph.query(hvac_query)
-    for row in hvac_results:
-        return int(row.equipment_count)
-    return 0
+    return get_graph_index(graph).count(BRICK.HVAC_Equipment)
 
 
+@instrumented("building.hvac_zones")
 def query_hvac_zones(graph):
     """Query the number of HVAC zones in the building."""
-    hvac_zone_query = """
-    PREFIX brick: <https://brickschema.org/schema/Brick#>
-    SELECT (COUNT(DISTINCT ?zone) AS ?zone_count) WHERE {
-        ?zone a brick:HVAC_Zone .
-    }
-    """
-    hvac_zone_results = graph.query(hvac_zone_query)
-    for row in hvac_zone_results:
-        return int(row.zone_count)
-    return 0
+    return get_graph_index(graph).count(BRICK.HVAC_Zone)
 
 
 def collect_building_data(graph):
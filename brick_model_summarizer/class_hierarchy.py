@@ -0,0 +1,74 @@
+from brick_model_summarizer.graph_index import BaseIndex, get_graph_index
+from brick_model_summarizer.vocabulary import load_brick_vocabulary
+
+
+def load_class_hierarchy():
+    """Return the class hierarchy of the bundled Brick vocabulary."""
+    return load_brick_vocabulary().hierarchy
+
+
+class SubclassAwareIndex(BaseIndex):
+    """
+    Index view that counts instances of a class and all of its subclasses.
+
+    Wraps any BaseIndex; type lookups are expanded through the precomputed
+    class closure with set (or, for CompactTripleStore, array) unions, so no
+    rdfs:subClassOf* property paths are evaluated.
+    """
+
+    def __init__(self, index, hierarchy=None):
+        self.index = index
+        self.hierarchy = hierarchy or load_class_hierarchy()
+
+    def count(self, brick_class):
+        return self.index.count_any(self.hierarchy.descendants(brick_class))
+
+    def counts(self, brick_classes):
+        return [self.count(brick_class) for brick_class in brick_classes]
+
+    def count_any(self, brick_classes):
+        expanded = set()
+        for brick_class in brick_classes:
+            expanded.update(self.hierarchy.descendants(brick_class))
+        return self.index.count_any(expanded)
+
+    def subjects_of_type(self, brick_class):
+        return self.index.subjects_of_types(self.hierarchy.descendants(brick_class))
+
+    def subjects_of_types(self, brick_classes):
+        expanded = set()
+        for brick_class in brick_classes:
+            expanded.update(self.hierarchy.descendants(brick_class))
+        return self.index.subjects_of_types(expanded)
+
+    def types_of(self, subject):
+        return self.index.types_of(subject)
+
+    def is_a(self, subject, brick_class):
+        return not self.hierarchy.descendants(brick_class).isdisjoint(
+            self.index.types_of(subject)
+        )
+
+    def points_of(self, subject):
+        return self.index.points_of(subject)
+
+    def parts_of(self, subject):
+        return self.index.parts_of(subject)
+
+    def objects(self, subject, predicate):
+        return self.index.objects(subject, predicate)
+
+    def subjects_with(self, predicate):
+        return self.index.subjects_with(predicate)
+
+    def classes(self):
+        return self.index.classes()
+
+
+def subclass_aware_index(graph, hierarchy=None):
+    """Return a SubclassAwareIndex over the graph's index."""
+    index = get_graph_index(graph)
+    if isinstance(index, SubclassAwareIndex):
+        return index
+    return SubclassAwareIndex(index, hierarchy)
+
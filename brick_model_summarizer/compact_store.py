@@ -0,0 +1,200 @@
+from array import array
+
+import numpy as np
+from rdflib import Graph
+
+from brick_model_summarizer.utils import BRICK, RDF
+from brick_model_summarizer.graph_index import BaseIndex, IndexingStore, guess_format
+
+
+class CompactStoreBuilder:
+    """Intern terms and collect integer triples while a model is parsed."""
+
+    def __init__(self):
+        self.terms = []
+        self.term_ids = {}
+        self.triples = array("q")
+
+    def intern(self, term):
+        term_id = self.term_ids.get(term)
+        if term_id is None:
+            term_id = len(self.terms)
+            self.term_ids[term] = term_id
+            self.terms.append(term)
+        return term_id
+
+    def add(self, subject, predicate, obj):
+        self.triples.append(self.intern(subject))
+        self.triples.append(self.intern(predicate))
+        self.triples.append(self.intern(obj))
+
+    def build(self):
+        """Return the CompactTripleStore for everything added so far."""
+        triples = np.frombuffer(self.triples, dtype=np.int64).reshape(-1, 3)
+        return CompactTripleStore(self.terms, self.term_ids, triples)
+
+
+class CompactTripleStore(BaseIndex):
+    """
+    Read-only triple store of interned terms and sorted NumPy id columns.
+
+    Every URI, blank node and literal is stored once in a term table and
+    triples are kept as integer ids in two sort orders: SPO for
+    subject+predicate lookups and POS for predicate+object lookups. Lookups
+    are binary searches over those columns, so type counts for many classes
+    are a single vectorized searchsorted call.
+    """
+
+    def __init__(self, terms, term_ids, triples):
+        self.terms = terms
+        self.term_ids = term_ids
+        dtype = np.int32 if len(terms) < np.iinfo(np.int32).max else np.int64
+
+        # np.unique sorts rows lexicographically, which is SPO order
+        triples = np.unique(np.asarray(triples, dtype=np.int64).reshape(-1, 3), axis=0)
+        triples = triples.astype(dtype)
+        self.spo_s = np.ascontiguousarray(triples[:, 0])
+        self.spo_p = np.ascontiguousarray(triples[:, 1])
+        self.spo_o = np.ascontiguousarray(triples[:, 2])
+
+        pos = np.lexsort((triples[:, 0], triples[:, 2], triples[:, 1]))
+        self.pos_p = self.spo_p[pos]
+        self.pos_o = self.spo_o[pos]
+        self.pos_s = self.spo_s[pos]
+
+        self._type_id = term_ids.get(RDF.type, -1)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Build a compact store from every triple in an rdflib graph."""
+        builder = CompactStoreBuilder()
+        for subject, predicate, obj in graph:
+            builder.add(subject, predicate, obj)
+        return builder.build()
+
+    def __len__(self):
+        return len(self.spo_s)
+
+    def nbytes(self):
+        """Bytes held by the id columns, excluding the term table."""
+        return sum(
+            column.nbytes
+            for column in (
+                self.spo_s,
+                self.spo_p,
+                self.spo_o,
+                self.pos_p,
+                self.pos_o,
+                self.pos_s,
+            )
+        )
+
+    def _ids(self, column):
+        terms = self.terms
+        return [terms[term_id] for term_id in column.tolist()]
+
+    @staticmethod
+    def _range(first, second, first_id, second_id=None):
+        """Return the slice of rows matching first_id (and second_id) in a sort order."""
+        lo = np.searchsorted(first, first_id, "left")
+        hi = np.searchsorted(first, first_id, "right")
+        if second_id is None:
+            return lo, hi
+        block = second[lo:hi]
+        return (
+            lo + np.searchsorted(block, second_id, "left"),
+            lo + np.searchsorted(block, second_id, "right"),
+        )
+
+    def subject_ids(self, predicate, obj):
+        """Return the subject ids for a predicate+object pair."""
+        predicate_id = self.term_ids.get(predicate)
+        obj_id = self.term_ids.get(obj)
+        if predicate_id is None or obj_id is None:
+            return self.pos_s[:0]
+        lo, hi = self._range(self.pos_p, self.pos_o, predicate_id, obj_id)
+        return self.pos_s[lo:hi]
+
+    def object_ids(self, subject, predicate):
+        """Return the object ids for a subject+predicate pair."""
+        subject_id = self.term_ids.get(subject)
+        predicate_id = self.term_ids.get(predicate)
+        if subject_id is None or predicate_id is None:
+            return self.spo_o[:0]
+        lo, hi = self._range(self.spo_s, self.spo_p, subject_id, predicate_id)
+        return self.spo_o[lo:hi]
+
+    def count(self, brick_class):
+        return len(self.subject_ids(RDF.type, brick_class))
+
+    def counts(self, brick_classes):
+        """Count subjects of every class with one vectorized search."""
+        class_ids = np.array(
+            [self.term_ids.get(brick_class, -1) for brick_class in brick_classes],
+            dtype=np.int64,
+        )
+        lo, hi = self._range(self.pos_p, None, self._type_id)
+        type_objects = self.pos_o[lo:hi]
+        counts = np.searchsorted(type_objects, class_ids, "right") - np.searchsorted(
+            type_objects, class_ids, "left"
+        )
+        counts[class_ids < 0] = 0
+        return counts.tolist()
+
+    def _type_subject_ids(self, brick_classes):
+        """Return the distinct subject ids typed as any of brick_classes."""
+        blocks = [
+            self.subject_ids(RDF.type, brick_class) for brick_class in brick_classes
+        ]
+        if not blocks:
+            return self.pos_s[:0]
+        return np.unique(np.concatenate(blocks))
+
+    def count_any(self, brick_classes):
+        return len(self._type_subject_ids(brick_classes))
+
+    def subjects_of_type(self, brick_class):
+        return set(self._ids(self.subject_ids(RDF.type, brick_class)))
+
+    def subjects_of_types(self, brick_classes):
+        return set(self._ids(self._type_subject_ids(brick_classes)))
+
+    def types_of(self, subject):
+        return set(self._ids(self.object_ids(subject, RDF.type)))
+
+    def is_a(self, subject, brick_class):
+        class_id = self.term_ids.get(brick_class)
+        if class_id is None:
+            return False
+        types = self.object_ids(subject, RDF.type)
+        position = np.searchsorted(types, class_id)
+        return bool(position < len(types) and types[position] == class_id)
+
+    def points_of(self, subject):
+        return set(self._ids(self.object_ids(subject, BRICK.hasPoint)))
+
+    def parts_of(self, subject):
+        return set(self._ids(self.subject_ids(BRICK.isPartOf, subject)))
+
+    def objects(self, subject, predicate):
+        return self._ids(self.object_ids(subject, predicate))
+
+    def subjects_with(self, predicate):
+        predicate_id = self.term_ids.get(predicate)
+        if predicate_id is None:
+            return []
+        lo, hi = self._range(self.pos_p, None, predicate_id)
+        return self._ids(np.unique(self.pos_s[lo:hi]))
+
+    def classes(self):
+        lo, hi = self._range(self.pos_p, None, self._type_id)
+        return self._ids(np.unique(self.pos_o[lo:hi]))
+
+
+def load_compact_store(file_path, format=None):
+    """Stream a Turtle or N-Triples file straight into a CompactTripleStore."""
+    builder = CompactStoreBuilder()
+    Graph(store=IndexingStore(builder)).parse(
+        file_path, format=format or guess_format(file_path)
+    )
+    return builder.build()
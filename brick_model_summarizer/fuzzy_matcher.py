@@ -0,0 +1,81 @@
+import hashlib
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+import numpy as np
+
+
+class FuzzyMatcher:
+    """
+    Closest-match lookups against a fixed vocabulary, same results as difflib.
+
+    difflib.get_close_matches runs real_quick_ratio, quick_ratio and ratio
+    for every word in the vocabulary. quick_ratio only depends on character
+    counts, so the vocabulary is stored once as a character-count matrix and
+    the quick_ratio of every word is computed with a single vectorized
+    minimum. The expensive SequenceMatcher.ratio then runs only for words
+    whose quick_ratio passes the cutoff and could still beat the best match
+    found so far, and names already in the vocabulary are answered by a set
+    lookup.
+    """
+
+    def __init__(self, vocabulary):
+        self.words = sorted(set(vocabulary))
+        self.members = frozenset(self.words)
+        # Identifies the vocabulary contents, e.g. as a persistent cache key
+        self.fingerprint = hashlib.sha256(
+            "\n".join(self.words).encode("utf-8")
+        ).hexdigest()[:16]
+        alphabet = sorted({char for word in self.words for char in word})
+        self.columns = {char: column for column, char in enumerate(alphabet)}
+        self.char_counts = np.zeros((len(self.words), len(alphabet)), dtype=np.int32)
+        for row, word in enumerate(self.words):
+            for char in word:
+                self.char_counts[row, self.columns[char]] += 1
+        self.lengths = np.array([len(word) for word in self.words], dtype=np.int64)
+
+    def close_matches(self, word, n=3, cutoff=0.6):
+        """Return the same list as difflib.get_close_matches(word, vocabulary, ...)."""
+        if not self.words:
+            return []
+        if word in self.members and n == 1:
+            return [word]
+
+        counts = np.zeros(len(self.columns), dtype=np.int32)
+        for char in word:
+            column = self.columns.get(char)
+            if column is not None:
+                counts[column] += 1
+        total = self.lengths + len(word)
+        common = np.minimum(self.char_counts, counts).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            quick_ratio = np.where(total > 0, 2.0 * common / total, 1.0)
+        candidates = np.flatnonzero(quick_ratio >= cutoff)
+        # Best upper bound first, so the scan can stop once no remaining word
+        # can reach the n-th best ratio found so far (ratio <= quick_ratio).
+        candidates = candidates[np.argsort(-quick_ratio[candidates], kind="stable")]
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(word)
+        scored = []
+        for row in candidates.tolist():
+            if len(scored) >= n and quick_ratio[row] < scored[n - 1][0]:
+                break
+            matcher.set_seq1(self.words[row])
+            score = matcher.ratio()
+            if score >= cutoff:
+                scored.append((score, self.words[row]))
+                scored.sort(reverse=True)
+        return [match for _, match in scored[:n]]
+
+
+@lru_cache(maxsize=8)
+def _cached_matcher(vocabulary):
+    return FuzzyMatcher(vocabulary)
+
+
+def get_fuzzy_matcher(vocabulary):
+    """Return the FuzzyMatcher for a vocabulary, built once per distinct vocabulary."""
+    if isinstance(vocabulary, FuzzyMatcher):
+        return vocabulary
+    return _cached_matcher(frozenset(vocabulary))
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import zlib
+
+import rdflib
+
+from brick_model_summarizer.version import __version__
+
+
+# Bump when the on-disk layout changes so older entries are rebuilt.
+CACHE_FORMAT_VERSION = 1
+CACHE_FILE_SUFFIX = ".graph"
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_content_hash(file_path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def spool_stream(stream, directory=None, suffix=""):
+    """
+    Copy a binary stream to a new temporary file, hashing it on the way.
+
+    The stream is read in HASH_CHUNK_SIZE chunks, so memory use does not
+    depend on its length. Returns (path, SHA-256 hex digest, size); the
+    caller owns the file and must remove it.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    fd, path = tempfile.mkstemp(dir=directory, suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            for chunk in iter(lambda: stream.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+                file.write(chunk)
+                size += len(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path, digest.hexdigest(), size
+
+
+def cache_stamp():
+    """Versions that must match for a cache entry to be reused."""
+    return {
+        "format": CACHE_FORMAT_VERSION,
+        "package": __version__,
+        "rdflib": rdflib.__version__,
+        "pickle": pickle.HIGHEST_PROTOCOL,
+    }
+
+
+class GraphCache:
+    """
+    On-disk cache of parsed graphs keyed by the hash of the source file.
+
+    Each entry is a one-line JSON version stamp followed by the zlib
+    compressed pickle of the graph. Entries whose stamp does not match the
+    running rdflib and package versions are treated as misses and rebuilt.
+    Once the directory grows past max_bytes the least recently used entries
+    are removed.
+
+    Entries are unpickled on load, so the cache directory must only be
+    writable by trusted users.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = os.fspath(cache_dir)
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def path_for(self, content_hash):
+        """Return the path of the cache entry for a content hash."""
+        return os.path.join(self.cache_dir, content_hash + CACHE_FILE_SUFFIX)
+
+    def load(self, content_hash):
+        """Return the cached graph for a content hash, or None on a miss."""
+        path = self.path_for(content_hash)
+        try:
+            with open(path, "rb") as file:
+                stamp = json.loads(file.readline())
+                if stamp != cache_stamp():
+                    graph = None
+                else:
+                    graph = pickle.loads(zlib.decompress(file.read()))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated or otherwise unreadable entry, rebuild it
+            graph = None
+
+        if graph is None:
+            self._remove(path)
+            return None
+
+        # Refresh the modification time so eviction is least recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted by another process after we read it; the graph is fine
+            pass
+        return graph
+
+    def store(self, content_hash, graph):
+        """Write a graph to the cache atomically and enforce the size limit."""
+        payload = zlib.compress(
+            pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL), 1
+        )
+        header = json.dumps(cache_stamp(), sort_keys=True).encode("utf-8") + b"\n"
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(header)
+                file.write(payload)
+            os.replace(tmp_path, self.path_for(content_hash))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+        self.evict()
+
+    def load_or_parse(self, file_path, parse):
+        """Return the cached graph for file_path, parsing and caching on a miss."""
+        content_hash = file_content_hash(file_path)
+        graph = self.load(content_hash)
+        if graph is None:
+            graph = parse(file_path)
+            self.store(content_hash, graph)
+        return graph
+
+    def entries(self):
+        """Return (mtime, size, path) for every cache entry, oldest first."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(CACHE_FILE_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
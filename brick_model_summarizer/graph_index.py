@@ -0,0 +1,278 @@
+import os
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from rdflib import Graph
+from rdflib.store import Store, TripleAddedEvent, TripleRemovedEvent
+from brick_model_summarizer.utils import BRICK, RDF, RDFS
+
+
+GRAPH_INDEX_ATTRIBUTE = "_brick_graph_index"
+MUTATION_COUNTER_ATTRIBUTE = "_brick_mutation_counter"
+
+
+class BaseIndex(ABC):
+    """
+    Read-only lookups the summarizers run against a Brick model.
+
+    GraphIndex keeps them in dictionaries and CompactTripleStore in sorted
+    NumPy columns; get_graph_index returns any BaseIndex unchanged. A
+    backend that leaves out one of the abstract lookups cannot be created.
+    """
+
+    @abstractmethod
+    def count(self, brick_class):
+        """Return the number of distinct subjects typed as brick_class."""
+
+    def counts(self, brick_classes):
+        """Return the number of subjects typed as each of brick_classes."""
+        return [self.count(brick_class) for brick_class in brick_classes]
+
+    def count_any(self, brick_classes):
+        """Return the number of distinct subjects typed as any of brick_classes."""
+        return len(self.subjects_of_types(brick_classes))
+
+    @abstractmethod
+    def subjects_of_type(self, brick_class):
+        """Return the subjects typed as brick_class."""
+
+    def subjects_of_types(self, brick_classes):
+        """Return the subjects typed as any of brick_classes."""
+        subjects = set()
+        for brick_class in brick_classes:
+            subjects.update(self.subjects_of_type(brick_class))
+        return subjects
+
+    @abstractmethod
+    def types_of(self, subject):
+        """Return the classes a subject is typed as."""
+
+    @abstractmethod
+    def is_a(self, subject, brick_class):
+        """Return True if the subject is typed as brick_class."""
+
+    @abstractmethod
+    def points_of(self, subject):
+        """Return the brick:hasPoint objects of a subject."""
+
+    @abstractmethod
+    def parts_of(self, subject):
+        """Return the subjects that are brick:isPartOf the given subject."""
+
+    @abstractmethod
+    def objects(self, subject, predicate):
+        """Return the objects of an indexed predicate for a subject."""
+
+    @abstractmethod
+    def subjects_with(self, predicate):
+        """Return the subjects that have at least one object for a predicate."""
+
+    @abstractmethod
+    def classes(self):
+        """Return every class used as an rdf:type object."""
+
+
+class GraphIndex(BaseIndex):
+    """
+    Lookup tables for the slice of a Brick model the summarizers read.
+
+    The index maps every class to its subjects, every subject to its classes
+    and every equipment to its brick:hasPoint and brick:isPartOf neighbours,
+    so type counts and point lookups are dictionary reads instead of SPARQL
+    evaluations over the whole graph. The objects of the few other predicates
+    the summarizers read (building area, timeseries, labels and tags) are
+    kept per subject as well.
+    """
+
+    def __init__(self):
+        self.subjects_by_class = defaultdict(set)
+        self.classes_by_subject = defaultdict(set)
+        self.points_by_subject = defaultdict(set)
+        self.parents_by_subject = defaultdict(set)
+        self.parts_by_subject = defaultdict(set)
+        self.objects_by_predicate = {
+            predicate: defaultdict(list) for predicate in OBJECT_PREDICATES
+        }
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Build the index with one scan per indexed predicate."""
+        index = cls()
+        for predicate in INDEXED_PREDICATES:
+            for subject, _, obj in graph.triples((None, predicate, None)):
+                index.add(subject, predicate, obj)
+        return index
+
+    def add(self, subject, predicate, obj):
+        """Record a single triple; predicates the index does not use are ignored."""
+        if predicate == RDF.type:
+            self.subjects_by_class[obj].add(subject)
+            self.classes_by_subject[subject].add(obj)
+        elif predicate == BRICK.hasPoint:
+            self.points_by_subject[subject].add(obj)
+        elif predicate == BRICK.isPartOf:
+            self.parents_by_subject[subject].add(obj)
+            self.parts_by_subject[obj].add(subject)
+        elif predicate in self.objects_by_predicate:
+            objects = self.objects_by_predicate[predicate][subject]
+            if obj not in objects:
+                objects.append(obj)
+
+    def merge(self, other):
+        """Add everything recorded in another GraphIndex to this one."""
+        for brick_class, subjects in other.subjects_by_class.items():
+            self.subjects_by_class[brick_class].update(subjects)
+        for subject, classes in other.classes_by_subject.items():
+            self.classes_by_subject[subject].update(classes)
+        for subject, points in other.points_by_subject.items():
+            self.points_by_subject[subject].update(points)
+        for subject, parents in other.parents_by_subject.items():
+            self.parents_by_subject[subject].update(parents)
+        for subject, parts in other.parts_by_subject.items():
+            self.parts_by_subject[subject].update(parts)
+        for predicate, subjects in other.objects_by_predicate.items():
+            merged = self.objects_by_predicate[predicate]
+            for subject, objects in subjects.items():
+                existing = merged[subject]
+                existing.extend(obj for obj in objects if obj not in existing)
+        return self
+
+    def count(self, brick_class):
+        """Return the number of distinct subjects typed as brick_class."""
+        subjects = self.subjects_by_class.get(brick_class)
+        return len(subjects) if subjects else 0
+
+    def subjects_of_type(self, brick_class):
+        """Return the subjects typed as brick_class."""
+        return self.subjects_by_class.get(brick_class, set())
+
+    def types_of(self, subject):
+        """Return the classes a subject is typed as."""
+        return self.classes_by_subject.get(subject, set())
+
+    def is_a(self, subject, brick_class):
+        """Return True if the subject is typed as brick_class."""
+        return brick_class in self.classes_by_subject.get(subject, ())
+
+    def points_of(self, subject):
+        """Return the brick:hasPoint objects of a subject."""
+        return self.points_by_subject.get(subject, set())
+
+    def parts_of(self, subject):
+        """Return the subjects that are brick:isPartOf the given subject."""
+        return self.parts_by_subject.get(subject, set())
+
+    def objects(self, subject, predicate):
+        """Return the objects of an indexed predicate for a subject, in parse order."""
+        return self.objects_by_predicate[predicate].get(subject, [])
+
+    def subjects_with(self, predicate):
+        """Return the subjects that have at least one object for a predicate."""
+        return self.objects_by_predicate[predicate].keys()
+
+    def classes(self):
+        """Return every class used as an rdf:type object."""
+        return self.subjects_by_class.keys()
+
+
+# Predicates whose objects are kept per subject
+OBJECT_PREDICATES = (
+    BRICK.area,
+    BRICK.value,
+    BRICK.hasUnits,
+    BRICK.timeseries,
+    BRICK.hasTimeseriesId,
+    BRICK.tag,
+    RDFS.label,
+)
+
+INDEXED_PREDICATES = (RDF.type, BRICK.hasPoint, BRICK.isPartOf) + OBJECT_PREDICATES
+
+
+class MutationCounter:
+    """Count the triple added and removed events dispatched by an rdflib store."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, event):
+        self.count += 1
+
+
+def graph_version(graph):
+    """
+    Return a token that changes whenever triples are added to or removed from graph.
+
+    A MutationCounter is subscribed to the store's event dispatcher on first
+    use. The in-memory store does not dispatch removal events, so the
+    graph's triple count is part of the token as well.
+    """
+    store = graph.store
+    counter = store.__dict__.get(MUTATION_COUNTER_ATTRIBUTE)
+    if counter is None:
+        counter = MutationCounter()
+        store.dispatcher.subscribe(TripleAddedEvent, counter)
+        store.dispatcher.subscribe(TripleRemovedEvent, counter)
+        setattr(store, MUTATION_COUNTER_ATTRIBUTE, counter)
+    return counter.count, len(graph)
+
+
+def get_graph_index(graph):
+    """
+    Return the GraphIndex for a graph, building it on first use.
+
+    The index is kept on the graph object, so every summarizer working on
+    the same loaded model shares one index, and is rebuilt after the graph
+    is mutated. A GraphIndex or any other BaseIndex passed in directly is
+    returned unchanged.
+    """
+    if isinstance(graph, BaseIndex):
+        return graph
+    version = graph_version(graph)
+    cached = graph.__dict__.get(GRAPH_INDEX_ATTRIBUTE)
+    if cached is None or cached[0] != version:
+        cached = (version, GraphIndex.from_graph(graph))
+        setattr(graph, GRAPH_INDEX_ATTRIBUTE, cached)
+    return cached[1]
+
+
+class IndexingStore(Store):
+    """
+    rdflib store that feeds parsed triples straight into an index.
+
+    The index is any object with an add(subject, predicate, obj) method.
+    Nothing else is kept, so parsing into a Graph backed by this store never
+    materializes the full model.
+    """
+
+    def __init__(self, index):
+        super().__init__()
+        self.index = index
+
+    def add(self, triple, context, quoted=False):
+        self.index.add(*triple)
+
+    def addN(self, quads):
+        for subject, predicate, obj, _ in quads:
+            self.index.add(subject, predicate, obj)
+
+
+def guess_format(file_path):
+    """Return the rdflib parser format for a model file."""
+    name = getattr(file_path, "name", file_path)
+    if isinstance(name, (str, os.PathLike)) and os.fspath(name).endswith(".nt"):
+        return "nt"
+    return "turtle"
+
+
+def load_graph_index(file_path, format=None):
+    """
+    Stream a Turtle or N-Triples file into a GraphIndex without building a Graph.
+
+    Only the triples the summarizers read are kept. The returned index can be
+    passed to every summarizer in place of a graph.
+    """
+    index = GraphIndex()
+    Graph(store=IndexingStore(index)).parse(
+        file_path, format=format or guess_format(file_path)
+    )
+    return index
@@ -0,0 +1,151 @@
+import io
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from brick_model_summarizer.graph_index import guess_format, load_graph_index
+from brick_model_summarizer.summary import summarize_model
+
+
+JOB_STAGES = ("queued", "parsing", "summarizing")
+DEFAULT_JOB_WORKERS = 2
+DEFAULT_JOB_TTL_SECONDS = 60 * 60
+
+
+def _discard(source):
+    """Remove a spooled upload file; in-memory sources need no cleanup."""
+    if isinstance(source, (str, os.PathLike)):
+        try:
+            os.remove(source)
+        except FileNotFoundError:
+            pass
+
+
+class SummaryJobs:
+    """
+    Background parse-and-summarize jobs for uploaded models.
+
+    submit() returns a job ID at once; a thread pool parses the model into
+    a graph index, computes every summary component and stores the summary
+    in results (a MemoryCache or any object with get and put) under
+    the upload's content key. The model is given as bytes or as the path of
+    a spooled upload file, which the job removes once it is parsed. A job
+    moves through queued, parsing and summarizing to done or failed, and
+    status() reports the time spent in each stage. Uploads of content that
+    is already summarized, or already being summarized, reuse that result
+    or job. Finished jobs are forgotten after ttl_seconds.
+    """
+
+    def __init__(
+        self,
+        results,
+        max_workers=DEFAULT_JOB_WORKERS,
+        ttl_seconds=DEFAULT_JOB_TTL_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.results = results
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="summary-job"
+        )
+        self._jobs = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, source, name):
+        """
+        Queue a summary of source and return a job ID.
+
+        source is the model's bytes or the path of a file the job takes
+        over; name is the uploaded file name, used to pick the parser.
+        """
+        with self._lock:
+            self._forget_finished()
+            if key in self._pending:
+                _discard(source)
+                return self._pending[key]
+            job_id = uuid.uuid4().hex
+            job = {
+                "job_id": job_id,
+                "key": key,
+                "status": "queued",
+                "started": {"queued": self.clock()},
+                "finished": None,
+                "error": None,
+            }
+            self._jobs[job_id] = job
+            if self.results.get(key) is not None:
+                job["status"] = "done"
+                job["finished"] = job["started"]["queued"]
+                _discard(source)
+                return job_id
+            self._pending[key] = job_id
+        self._executor.submit(self._run, job, source, name)
+        return job_id
+
+    def _set_status(self, job, status):
+        with self._lock:
+            job["status"] = status
+            if status in JOB_STAGES:
+                job["started"][status] = self.clock()
+            else:
+                job["finished"] = self.clock()
+                del self._pending[job["key"]]
+
+    def _run(self, job, source, name):
+        try:
+            self._set_status(job, "parsing")
+            if isinstance(source, bytes):
+                source = io.BytesIO(source)
+            try:
+                graph = load_graph_index(source, guess_format(name))
+            finally:
+                _discard(source)
+            self._set_status(job, "summarizing")
+            summary = summarize_model(graph)
+            if not self.results.put(job["key"], summary):
+                raise MemoryError("Summary is too large to keep in memory.")
+        except Exception as error:
+            job["error"] = f"{type(error).__name__}: {error}"
+            self._set_status(job, "failed")
+        else:
+            self._set_status(job, "done")
+
+    def _forget_finished(self):
+        if self.ttl_seconds is None:
+            return
+        now = self.clock()
+        for job_id, job in list(self._jobs.items()):
+            if job["finished"] is not None and now - job["finished"] > self.ttl_seconds:
+                del self._jobs[job_id]
+
+    def status(self, job_id):
+        """Return the job's key, status, error and seconds per stage, or None."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            now = self.clock()
+            stages = [stage for stage in JOB_STAGES if stage in job["started"]]
+            ends = [job["started"][stage] for stage in stages[1:]]
+            ends.append(job["finished"] if job["finished"] is not None else now)
+            timings = {
+                stage: round(end - job["started"][stage], 3)
+                for stage, end in zip(stages, ends)
+            }
+            report = {
+                "job_id": job_id,
+                "key": job["key"],
+                "status": job["status"],
+                "timings": timings,
+            }
+            if job["error"]:
+                report["error"] = job["error"]
+            return report
+
+    def shutdown(self, wait=True):
+        """Stop the worker threads once the queued jobs are done."""
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,124 @@
+import os
+import sqlite3
+import threading
+
+
+# SQLite limits the number of parameters in one statement
+LOOKUP_BATCH_SIZE = 500
+
+_default_match_cache = None
+
+
+class MatchCache:
+    """
+    Persistent store of fuzzy-match results shared by every model and process.
+
+    Each row holds the best standard match and its similarity ratio for a
+    custom term, keyed by (term, vocabulary fingerprint, cutoff). Terms with
+    no match above the cutoff are stored too, so they are not searched again.
+    The database uses SQLite's WAL mode, so concurrent batch workers can
+    read while another one writes.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(os.fspath(path))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+
+    def __getstate__(self):
+        # Connections cannot cross process boundaries; reconnect on use
+        state = self.__dict__.copy()
+        state.update(_lock=None, _connection=None, _pid=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._connection is None or self._pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS matches (
+                    term TEXT NOT NULL,
+                    vocabulary TEXT NOT NULL,
+                    cutoff REAL NOT NULL,
+                    match TEXT,
+                    ratio REAL,
+                    PRIMARY KEY (term, vocabulary, cutoff)
+                )
+                """
+            )
+            connection.commit()
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def lookup(self, terms, vocabulary, cutoff):
+        """Return {term: (match, ratio)} for the terms already in the cache."""
+        terms = list(terms)
+        found = {}
+        with self._lock:
+            connection = self._connect()
+            for start in range(0, len(terms), LOOKUP_BATCH_SIZE):
+                batch = terms[start : start + LOOKUP_BATCH_SIZE]
+                rows = connection.execute(
+                    "SELECT term, match, ratio FROM matches "
+                    "WHERE vocabulary = ? AND cutoff = ? "
+                    f"AND term IN ({', '.join('?' * len(batch))})",
+                    [vocabulary, cutoff, *batch],
+                )
+                for term, match, ratio in rows:
+                    found[term] = (match, ratio)
+            self.hits += len(found)
+            self.misses += len(terms) - len(found)
+        return found
+
+    def store(self, matches, vocabulary, cutoff):
+        """Save {term: (match, ratio)} results in one transaction."""
+        if not matches:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO matches "
+                    "(term, vocabulary, cutoff, match, ratio) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (term, vocabulary, cutoff, match, ratio)
+                        for term, (match, ratio) in matches.items()
+                    ],
+                )
+
+    def close(self):
+        """Close this process's database connection."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+
+def set_default_match_cache(match_cache):
+    """
+    Use match_cache (a MatchCache, a database path, or None to disable) for
+    every analyze_classes_and_tags call that does not pass its own cache.
+    """
+    global _default_match_cache
+    if match_cache is not None and not isinstance(match_cache, MatchCache):
+        match_cache = MatchCache(match_cache)
+    _default_match_cache = match_cache
+    return match_cache
+
+
+def get_default_match_cache():
+    """Return the process-wide MatchCache, or None when none is configured."""
+    return _default_match_cache
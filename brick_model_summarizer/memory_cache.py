@@ -0,0 +1,140 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+# A parsed JSON summary takes about three times its serialized length
+BYTES_PER_SUMMARY_CHAR = 3
+DEFAULT_MEMORY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MEMORY_CACHE_TTL_SECONDS = 3 * 60 * 60
+
+
+def estimate_summary_bytes(summary):
+    """Estimate the memory held by a JSON-compatible summary."""
+    return len(json.dumps(summary)) * BYTES_PER_SUMMARY_CHAR
+
+
+class MemoryCache:
+    """
+    In-memory LRU cache with a byte budget and a TTL.
+
+    Each entry's footprint is estimated with sizer when it is stored; the
+    default suits JSON-compatible values such as model summaries. When
+    the estimated total passes max_bytes the least recently used entries
+    are evicted, and entries not used for ttl_seconds expire. Hits, misses,
+    evictions and expirations are counted for stats(). All methods are
+    thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_bytes=DEFAULT_MEMORY_CACHE_MAX_BYTES,
+        ttl_seconds=DEFAULT_MEMORY_CACHE_TTL_SECONDS,
+        sizer=estimate_summary_bytes,
+        clock=time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sizer = sizer
+        self.clock = clock
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejections = 0
+        # key -> [value, size, last used], least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.total_bytes -= size
+
+    def _expired(self, entry, now):
+        return self.ttl_seconds is not None and now - entry[2] > self.ttl_seconds
+
+    def get(self, key, default=None):
+        """Return the value for key and mark it used, or default."""
+        with self._lock:
+            entry = self._entries.get(key)
+            now = self.clock()
+            if entry is not None and self._expired(entry, now):
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            entry[2] = now
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size=None):
+        """
+        Store value under key, evicting least recently used entries to fit.
+
+        Returns False, without storing, if the value alone is larger than
+        max_bytes.
+        """
+        size = self.sizer(value) if size is None else size
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                self.rejections += 1
+                return False
+            self._purge_expired(self.clock())
+            while self._entries and self.total_bytes + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            self._entries[key] = [value, size, self.clock()]
+            self.total_bytes += size
+            return True
+
+    def pop(self, key, default=None):
+        """Remove key and return its value, or default."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            value = self._entries[key][0]
+            self._remove(key)
+            return value
+
+    def _purge_expired(self, now):
+        expired = [
+            key for key, entry in self._entries.items() if self._expired(entry, now)
+        ]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def purge_expired(self):
+        """Drop every expired entry and return how many were dropped."""
+        with self._lock:
+            return self._purge_expired(self.clock())
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry, self.clock())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return the cache counters and current size."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "rejections": self.rejections,
+            }
@@ -1,6 +1,9 @@
 from brick_model_summarizer.utils import BRICK, UNIT
+from brick_model_summarizer.graph_index import get_graph_index
+from brick_model_summarizer.queries import instrumented
 
 
+@instrumented("meters.counts")
 def query_meters(graph):
     """Identify and count all meter types and their associations."""
     meters = {
@@ -25,75 +28,37 @@ def query_meters(graph):
         "people_count_sensors": 0,
     }
 
-    # Query for updated meter types and equipment
-    query = """
-    PREFIX brick: <https://brickschema.org/schema/Brick#>
-    SELECT ?meter ?type WHERE {
-        ?meter a ?type .
-        FILTER(?type IN (
-            brick:Building_Chilled_Water_Meter,
-            brick:Building_Hot_Water_Meter,
-            brick:Building_Electrical_Meter,
-            brick:Building_Gas_Meter,
-            brick:Building_Water_Meter,
-            brick:Electric_Energy_Sensor,
-            brick:Electric_Power_Sensor,
-            brick:Active_Power_Sensor,
-            brick:Electric_Vehicle_Charging_Hub,
-            brick:Electric_Vehicle_Charging_Port,
-            brick:Electric_Vehicle_Charging_Station,
-            brick:Electrical_Energy_Usage_Sensor,
-            brick:PV_Generation_System,
-            brick:PV_Panel,
-            brick:Photovoltaic_Array,
-            brick:Photovoltaic_Current_Output_Sensor,
-            brick:Photovoltaic_Inverter,
-            brick:Peak_Demand_Sensor,
-            brick:People_Count_Sensor_Equipment
-        ))
+    # Meter class -> key in the meters dictionary. Boolean entries record
+    # presence, integer entries count instances.
+    meter_classes = {
+        "Building_Chilled_Water_Meter": "chilled_water_meter",
+        "Building_Hot_Water_Meter": "hot_water_meter",
+        "Building_Electrical_Meter": "building_electrical_meter",
+        "Building_Gas_Meter": "building_gas_meter",
+        "Building_Water_Meter": "building_water_meter",
+        "Electric_Energy_Sensor": "electric_energy_sensors",
+        "Electric_Power_Sensor": "electric_power_sensors",
+        "Active_Power_Sensor": "active_power_sensors",
+        "Electric_Vehicle_Charging_Hub": "ev_charging_hubs",
+        "Electric_Vehicle_Charging_Port": "ev_charging_ports",
+        "Electric_Vehicle_Charging_Station": "ev_charging_stations",
+        "Electrical_Energy_Usage_Sensor": "electrical_energy_usage_sensors",
+        "PV_Generation_System": "pv_generation_systems",
+        "PV_Panel": "pv_panels",
+        "Photovoltaic_Array": "photovoltaic_arrays",
+        "Photovoltaic_Current_Output_Sensor": "photovoltaic_current_output_sensors",
+        "Photovoltaic_Inverter": "photovoltaic_inverters",
+        "Peak_Demand_Sensor": "peak_demand_sensors",
+        "People_Count_Sensor_Equipment": "people_count_sensors",
     }
-    """
-    results = graph.query(query)
-    for row in results:
-        meter_type = str(row.type).split("#")[-1]
-        if meter_type == "Building_Chilled_Water_Meter":
-            meters["chilled_water_meter"] = True
-        elif meter_type == "Building_Hot_Water_Meter":
-            meters["hot_water_meter"] = True
-        elif meter_type == "Building_Electrical_Meter":
-            meters["building_electrical_meter"] = True
-        elif meter_type == "Building_Gas_Meter":
-            meters["building_gas_meter"] = True
-        elif meter_type == "Building_Water_Meter":
-            meters["building_water_meter"] = True
-        elif meter_type == "Electric_Energy_Sensor":
-            meters["electric_energy_sensors"] += 1
-        elif meter_type == "Electric_Power_Sensor":
-            meters["electric_power_sensors"] += 1
-        elif meter_type == "Active_Power_Sensor":
-            meters["active_power_sensors"] += 1
-        elif meter_type == "Electric_Vehicle_Charging_Hub":
-            meters["ev_charging_hubs"] += 1
-        elif meter_type == "Electric_Vehicle_Charging_Port":
-            meters["ev_charging_ports"] += 1
-        elif meter_type == "Electric_Vehicle_Charging_Station":
-            meters["ev_charging_stations"] += 1
-        elif meter_type == "Electrical_Energy_Usage_Sensor":
-            meters["electrical_energy_usage_sensors"] += 1
-        elif meter_type == "PV_Generation_System":
-            meters["pv_generation_systems"] += 1
-        elif meter_type == "PV_Panel":
-            meters["pv_panels"] += 1
-        elif meter_type == "Photovoltaic_Array":
-            meters["photovoltaic_arrays"] += 1
-        elif meter_type == "Photovoltaic_Current_Output_Sensor":
-            meters["photovoltaic_current_output_sensors"] += 1
-        elif meter_type == "Photovoltaic_Inverter":
-            meters["photovoltaic_inverters"] += 1
-        elif meter_type == "Peak_Demand_Sensor":
-            meters["peak_demand_sensors"] += 1
-        elif meter_type == "People_Count_Sensor_Equipment":
-            meters["people_count_sensors"] += 1
+
+    index = get_graph_index(graph)
+    type_counts = index.counts([BRICK[meter_type] for meter_type in meter_classes])
+    for key, count in zip(meter_classes.values(), type_counts):
+        if isinstance(meters[key], bool):
+            meters[key] = meters[key] or count > 0
+        else:
+            meters[key] += count
 
     return meters
 
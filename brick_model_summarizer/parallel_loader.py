@@ -0,0 +1,114 @@
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from rdflib import BNode, Graph
+from rdflib.plugins.parsers.ntriples import W3CNTriplesParser
+
+from brick_model_summarizer.graph_index import GraphIndex
+
+
+class BlankNodeLabels(dict):
+    """
+    Blank node context that maps every N-Triples label to a fixed BNode.
+
+    rdflib normally invents a random BNode per label and parser, which would
+    split one blank node into several when its triples land in different
+    chunks. Prefixing the label with a per-load token keeps them joined
+    across chunks without clashing with blank nodes from other files.
+    """
+
+    def __init__(self, prefix):
+        super().__init__()
+        self.prefix = prefix
+
+    def get(self, label, default=None):
+        return BNode(self.prefix + label)
+
+
+class TripleSink:
+    """N-Triples parser sink that forwards each triple to an add() callable."""
+
+    def __init__(self, add):
+        self.add = add
+
+    def triple(self, subject, predicate, obj):
+        self.add(subject, predicate, obj)
+
+
+def split_ntriples(file_path, chunk_count):
+    """Split an N-Triples file into byte ranges that start and end on line boundaries."""
+    size = os.path.getsize(file_path)
+    chunk_count = max(1, min(chunk_count, size))
+    boundaries = [0]
+    with open(file_path, "rb") as file:
+        for chunk_number in range(1, chunk_count):
+            position = max(size * chunk_number // chunk_count, boundaries[-1])
+            file.seek(position)
+            if position > 0:
+                # Finish the partial line so the next chunk starts on a new one
+                file.seek(position - 1)
+                file.readline()
+            boundaries.append(min(file.tell(), size))
+    boundaries.append(size)
+    return [
+        (start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start
+    ]
+
+
+def parse_ntriples_chunk(file_path, start, end, bnode_prefix, as_graph=False):
+    """Parse one byte range of an N-Triples file into a GraphIndex or a triple list."""
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    if as_graph:
+        triples = []
+        sink = TripleSink(lambda s, p, o: triples.append((s, p, o)))
+        result = triples
+    else:
+        result = GraphIndex()
+        sink = TripleSink(result.add)
+
+    W3CNTriplesParser(sink, bnode_context=BlankNodeLabels(bnode_prefix)).parsestring(
+        data
+    )
+    return result
+
+
+def load_ntriples_parallel(file_path, workers=None, chunks_per_worker=4, as_graph=False):
+    """
+    Parse an N-Triples file in parallel chunks.
+
+    The file is split into byte ranges on line boundaries, the ranges are
+    parsed in a process pool and the partial results are merged. Returns a
+    GraphIndex, or an rdflib Graph when as_graph is True.
+    """
+    file_path = os.fspath(file_path)
+    workers = workers or os.cpu_count() or 1
+    ranges = split_ntriples(file_path, workers * chunks_per_worker)
+    bnode_prefix = uuid.uuid4().hex + "_"
+
+    result = Graph() if as_graph else GraphIndex()
+
+    def merge(partial):
+        if as_graph:
+            result.addN((s, p, o, result) for s, p, o in partial)
+        else:
+            result.merge(partial)
+
+    if workers == 1:
+        for start, end in ranges:
+            merge(parse_ntriples_chunk(file_path, start, end, bnode_prefix, as_graph))
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                parse_ntriples_chunk, file_path, start, end, bnode_prefix, as_graph
+            )
+            for start, end in ranges
+        ]
+        for future in futures:
+            merge(future.result())
+    return result
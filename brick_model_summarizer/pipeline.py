@@ -0,0 +1,201 @@
+import asyncio
+import inspect
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from brick_model_summarizer.batch import find_models, summarize_data
+
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+class LocalDirectorySource:
+    """
+    Model source backed by a local directory or glob pattern.
+
+    A source lists model keys with the async iterator keys() and returns a
+    model's bytes from the coroutine read(key). An object-storage source
+    implements the same two methods; this one stands in for it locally and
+    reads files in the event loop's default thread pool.
+    """
+
+    def __init__(self, source):
+        self.source = source
+
+    async def keys(self):
+        loop = asyncio.get_running_loop()
+        for model in await loop.run_in_executor(None, find_models, self.source):
+            yield model
+
+    async def read(self, key):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _read_bytes, key)
+
+
+def _read_bytes(path):
+    with open(path, "rb") as file:
+        return file.read()
+
+
+class StageStats:
+    """Items processed, busy time and peak output queue depth of one stage."""
+
+    def __init__(self):
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.max_queue = 0
+
+    def report(self, wall_seconds):
+        return {
+            "items": self.items,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "items_per_second": round(self.items / wall_seconds, 2)
+            if wall_seconds
+            else 0.0,
+            "max_queue": self.max_queue,
+        }
+
+
+async def _put(queue, item, stats):
+    await queue.put(item)
+    stats.max_queue = max(stats.max_queue, queue.qsize())
+
+
+async def _run_stage(count, worker, outbox):
+    """Run count copies of worker, then pass one end marker per consumer on."""
+    await asyncio.gather(*(worker() for _ in range(count)))
+    if outbox is not None:
+        for _ in range(outbox.consumers):
+            await outbox.put(_DONE)
+
+
+class _Queue(asyncio.Queue):
+    """Bounded queue that knows how many workers read from it."""
+
+    def __init__(self, maxsize, consumers):
+        super().__init__(maxsize)
+        self.consumers = consumers
+
+
+async def run_pipeline(
+    source,
+    sink=None,
+    components=None,
+    workers=None,
+    fetchers=4,
+    queue_size=8,
+    executor=None,
+):
+    """
+    Fetch, parse and summarize every model of source with overlapping stages.
+
+    Models are listed, then read by `fetchers` concurrent I/O tasks, parsed
+    and summarized in `workers` processes, and finally handed to sink (a
+    function or coroutine function called with each batch-style record, see
+    batch.summarize_file). A model that cannot be read or summarized gets a
+    record with an "error" field instead of stopping the run. Stages are
+    connected by queues of at most queue_size items, so a slow stage makes
+    the earlier ones wait instead of holding the whole portfolio in memory.
+
+    Pass an executor to reuse a pool; otherwise a ProcessPoolExecutor with
+    `workers` processes is created for the run. Returns {"records": [...]}
+    when no sink is given, plus "stages" with per-stage throughput and
+    "wall_seconds".
+    """
+    loop = asyncio.get_running_loop()
+    workers = workers or os.cpu_count() or 1
+    records = []
+    collect = sink is None
+    if collect:
+        sink = records.append
+    stats = {name: StageStats() for name in ("list", "fetch", "summarize", "sink")}
+
+    keys = _Queue(queue_size, consumers=fetchers)
+    fetched = _Queue(queue_size, consumers=workers)
+    summarized = _Queue(queue_size, consumers=1)
+
+    async def list_keys():
+        async for key in source.keys():
+            stats["list"].items += 1
+            await _put(keys, key, stats["list"])
+
+    async def fetch():
+        while (key := await keys.get()) is not _DONE:
+            start = time.perf_counter()
+            try:
+                data = await source.read(key)
+            except Exception as error:
+                # An unreadable model gets an error record, like an unparsable one
+                seconds = time.perf_counter() - start
+                stats["fetch"].busy_seconds += seconds
+                stats["fetch"].items += 1
+                record = {
+                    "model": key,
+                    "error": f"{type(error).__name__}: {error}",
+                    "seconds": round(seconds, 3),
+                }
+                await _put(summarized, record, stats["summarize"])
+                continue
+            stats["fetch"].busy_seconds += time.perf_counter() - start
+            stats["fetch"].items += 1
+            await _put(fetched, (key, data), stats["fetch"])
+
+    async def summarize():
+        while (item := await fetched.get()) is not _DONE:
+            key, data = item
+            start = time.perf_counter()
+            record = await loop.run_in_executor(
+                pool, summarize_data, key, data, components
+            )
+            stats["summarize"].busy_seconds += time.perf_counter() - start
+            stats["summarize"].items += 1
+            await _put(summarized, record, stats["summarize"])
+
+    async def drain():
+        while (record := await summarized.get()) is not _DONE:
+            start = time.perf_counter()
+            result = sink(record)
+            if inspect.isawaitable(result):
+                await result
+            stats["sink"].busy_seconds += time.perf_counter() - start
+            stats["sink"].items += 1
+
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    start = time.perf_counter()
+    stages = [
+        asyncio.ensure_future(stage)
+        for stage in (
+            _run_stage(1, list_keys, keys),
+            _run_stage(fetchers, fetch, fetched),
+            _run_stage(workers, summarize, summarized),
+            _run_stage(1, drain, None),
+        )
+    ]
+    try:
+        await asyncio.gather(*stages)
+    except BaseException:
+        # Stop the other stages instead of leaving them blocked on a queue
+        for stage in stages:
+            stage.cancel()
+        raise
+    finally:
+        if executor is None:
+            pool.shutdown()
+    wall_seconds = time.perf_counter() - start
+
+    result = {
+        "stages": {name: stage.report(wall_seconds) for name, stage in stats.items()},
+        "wall_seconds": round(wall_seconds, 3),
+    }
+    if collect:
+        result["records"] = records
+    return result
+
+
+def summarize_source(source, **kwargs):
+    """Run run_pipeline to completion from synchronous code."""
+    if not hasattr(source, "keys"):
+        source = LocalDirectorySource(source)
+    return asyncio.run(run_pipeline(source, **kwargs))
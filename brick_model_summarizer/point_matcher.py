@@ -0,0 +1,105 @@
+import re
+
+from brick_model_summarizer.utils import BRICK
+from brick_model_summarizer.graph_index import get_graph_index
+from brick_model_summarizer.queries import instrumented
+
+
+POINT_HITS_ATTRIBUTE = "_brick_point_hits"
+
+AHU_POINT_IDENTIFIERS = (
+    "cooling_coil",
+    "heating_coil",
+    "return_fan",
+    "supply_fan",
+    "return_air_temperature_sensor",
+    "mixed_air_temperature_sensor",
+    "supply_air_temperature_sensor",
+    "supply_air_temperature_setpoint",
+    "supply_air_static_pressure_sensor",
+    "supply_air_static_pressure_setpoint",
+    "air_flow_sensor",
+    "air_flow_setpoint",
+    "active_chilled_beam",
+    "chilled_beam",
+    "passive_chilled_beam",
+    "heat_wheel",
+    "heat_wheel_vfd",
+)
+
+VAV_POINT_IDENTIFIERS = (
+    "zone_reheat_valve_command",
+    "zone_supply_air_flow",
+    "zone_supply_air_temp",
+    "zone_supply_air_flow_setpoint",
+)
+
+# Equipment whose points are matched against the identifiers
+MATCHED_EQUIPMENT_CLASSES = (
+    BRICK.Air_Handling_Unit,
+    BRICK.Variable_Air_Volume_Box,
+    BRICK.Variable_Air_Volume_Box_With_Reheat,
+)
+
+
+class PointMatcher:
+    """
+    Find every identifier contained in a point name with a single regex scan.
+
+    The identifiers are compiled into one lookahead alternation, longest
+    first, so each position of the name reports the longest identifier that
+    starts there. Shorter identifiers nested inside a hit (chilled_beam in
+    active_chilled_beam, heat_wheel in heat_wheel_vfd) are added from a
+    precomputed containment table, which makes the result identical to
+    testing every identifier with `in`.
+    """
+
+    def __init__(self, identifiers):
+        self.identifiers = tuple(dict.fromkeys(i.lower() for i in identifiers))
+        longest_first = sorted(self.identifiers, key=len, reverse=True)
+        self.pattern = re.compile(
+            "(?=(" + "|".join(re.escape(i) for i in longest_first) + "))"
+        )
+        self.contained = {
+            identifier: frozenset(i for i in self.identifiers if i in identifier)
+            for identifier in self.identifiers
+        }
+
+    def match(self, name):
+        """Return the frozenset of identifiers found in name, ignoring case."""
+        return frozenset().union(
+            *(self.contained[found] for found in self.pattern.findall(name.lower()))
+        )
+
+
+POINT_MATCHER = PointMatcher(AHU_POINT_IDENTIFIERS + VAV_POINT_IDENTIFIERS)
+
+
+@instrumented("points.equipment_matches")
+def match_equipment_points(graph):
+    """
+    Match the brick:hasPoint edges of every AHU and VAV box in one pass.
+
+    Returns {equipment: [(point, hits), ...]} listing only the points whose
+    names contain at least one identifier. The result is computed once per
+    index and shared by the AHU and VAV feature counters.
+    """
+    index = get_graph_index(graph)
+    equipment_hits = index.__dict__.get(POINT_HITS_ATTRIBUTE)
+    if equipment_hits is not None:
+        return equipment_hits
+
+    equipment_hits = {}
+    for equipment_class in MATCHED_EQUIPMENT_CLASSES:
+        for equipment in index.subjects_of_type(equipment_class):
+            if equipment in equipment_hits:
+                continue
+            matched = []
+            for point in index.points_of(equipment):
+                hits = POINT_MATCHER.match(str(point))
+                if hits:
+                    matched.append((point, hits))
+            equipment_hits[equipment] = matched
+
+    setattr(index, POINT_HITS_ATTRIBUTE, equipment_hits)
+    return equipment_hits
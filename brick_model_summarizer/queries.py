@@ -0,0 +1,121 @@
+import threading
+import time
+from functools import wraps
+
+
+class QueryRegistry:
+    """
+    Registry of the model queries, keyed by stable query IDs.
+
+    Every summarizer lookup reads a graph index and is registered by ID and
+    timed through the instrumented decorator. Each call records its count,
+    its total time and its self time, which leaves out the time spent in
+    nested instrumented calls (ahu.features runs points.equipment_matches,
+    for example), so self times add up while total times overlap. Lookups
+    returning a list or set also record their number of result rows.
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self._lock = threading.Lock()
+        # Per thread: child seconds of each instrumented call in progress
+        self._active = threading.local()
+
+    def register(self, query_id):
+        """
+        Register a query ID.
+
+        Registering the same ID again is a no-op, so a module that is
+        imported twice (e.g. run with python -m) still works.
+        """
+        with self._lock:
+            self.stats.setdefault(
+                query_id,
+                {"calls": 0, "seconds": 0.0, "self_seconds": 0.0, "rows": None},
+            )
+
+    def record(self, query_id, seconds, rows=None, self_seconds=None):
+        """Add one call of query_id to its statistics."""
+        with self._lock:
+            stats = self.stats[query_id]
+            stats["calls"] += 1
+            stats["seconds"] += seconds
+            stats["self_seconds"] += seconds if self_seconds is None else self_seconds
+            if rows is not None:
+                stats["rows"] = (stats["rows"] or 0) + rows
+
+    def instrumented(self, query_id):
+        """Decorator that registers query_id and times every call."""
+        self.register(query_id)
+
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                stack = getattr(self._active, "stack", None)
+                if stack is None:
+                    stack = self._active.stack = []
+                stack.append(0.0)
+                start = time.perf_counter()
+                try:
+                    result = func(*args, **kwargs)
+                finally:
+                    seconds = time.perf_counter() - start
+                    children = stack.pop()
+                    if stack:
+                        stack[-1] += seconds
+                rows = len(result) if isinstance(result, (list, set)) else None
+                self.record(query_id, seconds, rows, seconds - children)
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def report(self):
+        """Return per-query statistics, largest self time first."""
+        with self._lock:
+            report = [
+                {
+                    "query_id": query_id,
+                    "calls": stats["calls"],
+                    "total_seconds": stats["seconds"],
+                    "self_seconds": stats["self_seconds"],
+                    "mean_seconds": stats["seconds"] / stats["calls"]
+                    if stats["calls"]
+                    else 0.0,
+                    "rows": stats["rows"],
+                }
+                for query_id, stats in self.stats.items()
+            ]
+        return sorted(report, key=lambda entry: entry["self_seconds"], reverse=True)
+
+    def reset(self):
+        """Clear the statistics of every registered query."""
+        with self._lock:
+            for stats in self.stats.values():
+                stats.update(calls=0, seconds=0.0, self_seconds=0.0, rows=None)
+
+
+QUERY_REGISTRY = QueryRegistry()
+instrumented = QUERY_REGISTRY.instrumented
+
+
+def query_report():
+    """Return the statistics of every registered query."""
+    return QUERY_REGISTRY.report()
+
+
+def format_query_report(report=None):
+    """Format a query report as a plain-text table."""
+    report = query_report() if report is None else report
+    lines = [
+        f"{'query_id':<40} {'calls':>7} {'total_ms':>10} {'self_ms':>10} {'rows':>8}"
+    ]
+    for entry in report:
+        rows = "-" if entry["rows"] is None else entry["rows"]
+        lines.append(
+            f"{entry['query_id']:<40} {entry['calls']:>7} "
+            f"{entry['total_seconds'] * 1000:>10.2f} "
+            f"{entry['self_seconds'] * 1000:>10.2f} {rows:>8}"
+        )
+    return "\n".join(lines)
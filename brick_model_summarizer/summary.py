@@ -0,0 +1,151 @@
+from brick_model_summarizer.ahu_info import identify_ahu_equipment, collect_ahu_data
+from brick_model_summarizer.zone_info import (
+    query_zone_setpoints,
+    count_vav_boxes,
+    count_vav_boxes_per_ahu,
+    count_vav_features,
+    count_zone_features,
+    collect_zone_data,
+)
+from brick_model_summarizer.meters_info import query_meters, collect_meter_data
+from brick_model_summarizer.central_plant_info import (
+    identify_hvac_system_equipment,
+    collect_central_plant_data,
+)
+from brick_model_summarizer.building_info import collect_building_data
+from brick_model_summarizer.class_tag_checker import analyze_classes_and_tags
+from brick_model_summarizer.class_hierarchy import subclass_aware_index
+from brick_model_summarizer.graph_index import BaseIndex, graph_version
+
+
+SUMMARY_CACHE_ATTRIBUTE = "_brick_summary_cache"
+
+
+# Intermediate results shared between components. Each one is computed at
+# most once per summarize_model call, no matter how many components need it.
+INTERMEDIATES = {
+    "ahu_equipment": identify_ahu_equipment,
+    "zone_setpoints": query_zone_setpoints,
+    "vav_count": count_vav_boxes,
+    "vav_per_ahu": count_vav_boxes_per_ahu,
+    "vav_features": count_vav_features,
+    "zone_counts": count_zone_features,
+    "meters": query_meters,
+    "hvac_equipment": identify_hvac_system_equipment,
+    "building_data": collect_building_data,
+    "class_tag_summary": analyze_classes_and_tags,
+}
+
+ZONE_INTERMEDIATES = (
+    "zone_setpoints",
+    "vav_count",
+    "vav_per_ahu",
+    "vav_features",
+    "zone_counts",
+)
+
+# Component name -> (required intermediates, function building the component)
+COMPONENTS = {
+    "class_tag_summary": (
+        ("class_tag_summary",),
+        lambda results: results["class_tag_summary"],
+    ),
+    "ahu_information": (
+        ("ahu_equipment",),
+        lambda results: collect_ahu_data(results["ahu_equipment"]),
+    ),
+    "zone_information": (
+        ZONE_INTERMEDIATES,
+        lambda results: collect_zone_data(
+            {name: results[name] for name in ZONE_INTERMEDIATES}
+        ),
+    ),
+    "building_information": (
+        ("building_data",),
+        lambda results: results["building_data"],
+    ),
+    "meter_information": (
+        ("meters",),
+        lambda results: collect_meter_data(results["meters"]),
+    ),
+    "central_plant_information": (
+        ("hvac_equipment",),
+        lambda results: collect_central_plant_data(results["hvac_equipment"]),
+    ),
+    "number_of_vav_boxes_per_ahu": (
+        ("vav_per_ahu",),
+        lambda results: results["vav_per_ahu"],
+    ),
+}
+
+
+def resolve_intermediates(components):
+    """Return the ordered, de-duplicated intermediates the components need."""
+    needed = []
+    for component in components:
+        if component not in COMPONENTS:
+            raise ValueError(
+                f"Unknown component '{component}'. "
+                f"Available components: {', '.join(COMPONENTS)}"
+            )
+        for name in COMPONENTS[component][0]:
+            if name not in needed:
+                needed.append(name)
+    return needed
+
+
+def cached_components(graph):
+    """
+    Return the component results memoized on graph, or None for an index.
+
+    The cache is keyed on the graph's mutation version, so it is emptied as
+    soon as a triple is added or removed.
+    """
+    if isinstance(graph, BaseIndex):
+        return None
+    version = graph_version(graph)
+    cached = graph.__dict__.get(SUMMARY_CACHE_ATTRIBUTE)
+    if cached is None or cached[0] != version:
+        cached = (version, {})
+        setattr(graph, SUMMARY_CACHE_ATTRIBUTE, cached)
+    return cached[1]
+
+
+def summarize_model(graph, components=None, include_subclasses=False):
+    """
+    Summarize the requested components of a Brick model in one call.
+
+    Intermediate results are computed once and shared by every component
+    that needs them. When components is None all components are returned.
+    With include_subclasses=True every class count also includes instances
+    of its Brick subclasses (e.g. a Water_Cooled_Chiller counts as a Chiller).
+
+    Component results for an rdflib graph are memoized on the graph until it
+    is mutated, so repeated calls return the same (shared) objects; do not
+    modify them in place.
+    """
+    if components is None:
+        components = list(COMPONENTS)
+    elif isinstance(components, str):
+        components = [components]
+
+    memo = cached_components(graph)
+    if memo is None:
+        memo = {}
+    missing = [
+        component
+        for component in components
+        if (component, include_subclasses) not in memo
+    ]
+
+    if missing:
+        source = subclass_aware_index(graph) if include_subclasses else graph
+        results = {}
+        for name in resolve_intermediates(missing):
+            results[name] = INTERMEDIATES[name](source)
+        for component in missing:
+            memo[(component, include_subclasses)] = COMPONENTS[component][1](results)
+
+    return {
+        component: memo[(component, include_subclasses)] for component in components
+    }
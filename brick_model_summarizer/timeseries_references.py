@@ -1,31 +1,29 @@
 from rdflib import Namespace
+from brick_model_summarizer.graph_index import get_graph_index
+from brick_model_summarizer.queries import instrumented
 
 # Define namespaces
 BRICK = Namespace("https://brickschema.org/schema/Brick#")
 RDFS = Namespace("http://www.w3.org/2000/01/rdf-schema#")
 
 
+@instrumented("timeseries.references")
 def extract_timeseries_references(graph):
     """
     Extract timeseries references from the Brick model.
     """
+    index = get_graph_index(graph)
     references = []
-    query = """
-    PREFIX brick: <https://brickschema.org/schema/Brick#>
-    PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-    SELECT ?sensor ?label ?timeseries_id WHERE {
-        ?sensor brick:timeseries ?timeseries .
-        ?sensor rdfs:label ?label .
-        ?timeseries brick:hasTimeseriesId ?timeseries_id .
-    }
-    """
-    results = graph.query(query)
-    for row in results:
-        references.append(
-            {
-                "sensor": str(row.sensor).split("#")[-1],
-                "label": str(row.label),
-                "timeseries_id": str(row.timeseries_id),
-            }
-        )
+    for sensor in index.subjects_with(BRICK.timeseries):
+        labels = index.objects(sensor, RDFS.label)
+        for timeseries in index.objects(sensor, BRICK.timeseries):
+            for timeseries_id in index.objects(timeseries, BRICK.hasTimeseriesId):
+                for label in labels:
+                    references.append(
+                        {
+                            "sensor": str(sensor).split("#")[-1],
+                            "label": str(label),
+                            "timeseries_id": str(timeseries_id),
+                        }
+                    )
     return references
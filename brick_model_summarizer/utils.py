@@ -1,6 +1,9 @@
 # brick_utils.py
+import os
 from rdflib import Graph, Namespace
 
+from brick_model_summarizer.graph_cache import GraphCache, DEFAULT_CACHE_MAX_BYTES
+
 
 # Define namespaces
 BRICK = Namespace("https://brickschema.org/schema/Brick#")
@@ -9,8 +12,24 @@ RDF = Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#")
 RDFS = Namespace("http://www.w3.org/2000/01/rdf-schema#")
 
 
-def load_graph(file_path):
-    """Load the RDF graph from a TTL file."""
+def parse_turtle(file_path):
+    """Parse a TTL file into a new RDF graph."""
     graph = Graph()
     graph.parse(file_path, format="turtle")
     return graph
+
+
+def load_graph(file_path, cache_dir=None, cache_max_bytes=None):
+    """
+    Load the RDF graph from a TTL file.
+
+    When cache_dir is given, parsed graphs are stored there keyed by the hash
+    of the file contents and reloaded from the cache on later calls.
+    """
+    if cache_dir is None or not isinstance(file_path, (str, os.PathLike)):
+        return parse_turtle(file_path)
+
+    if cache_max_bytes is None:
+        cache_max_bytes = DEFAULT_CACHE_MAX_BYTES
+    cache = GraphCache(cache_dir, max_bytes=cache_max_bytes)
+    return cache.load_or_parse(file_path, parse_turtle)
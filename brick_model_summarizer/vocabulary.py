@@ -0,0 +1,257 @@
+import gzip
+import json
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from functools import lru_cache
+
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import OWL
+
+from brick_model_summarizer.utils import BRICK, RDF, RDFS
+
+
+# Bump when the layout of the vocabulary file changes.
+VOCABULARY_FORMAT_VERSION = 2
+VOCABULARY_FILE = os.path.join(
+    os.path.dirname(__file__), "data", "brick_vocabulary.json.gz"
+)
+BRICK_TAG = "https://brickschema.org/schema/BrickTag#"
+REC = Namespace("https://w3id.org/rec#")
+
+# Preferred classes sit under one of these roots; since Brick 1.4 the
+# System and Loop classes are rec:Collections rather than brick:Entities
+PREFERRED_ROOTS = (BRICK.Entity, BRICK.Collection, REC.Collection)
+# Meta-classes under brick:Entity that are not part of the vocabulary
+META_CLASSES = (BRICK.Class, BRICK.Tag)
+
+# Serializes refreshes within the process only; see refresh_brick_vocabulary
+_REFRESH_LOCK = threading.Lock()
+
+
+def brick_local_name(term):
+    """Return the local name of a term in the Brick namespace, or None."""
+    term = str(term)
+    if term.startswith(str(BRICK)):
+        return term[len(str(BRICK)) :]
+    return None
+
+
+def tag_local_name(term):
+    """Return the local name of a term in the BrickTag namespace, or None."""
+    term = str(term)
+    if term.startswith(BRICK_TAG):
+        return term[len(BRICK_TAG) :]
+    return None
+
+
+class ClassHierarchy:
+    """Superclass closure of the Brick classes with cached descendant sets."""
+
+    def __init__(self, classes, ancestors):
+        self.classes = classes
+        descendants = {name: {name} for name in classes}
+        for name, ancestor_ids in zip(classes, ancestors):
+            for ancestor_id in ancestor_ids:
+                descendants[classes[ancestor_id]].add(name)
+        self._descendants = {
+            BRICK[name]: frozenset(BRICK[child] for child in children)
+            for name, children in descendants.items()
+        }
+
+    def descendants(self, brick_class):
+        """Return brick_class and every class below it, as URIs."""
+        return self._descendants.get(brick_class, frozenset((brick_class,)))
+
+
+class BrickVocabulary:
+    """
+    The compiled Brick vocabulary custom models are checked against.
+
+    classes and tags hold the preferred class names and the tag names,
+    aliases maps each deprecated class to its preferred class and
+    class_tags maps each class to the tags associated with it.
+    """
+
+    def __init__(self, data):
+        if data.get("format") != VOCABULARY_FORMAT_VERSION:
+            raise ValueError(f"Unsupported vocabulary format: {data.get('format')}")
+        all_classes = data["classes"]
+        tag_names = data["tags"]
+        self.brick_version = data["brick_version"]
+        self.all_classes = all_classes
+        self.classes = frozenset(all_classes[i] for i in data["preferred"])
+        self.tags = frozenset(tag_names)
+        self.aliases = {
+            all_classes[alias]: all_classes[preferred]
+            for alias, preferred in data["aliases"]
+        }
+        self.class_tags = {
+            name: frozenset(tag_names[i] for i in tag_ids)
+            for name, tag_ids in zip(all_classes, data["class_tags"])
+            if tag_ids
+        }
+        self._ancestors = data["ancestors"]
+        self._hierarchy = None
+
+    @property
+    def hierarchy(self):
+        """The ClassHierarchy of every Brick class, built on first use."""
+        if self._hierarchy is None:
+            self._hierarchy = ClassHierarchy(self.all_classes, self._ancestors)
+        return self._hierarchy
+
+
+def _ancestors(term, edges):
+    """Return every term reachable from term along edges."""
+    found = set()
+    pending = list(edges.get(term, ()))
+    while pending:
+        parent = pending.pop()
+        if parent not in found and parent != term:
+            found.add(parent)
+            pending.extend(edges.get(parent, ()))
+    return found
+
+
+def compile_vocabulary(brick_ttl_path):
+    """
+    Compile the vocabulary data from a local Brick.ttl in one pass.
+
+    The ontology is parsed once and every triple is visited once; no SPARQL
+    is evaluated. Preferred classes are the Brick owl:Classes that reach
+    one of PREFERRED_ROOTS by rdfs:subClassOf and are not a brick:aliasOf
+    another class or one of META_CLASSES. The superclass closure follows rdfs:subClassOf and brick:aliasOf
+    between Brick classes, so an alias is counted under its preferred class.
+    """
+    brick = Graph()
+    brick.parse(brick_ttl_path, format="turtle")
+
+    owl_classes = set()
+    tag_terms = set()
+    superclasses = defaultdict(set)
+    aliases = {}
+    class_tags = defaultdict(set)
+    versions = []
+    for subject, predicate, obj in brick:
+        if predicate == RDF.type:
+            if obj == OWL.Class:
+                owl_classes.add(subject)
+            elif obj == BRICK.Tag:
+                tag_terms.add(subject)
+        elif predicate == RDFS.subClassOf:
+            superclasses[subject].add(obj)
+        elif predicate == BRICK.aliasOf:
+            aliases[subject] = obj
+        elif predicate == BRICK.hasAssociatedTag:
+            class_tags[subject].add(obj)
+        elif predicate == OWL.versionInfo and isinstance(obj, Literal):
+            if str(subject).startswith("https://brickschema.org/schema/"):
+                versions.append(str(obj))
+
+    # Closure edges: superclasses within Brick, and alias -> preferred class
+    brick_edges = defaultdict(set)
+    for child, parents in superclasses.items():
+        if brick_local_name(child):
+            brick_edges[child].update(p for p in parents if brick_local_name(p))
+    for alias, preferred in aliases.items():
+        if brick_local_name(alias) and brick_local_name(preferred):
+            brick_edges[alias].add(preferred)
+
+    class_terms = {term for term in owl_classes if brick_local_name(term)}
+    for child, parents in brick_edges.items():
+        class_terms.add(child)
+        class_terms.update(parents)
+    classes = sorted(brick_local_name(term) for term in class_terms)
+    position = {name: i for i, name in enumerate(classes)}
+
+    preferred = [
+        position[brick_local_name(term)]
+        for term in class_terms
+        if term in owl_classes
+        and term not in aliases
+        and term not in META_CLASSES
+        and (
+            term == BRICK.Entity
+            or not _ancestors(term, superclasses).isdisjoint(PREFERRED_ROOTS)
+        )
+    ]
+
+    tags = sorted({tag_local_name(term) for term in tag_terms if tag_local_name(term)})
+    tag_position = {name: i for i, name in enumerate(tags)}
+
+    return {
+        "format": VOCABULARY_FORMAT_VERSION,
+        "brick_version": max(versions) if versions else "unknown",
+        "classes": classes,
+        "preferred": sorted(preferred),
+        "tags": tags,
+        "aliases": sorted(
+            [position[brick_local_name(alias)], position[brick_local_name(target)]]
+            for alias, target in aliases.items()
+            if brick_local_name(alias) and brick_local_name(target)
+        ),
+        "ancestors": [
+            sorted(
+                position[brick_local_name(ancestor)]
+                for ancestor in _ancestors(BRICK[name], brick_edges)
+            )
+            for name in classes
+        ],
+        "class_tags": [
+            sorted(
+                tag_position[tag_local_name(tag)]
+                for tag in class_tags.get(BRICK[name], ())
+                if tag_local_name(tag) in tag_position
+            )
+            for name in classes
+        ],
+    }
+
+
+def save_vocabulary(data, path):
+    """
+    Write vocabulary data atomically, so readers never see a partial file.
+
+    The output is deterministic (sorted lists, no gzip timestamp), so
+    compiling the same Brick.ttl twice gives byte-identical files.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            with gzip.GzipFile(fileobj=file, mode="wb", mtime=0) as gz:
+                gz.write(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        # mkstemp creates the file private to the current user
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@lru_cache(maxsize=None)
+def load_brick_vocabulary(path=VOCABULARY_FILE):
+    """Load the bundled Brick vocabulary once per process."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return BrickVocabulary(json.load(file))
+
+
+def refresh_brick_vocabulary(brick_ttl_path, path):
+    """
+    Recompile the vocabulary from a local Brick.ttl into path and load it.
+
+    path is required so the vocabulary bundled with the package is never
+    overwritten by accident; pass VOCABULARY_FILE only to rebuild the
+    package data (see scripts/build_brick_vocabulary.py). The lock only
+    serializes refreshes within this process. Across processes the file
+    is written to a temporary file and moved into place with os.replace,
+    so readers see either the old or the new vocabulary, never a partial
+    one, and the last writer wins.
+    """
+    with _REFRESH_LOCK:
+        save_vocabulary(compile_vocabulary(brick_ttl_path), path)
+        load_brick_vocabulary.cache_clear()
+        return load_brick_vocabulary(path)
@@ -1,4 +1,7 @@
 from brick_model_summarizer.utils import BRICK
+from brick_model_summarizer.graph_index import get_graph_index
+from brick_model_summarizer.queries import instrumented
+from brick_model_summarizer.point_matcher import match_equipment_points
 
 
 def identify_zone_equipment(graph):
@@ -12,71 +15,75 @@ def identify_zone_equipment(graph):
     return zone_equipment
 
 
+# Most general first
+VAV_CLASSES = (
+    BRICK.Variable_Air_Volume_Box,
+    BRICK.Variable_Air_Volume_Box_With_Reheat,
+)
+
+
+def vav_box_type(index, vav):
+    """Return the most specific of VAV_CLASSES that vav is, or None."""
+    for vav_type in reversed(VAV_CLASSES):
+        if index.is_a(vav, vav_type):
+            return vav_type
+    return None
+
+
+@instrumented("zone.setpoints")
 def query_zone_setpoints(graph):
     """Identify zone setpoints relevant to ASO strategies."""
+    index = get_graph_index(graph)
     zone_setpoints = []
-    setpoint_query = """
-    PREFIX brick: <https://brickschema.org/schema/Brick#>
-    SELECT ?zone ?point WHERE {
-        ?zone a brick:Zone .
-        ?zone brick:hasPoint ?point .
-        ?point a brick:Zone_Air_Temperature_Setpoint .
-    }
-    """
-    results = graph.query(setpoint_query)
-    for row in results:
-        zone_setpoints.append(str(row.point))
+    for zone in index.subjects_of_type(BRICK.Zone):
+        for point in index.points_of(zone):
+            if index.is_a(point, BRICK.Zone_Air_Temperature_Setpoint):
+                zone_setpoints.append(str(point))
     return zone_setpoints
 
 
+@instrumented("zone.vav_count")
 def count_vav_boxes(graph):
     """Count the total number of VAV boxes (including reheat) in the building model."""
-    vav_count = 0
-    rvav_count = 0
-
-    query = """
-    PREFIX brick: <https://brickschema.org/schema/Brick#>
-    SELECT (COUNT(?vav) AS ?vav_count) (COUNT(?rvav) AS ?rvav_count) WHERE {
-        { ?vav a brick:Variable_Air_Volume_Box . }
-        UNION
-        { ?rvav a brick:Variable_Air_Volume_Box_With_Reheat . }
+    index = get_graph_index(graph)
+    type_counts = dict.fromkeys(VAV_CLASSES, 0)
+    # Each box counts once, so a box with reheat is not also a plain VAV box
+    for vav in index.subjects_of_types(VAV_CLASSES):
+        type_counts[vav_box_type(index, vav)] += 1
+    return {
+        "vav_count": type_counts[BRICK.Variable_Air_Volume_Box],
+        "rvav_count": type_counts[BRICK.Variable_Air_Volume_Box_With_Reheat],
     }
-    """
-    results = graph.query(query)
-    for row in results:
-        vav_count = int(row["vav_count"])
-        rvav_count = int(row["rvav_count"])
-    return {"vav_count": vav_count, "rvav_count": rvav_count}
 
 
+@instrumented("zone.vav_per_ahu")
 def count_vav_boxes_per_ahu(graph):
     """Count the number of VAV boxes associated with each AHU."""
+    index = get_graph_index(graph)
     vav_per_ahu = {}
 
-    query = """
-    PREFIX brick: <https://brickschema.org/schema/Brick#>
-    SELECT ?ahu ?vav_type (COUNT(?vav) AS ?vav_count) WHERE {
-        ?ahu a brick:Air_Handling_Unit .
-        ?vav a ?vav_type .
-        ?vav brick:isPartOf ?ahu .
-        FILTER(?vav_type IN (brick:Variable_Air_Volume_Box, brick:Variable_Air_Volume_Box_With_Reheat))
-    } GROUP BY ?ahu ?vav_type
-    """
-    results = graph.query(query)
-    for row in results:
-        ahu_name = str(row.ahu).split("#")[-1]
-        vav_type = str(row.vav_type).split("#")[-1]
-        vav_count = int(row.vav_count)
+    for ahu in index.subjects_of_type(BRICK.Air_Handling_Unit):
+        type_counts = {}
+        for vav in index.parts_of(ahu):
+            vav_type = vav_box_type(index, vav)
+            if vav_type is not None:
+                type_counts[vav_type] = type_counts.get(vav_type, 0) + 1
+        if not type_counts:
+            continue
+
+        ahu_name = str(ahu).split("#")[-1]
         if ahu_name not in vav_per_ahu:
             vav_per_ahu[ahu_name] = {
                 "Variable_Air_Volume_Box": 0,
                 "Variable_Air_Volume_Box_With_Reheat": 0,
             }
-        vav_per_ahu[ahu_name][vav_type] = vav_count
+        for vav_type, vav_count in type_counts.items():
+            vav_per_ahu[ahu_name][str(vav_type).split("#")[-1]] = vav_count
 
     return vav_per_ahu
 
 
+@instrumented("zone.vav_features")
 def count_vav_features(graph):
     """Count VAV boxes with specific features."""
     features = {
@@ -93,27 +100,30 @@ def count_vav_features(graph):
         "airflow_setpoint_count": ["zone_supply_air_flow_setpoint"],
     }
 
+    index = get_graph_index(graph)
+    equipment_hits = match_equipment_points(graph)
+    vavs = set()
+    for vav_type in VAV_CLASSES:
+        vavs.update(index.subjects_of_type(vav_type))
+
+    # Identifiers found on the brick:Point typed points of every VAV box
+    vav_hits = []
+    for vav in vavs:
+        found = set()
+        for point, hits in equipment_hits.get(vav, ()):
+            if index.is_a(point, BRICK.Point):
+                found.update(hits)
+        vav_hits.append(found)
+
     for feature, identifiers in feature_points.items():
         for identifier in identifiers:
-            query = f"""
-            PREFIX brick: <https://brickschema.org/schema/Brick#>
-            SELECT (COUNT(DISTINCT ?vav) AS ?count) WHERE {{
-                ?vav a ?vav_type ;
-                     brick:hasPoint ?point .
-                ?point a brick:Point .
-                FILTER(
-                    ?vav_type IN (brick:Variable_Air_Volume_Box, brick:Variable_Air_Volume_Box_With_Reheat) &&
-                    CONTAINS(LCASE(STR(?point)), "{identifier.lower()}")
-                )
-            }}
-            """
-            results = graph.query(query)
-            for row in results:
-                features[feature] += int(row["count"])
+            identifier = identifier.lower()
+            features[feature] += sum(1 for found in vav_hits if identifier in found)
 
     return features
 
 
+@instrumented("zone.counts")
 def count_zone_features(graph):
     """Count additional zone-level features."""
     features = {
@@ -150,16 +160,10 @@ def count_zone_features(graph):
         "reheat_valve_count": "Reheat_Valve",
     }
 
-    for feature, brick_class in feature_classes.items():
-        query = f"""
-        PREFIX brick: <https://brickschema.org/schema/Brick#>
-        SELECT (COUNT(?entity) AS ?count) WHERE {{
-            ?entity a brick:{brick_class} .
-        }}
-        """
-        results = graph.query(query)
-        for row in results:
-            features[feature] = int(row["count"])
+    index = get_graph_index(graph)
+    type_counts = index.counts([BRICK[name] for name in feature_classes.values()])
+    for feature, count in zip(feature_classes, type_counts):
+        features[feature] = count
 
     return features
 
@@ -1,5 +1,6 @@
 import requests
 import os
+import time
 
 # Define the base URL of your API
 BASE_URL = "https://bensapi.pythonanywhere.com"
@@ -31,7 +32,7 @@ try:
         files = {"file": (brick_model_file, file)}
         response = session.post(upload_url, files=files)
 
-        if response.status_code == 200:
+        if response.status_code == 202:
             print("File uploaded successfully.")
         else:
             print(f"Upload failed: {response.status_code}")
@@ -41,7 +42,19 @@ except Exception as e:
     print(f"An error occurred: {e}")
     exit(1)
 
-# Step 3: Retrieve all components dynamically
+# Step 3: Wait for the background summary job to finish
+status_url = f"{BASE_URL}{response.json()['status_url']}"
+while True:
+    job = session.get(status_url).json()
+    if job.get("status") == "done":
+        print(f"Summary ready, stage timings: {job['timings']}")
+        break
+    if job.get("status") == "failed" or "error" in job:
+        print(f"Summary job failed: {job.get('error')}")
+        exit(1)
+    time.sleep(0.5)
+
+# Step 4: Retrieve all components dynamically
 AVAILABLE_COMPONENTS = [
     "class_tag_summary",
     "ahu_information",
@@ -52,35 +65,33 @@ AVAILABLE_COMPONENTS = [
     "number_of_vav_boxes_per_ahu",
 ]
 
-component_url = f"{BASE_URL}/api/get-component"
+components_url = f"{BASE_URL}/api/get-components"
 
-# Dictionary to store all retrieved data
-retrieved_data = {}
+# Fetch every component in one request; the server computes them together
+response = session.get(components_url, params={"components": ",".join(AVAILABLE_COMPONENTS)})
 
-for component in AVAILABLE_COMPONENTS:
-    params = {"component": component}
-    response = session.get(component_url, params=params)
-
-    if response.status_code == 200:
-        retrieved_data[component] = response.json()
-        print(f"{component} Data:\n", response.json(), "\n")
-    else:
-        print(f"Error fetching {component}: {response.status_code}")
-        print(response.json())
+if response.status_code == 200:
+    retrieved_data = response.json()
+    for component, data in retrieved_data.items():
+        print(f"{component} Data:\n", data, "\n")
+else:
+    print(f"Error fetching components: {response.status_code}")
+    print(response.json())
+    exit(1)
 
-# Step 4: Perform Basic Validation Like Pytest
+# Step 5: Perform Basic Validation Like Pytest
 expected_hvac_system_counts = {
     "total_variable_air_volume_boxes": 59,
-    "water_pump": 4,
-    "hot_water_system": 1,
+    "water_pump_count": 4,
+    "hot_water_system_count": 1,
     "hvac_equipment_count": 9,
 }
 
 # Extract relevant values from API responses
 actual_hvac_system_counts = {
     "total_variable_air_volume_boxes": retrieved_data.get("zone_information", {}).get("total_variable_air_volume_boxes", 0),
-    "water_pump": retrieved_data.get("central_plant_information", {}).get("water_pump", 0),
-    "hot_water_system": retrieved_data.get("central_plant_information", {}).get("hot_water_system", 0),
+    "water_pump_count": retrieved_data.get("central_plant_information", {}).get("water_pump_count", 0),
+    "hot_water_system_count": retrieved_data.get("central_plant_information", {}).get("hot_water_system_count", 0),
     "hvac_equipment_count": retrieved_data.get("building_information", {}).get("hvac_equipment_count", 0),
 }
 
@@ -1,50 +1,55 @@
-from flask import Flask, request, jsonify, render_template, session
-from brick_model_summarizer import (
-    load_graph_once,
-    get_class_tag_summary,
-    get_ahu_information,
-    get_zone_information,
-    get_building_information,
-    get_meter_information,
-    get_central_plant_information,
-    get_vav_boxes_per_ahu,
-)
-import io
+from flask import Flask, request, jsonify, render_template, session, url_for
+from brick_model_summarizer.graph_cache import spool_stream
+from brick_model_summarizer.jobs import SummaryJobs
+from brick_model_summarizer.memory_cache import MemoryCache
+from brick_model_summarizer.summary import COMPONENTS
+import os
 import uuid
 from datetime import timedelta
 import threading
 import time
 
-# Store user-specific graphs in memory (not global)
-user_graphs = {}
-
-AVAILABLE_COMPONENTS = {
-    "class_tag_summary": get_class_tag_summary,
-    "ahu_information": get_ahu_information,
-    "zone_information": get_zone_information,
-    "building_information": get_building_information,
-    "meter_information": get_meter_information,
-    "central_plant_information": get_central_plant_information,
-    "number_of_vav_boxes_per_ahu": get_vav_boxes_per_ahu,
-}
+AVAILABLE_COMPONENTS = list(COMPONENTS)
 
 SESSION_MEMORY_CLEANUP_SECONDS = 10800
+SUMMARY_CACHE_MAX_BYTES = int(os.environ.get("SUMMARY_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+SUMMARY_CACHE_PURGE_SECONDS = 600
+SUMMARY_JOB_WORKERS = int(os.environ.get("SUMMARY_JOB_WORKERS", 2))
+# Uploads are streamed to disk rather than held in memory, so the limit only
+# bounds the parsed structures, not copies of the raw file
+MAX_UPLOAD_BYTES = int(os.environ.get("MAX_UPLOAD_BYTES", 64 * 1024 * 1024))
+UPLOAD_DIR = os.environ.get("UPLOAD_DIR")  # None uses the system temp directory
+
+# Precomputed summaries keyed by the SHA-256 of the uploaded file, shared
+# read-only by every session that uploaded the same content (sessions only
+# store the hash). Bounded by an estimated byte budget; summaries idle for
+# longer than a session expire and the least recently used are evicted first.
+shared_summaries = MemoryCache(
+    max_bytes=SUMMARY_CACHE_MAX_BYTES,
+    ttl_seconds=SESSION_MEMORY_CLEANUP_SECONDS,
+)
 
-def cleanup_user_graphs():
+# Uploads are parsed and summarized in the background, off the request threads
+summary_jobs = SummaryJobs(
+    shared_summaries,
+    max_workers=SUMMARY_JOB_WORKERS,
+    ttl_seconds=SESSION_MEMORY_CLEANUP_SECONDS,
+)
+
+def cleanup_shared_summaries():
     while True:
-        time.sleep(SESSION_MEMORY_CLEANUP_SECONDS + 5)  # Run every 30 minutes
-        expired_users = [user_id for user_id in user_graphs if user_id not in session]
-        for user_id in expired_users:
-            del user_graphs[user_id]  # Free memory
-        print(f"Cleaned up {len(expired_users)} expired user graphs.")
+        time.sleep(SUMMARY_CACHE_PURGE_SECONDS)
+        expired = shared_summaries.purge_expired()
+        if expired:
+            print(f"Cleaned up {expired} expired summaries.")
 
 # Start cleanup in a background thread
-threading.Thread(target=cleanup_user_graphs, daemon=True).start()
+threading.Thread(target=cleanup_shared_summaries, daemon=True).start()
 
 app = Flask(__name__)
 app.secret_key = "bens_super_secret_key"  # Used for Flask session security
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(seconds=SESSION_MEMORY_CLEANUP_SECONDS)
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16 MB
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_BYTES
 
 @app.route('/')
 def upload_page():
@@ -56,7 +61,7 @@ def upload_page():
 
 @app.route('/api/upload-ttl', methods=['POST'])
 def upload_ttl_file():
-    """Upload and process the TTL file, storing it per user."""
+    """Accept a TTL file and queue its summary; returns a job ID to poll."""
     user_id = session.get("user_id")
     if not user_id:
         return jsonify({"error": "Session error. Please refresh the page."}), 400
@@ -72,35 +77,127 @@ def upload_ttl_file():
         return jsonify({"error": "Only .ttl files are allowed"}), 400
 
     if file.content_length > app.config['MAX_CONTENT_LENGTH']:
-        return jsonify({"error": "File is too large. Max size is 16MB."}), 400
+        max_mb = app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)
+        return jsonify({"error": f"File is too large. Max size is {max_mb}MB."}), 400
 
     try:
-        # Read file into memory
-        file_content = file.stream.read()
-        in_memory_file = io.BytesIO(file_content)
-        in_memory_file.name = file.filename
+        # Copy the upload to a temporary file in chunks, hashing on the way;
+        # the job parses from that file and removes it
+        path, model_hash, _ = spool_stream(file.stream, UPLOAD_DIR, suffix=".ttl")
 
-        # Load graph and store it per user
-        user_graphs[user_id] = load_graph_once(in_memory_file)
+        # Identical uploads reuse the summary (or the running job) by content
+        job_id = summary_jobs.submit(model_hash, path, file.filename)
+        session["model_hash"] = model_hash
+        session["job_id"] = job_id
 
-        return jsonify({"message": "File uploaded and processed successfully"}), 200
+        return jsonify({
+            "message": "File uploaded, summary queued",
+            "job_id": job_id,
+            "status_url": url_for('job_status', job_id=job_id),
+        }), 202
 
     except Exception as e:
         return jsonify({"error": f"Failed to process file: {str(e)}"}), 500
 
+@app.route('/api/job-status/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Report a summary job's stage (queued, parsing, summarizing, done, failed) and timings."""
+    status = summary_jobs.status(job_id)
+    if status is None:
+        return jsonify({"error": "Unknown job ID"}), 404
+    status.pop("key")
+    return jsonify(status), 200
+
+def session_summary():
+    """Return (summary, None) for the session's upload, or (None, error response)."""
+    model_hash = session.get("model_hash")
+    summary = shared_summaries.get(model_hash) if model_hash else None
+    if summary is not None:
+        return summary, None
+
+    status = summary_jobs.status(session.get("job_id")) if model_hash else None
+    if status is not None and status["status"] in ("queued", "parsing", "summarizing"):
+        return None, (jsonify({
+            "error": "Summary is not ready yet. Poll the job status.",
+            "job_id": status["job_id"],
+            "status": status["status"],
+        }), 409)
+    if status is not None and status["status"] == "failed":
+        return None, (jsonify({"error": f"Failed to process file: {status['error']}"}), 500)
+    if model_hash:
+        # The summary was computed but has since been evicted or expired
+        return None, (jsonify({"error": "Summary expired. Please re-upload the file."}), 410)
+    return None, (jsonify({"error": "No TTL file uploaded. Please upload a file first."}), 400)
+
 @app.route('/api/get-component', methods=['GET'])
 def get_component():
-    """Retrieve a specific component from the user's cached graph."""
-    user_id = session.get("user_id")
-
-    if not user_id or user_id not in user_graphs:
-        return jsonify({"error": "No TTL file uploaded. Please upload a file first."}), 400
+    """Retrieve a specific component from the user's precomputed summary."""
+    summary, error = session_summary()
+    if error:
+        return error
 
     requested_component = request.args.get('component')
 
     if requested_component in AVAILABLE_COMPONENTS:
-        return jsonify({requested_component: AVAILABLE_COMPONENTS[requested_component](user_graphs[user_id])}), 200
+        return jsonify({requested_component: summary[requested_component]}), 200
     return jsonify({"error": "Invalid component requested"}), 400
 
+def requested_components():
+    """
+    Read the component list of a batch request.
+
+    Accepts ?components=a,b (or repeated ?component=a&component=b) on GET
+    and {"components": [...]} on POST; "all" or no list selects every
+    component. Raises ValueError for a malformed POST body.
+    """
+    if request.method == 'POST':
+        body = request.get_json(silent=True)
+        if body is None:
+            body = {}
+        if not isinstance(body, dict):
+            raise ValueError("Request body must be a JSON object")
+        components = body.get("components", "all")
+        if isinstance(components, str):
+            components = [components]
+        if not isinstance(components, list) or not all(
+            isinstance(name, str) for name in components
+        ):
+            raise ValueError("components must be a string or a list of strings")
+    else:
+        components = [
+            name.strip()
+            for value in request.args.getlist('components') + request.args.getlist('component')
+            for name in value.split(",")
+            if name.strip()
+        ]
+    if not components or "all" in components:
+        return list(AVAILABLE_COMPONENTS)
+    return components
+
+@app.route('/api/get-components', methods=['GET', 'POST'])
+def get_components():
+    """Retrieve several components of the user's precomputed summary at once."""
+    summary, error = session_summary()
+    if error:
+        return error
+
+    try:
+        components = requested_components()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    invalid = [name for name in components if name not in AVAILABLE_COMPONENTS]
+    if invalid:
+        return jsonify({
+            "error": f"Invalid components requested: {', '.join(invalid)}",
+            "available_components": list(AVAILABLE_COMPONENTS),
+        }), 400
+
+    return jsonify({component: summary[component] for component in components}), 200
+
+@app.route('/api/cache-stats', methods=['GET'])
+def cache_stats():
+    """Report the summary cache's size and hit/miss/eviction counters."""
+    return jsonify(shared_summaries.stats()), 200
+
 if __name__ == '__main__':
     app.run()
@@ -0,0 +1,27 @@
+"""
+Compile the bundled Brick vocabulary from a local Brick.ttl.
+
+Download Brick.ttl for the release to target (for example from
+https://github.com/BrickSchema/Brick/releases) and run:
+
+    python scripts/build_brick_vocabulary.py path/to/Brick.ttl
+"""
+import sys
+import time
+
+from brick_model_summarizer.vocabulary import VOCABULARY_FILE, refresh_brick_vocabulary
+
+
+def main(brick_ttl_path):
+    start = time.perf_counter()
+    vocabulary = refresh_brick_vocabulary(brick_ttl_path, VOCABULARY_FILE)
+    print(
+        f"Compiled Brick {vocabulary.brick_version}: "
+        f"{len(vocabulary.classes)} classes, {len(vocabulary.tags)} tags, "
+        f"{len(vocabulary.aliases)} aliases in {time.perf_counter() - start:.1f}s"
+    )
+    print(f"Saved to {VOCABULARY_FILE}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
@@ -4,13 +4,20 @@ def read_long_description(file_path):
     with open(file_path, encoding="utf-8") as f:
         return f.read()
 
+def read_version(file_path):
+    # Single source of the version: the package's version.py, without importing it
+    version = {}
+    with open(file_path, encoding="utf-8") as f:
+        exec(f.read(), version)
+    return version["__version__"]
+
 def read_requirements(file_path):
     with open(file_path, encoding="utf-8") as f:
         return [line.strip() for line in f if line.strip() and not line.startswith("#")]
 
 setup(
     name="brick_model_summarizer",
-    version="0.4.1",
+    version=read_version("brick_model_summarizer/version.py"),
     author="Ben Bartling",
     author_email="ben.bartling@gmail.com",
     description="A package for summarizing BRICK models",
@@ -20,6 +27,7 @@ setup(
     packages=find_packages(
         include=["brick_model_summarizer", "brick_model_summarizer.*"]
     ),
+    package_data={"brick_model_summarizer": ["data/*"]},
     install_requires=read_requirements("requirements.txt"),
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -0,0 +1,17 @@
+import os
+
+
+def get_brick_model_file(name):
+    """Construct and verify the path to a sample BRICK model file."""
+    relative_path = os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "sample_brick_models",
+        name,
+    )
+    brick_model_file = os.path.abspath(os.path.normpath(relative_path))
+
+    if not os.path.exists(brick_model_file):
+        raise FileNotFoundError(f"BRICK model file not found: {brick_model_file}")
+
+    return brick_model_file
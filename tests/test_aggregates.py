@@ -0,0 +1,145 @@
+import io
+import json
+import os
+import random
+
+from brick_model_summarizer.aggregates import (
+    BUILDING_AREA,
+    VAVS_PER_AHU,
+    Histogram,
+    PortfolioAggregate,
+    aggregate_portfolio,
+    aggregate_records,
+    merge_aggregates,
+)
+from brick_model_summarizer.batch import summarize_portfolio
+from brick_model_summarizer.graph_index import load_graph_index
+from brick_model_summarizer.summary import summarize_model
+
+
+SAMPLE_MODELS = os.path.join(os.path.dirname(__file__), "..", "sample_brick_models")
+COMPONENTS = ["building_information", "zone_information", "meter_information"]
+
+
+MODEL_PREFIXES = """
+@prefix brick: <https://brickschema.org/schema/Brick#> .
+@prefix unit: <http://qudt.org/vocab/unit/> .
+@prefix : <urn:test#> .
+"""
+
+
+def make_summary(vavs_per_ahu, area, electrical_meter, ahus_with_sat):
+    """
+    Build and summarize a small model.
+
+    vavs_per_ahu maps each AHU to its (VAV boxes, VAV boxes with reheat),
+    which are brick:isPartOf the AHU. The first ahus_with_sat AHUs get a
+    supply air temperature sensor.
+    """
+    lines = [MODEL_PREFIXES, ":building a brick:Building ."]
+    if area:
+        lines.append(
+            f":building brick:area [ brick:value {area} ; brick:hasUnits unit:FT_2 ] ."
+        )
+    if electrical_meter:
+        lines.append(":meter a brick:Building_Electrical_Meter .")
+    for i, (ahu, (vavs, reheat_vavs)) in enumerate(vavs_per_ahu.items()):
+        lines.append(f":{ahu} a brick:Air_Handling_Unit .")
+        if i < ahus_with_sat:
+            point = f":{ahu}_supply_air_temperature_sensor"
+            lines.append(f":{ahu} brick:hasPoint {point} .")
+            lines.append(f"{point} a brick:Supply_Air_Temperature_Sensor .")
+        for n in range(vavs):
+            lines.append(f":{ahu}_vav{n} a brick:Variable_Air_Volume_Box ;")
+            lines.append(f"    brick:isPartOf :{ahu} .")
+        for n in range(reheat_vavs):
+            lines.append(
+                f":{ahu}_rvav{n} a brick:Variable_Air_Volume_Box_With_Reheat ;"
+            )
+            lines.append(f"    brick:isPartOf :{ahu} .")
+    graph = load_graph_index(io.BytesIO("\n".join(lines).encode()), "turtle")
+    return summarize_model(graph)
+
+
+def test_histogram_merge_is_associative():
+    values = [random.Random(seed).randint(0, 300) for seed in range(200)]
+    whole = Histogram()
+    parts = [Histogram() for _ in range(3)]
+    for i, value in enumerate(values):
+        whole.add(value)
+        parts[i % 3].add(value)
+
+    left = Histogram().merge(parts[0]).merge(parts[1]).merge(parts[2])
+    inner = Histogram().merge(parts[1]).merge(parts[0])
+    right = Histogram().merge(parts[2]).merge(inner)
+    assert left.to_dict() == right.to_dict() == whole.to_dict()
+    assert whole.min <= whole.quantile(0.5) <= whole.max
+
+
+def test_portfolio_aggregate_merges_partials():
+    summaries = [
+        make_summary({"AHU1": (3, 1), "AHU2": (6, 0)}, 10000, True, 1),
+        make_summary({"AHU1": (0, 12)}, None, False, 1),
+        make_summary({}, 55000, True, 0),
+    ]
+    assert summaries[0]["number_of_vav_boxes_per_ahu"]["AHU1"] == {
+        "Variable_Air_Volume_Box": 3,
+        "Variable_Air_Volume_Box_With_Reheat": 1,
+    }
+    whole = PortfolioAggregate()
+    for summary in summaries:
+        whole.add_summary(summary)
+    partials = [PortfolioAggregate().add_summary(summary) for summary in summaries]
+    # Partials survive a JSON round trip, as when shipped between processes
+    partials = [
+        PortfolioAggregate.from_dict(json.loads(json.dumps(p.to_dict())))
+        for p in partials
+    ]
+
+    merged = merge_aggregates(reversed(partials))
+    assert merged.report() == whole.report()
+
+    report = merged.report()
+    assert report["models"] == 3
+    assert report["numeric"][VAVS_PER_AHU]["count"] == 3
+    assert report["numeric"][VAVS_PER_AHU]["sum"] == 22
+    assert report["numeric"][BUILDING_AREA]["max"] == 55000
+    coverage = report["numeric"]["coverage.ahu_supply_air_temp_sensor_coverage"]
+    assert (coverage["count"], coverage["min"], coverage["max"]) == (2, 0.5, 1.0)
+    presence = report["presence"]["meter_information.building_electrical_meter_present"]
+    assert presence == {"true": 2, "count": 3, "rate": 2 / 3}
+    assert report["missing"]["building_information.number_of_floors"] == 3
+
+
+def test_coverage_counts_reheat_boxes_and_is_capped():
+    lines = [MODEL_PREFIXES, ":ahu a brick:Air_Handling_Unit ."]
+    # Two supply air temperature sensors on one AHU
+    for n in range(2):
+        point = f":ahu_supply_air_temperature_sensor_{n}"
+        lines.append(f":ahu brick:hasPoint {point} .")
+        lines.append(f"{point} a brick:Supply_Air_Temperature_Sensor .")
+    boxes = ["Variable_Air_Volume_Box"] + ["Variable_Air_Volume_Box_With_Reheat"] * 3
+    for n, box_class in enumerate(boxes):
+        point = f":vav{n}_zone_supply_air_temp"
+        lines.append(f":vav{n} a brick:{box_class} ; brick:hasPoint {point} .")
+        lines.append(f"{point} a brick:Supply_Air_Temperature_Sensor, brick:Point .")
+    graph = load_graph_index(io.BytesIO("\n".join(lines).encode()), "turtle")
+
+    report = PortfolioAggregate().add_summary(summarize_model(graph)).report()
+
+    for name in (
+        "vav_supply_air_temp_sensor_coverage",
+        "ahu_supply_air_temp_sensor_coverage",
+    ):
+        assert report["numeric"][f"coverage.{name}"]["max"] == 1.0
+
+
+def test_parallel_aggregate_matches_batch_output(tmp_path):
+    output = tmp_path / "summaries.jsonl"
+    summarize_portfolio(SAMPLE_MODELS, output, workers=1, components=COMPONENTS)
+
+    parallel = aggregate_portfolio(
+        SAMPLE_MODELS, workers=2, components=COMPONENTS, chunk_size=5
+    )
+    assert parallel.report() == aggregate_records(output).report()
+    assert parallel.models == 12
@@ -0,0 +1,122 @@
+import csv
+
+import pytest
+
+from brick_model_summarizer.analyzer import (
+    analyze_csv,
+    classify_buildings,
+    determine_building_type,
+    process_all_csvs,
+    read_csv_fields,
+    suggest_ecms,
+    suggest_kpis,
+    summaries_to_frame,
+)
+
+
+def write_summary_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Category", "Subcategory", "Details"])
+        writer.writerows(rows)
+
+
+ROWS = [
+    ("Building", "Building Area", "60000 sq ft"),
+    ("Building", "Number of Floors", "4"),
+    ("AHU", "Total AHUs", "5"),
+    ("AHU", "Variable Air Volume AHUs", "3"),
+    ("AHU", "Constant Volume AHUs", "2"),
+    ("AHU", "AHUs with Cooling Coil", "6"),
+    ("AHU", "Total AHUs", "99"),
+]
+
+
+def test_analyze_csv_takes_first_match_per_field(tmp_path):
+    path = tmp_path / "office.csv"
+    write_summary_csv(path, ROWS)
+
+    summary = analyze_csv(path)
+
+    assert summary["floor_area"] == 60000
+    assert summary["num_floors"] == 4
+    assert (summary["total_ahu_count"], summary["vav_count"], summary["cv_count"]) == (
+        5,
+        3,
+        2,
+    )
+    assert summary["equipment_counts"]["Cooling Coils"] == 6
+
+
+def test_read_csv_fields_handles_missing_fields(tmp_path):
+    path = tmp_path / "sparse.csv"
+    write_summary_csv(path, [("Building", "Number of Floors", "Not available")])
+
+    assert read_csv_fields(path) == {"num_floors": "Not available"}
+    summary = analyze_csv(path)
+    assert (summary["floor_area"], summary["num_floors"], summary["vav_count"]) == (
+        0,
+        0,
+        0,
+    )
+    (tmp_path / "bad.csv").write_text("a,b\n1,2\n")
+    assert analyze_csv(tmp_path / "bad.csv") is None
+
+
+def test_process_all_csvs_in_parallel(tmp_path):
+    for i in range(5):
+        write_summary_csv(tmp_path / f"building_{i}.csv", ROWS[i:])
+    (tmp_path / "notes.txt").write_text("not a csv")
+
+    serial = process_all_csvs(tmp_path, workers=1)
+    parallel = process_all_csvs(tmp_path, workers=2, chunksize=2)
+
+    assert parallel == serial
+    assert len(serial) == 5
+    office = next(s for s in serial if s["filename"] == "building_0.csv")
+    assert office["matched_building_type"] == "Medium Office"
+    assert "Convert CV systems to VAV systems for better efficiency." in office["ecms"]
+
+
+def make_summary(floor_area, num_floors, vav_count=0, cv_count=0, cooling_coils=0):
+    return {
+        "filename": f"{floor_area}_{num_floors}.csv",
+        "floor_area": floor_area,
+        "num_floors": num_floors,
+        "total_ahu_count": vav_count + cv_count,
+        "vav_count": vav_count,
+        "cv_count": cv_count,
+        "equipment_counts": {
+            "Cooling Coils": cooling_coils,
+            "Heating Coils": 0,
+            "Supply Fans": 0,
+            "Return Fans": 0,
+        },
+    }
+
+
+def test_building_type_bands_are_inclusive():
+    assert determine_building_type(make_summary(53627, 2)) == "Small Office"
+    assert determine_building_type(make_summary(53628, 3)) == "Medium Office"
+    assert determine_building_type(make_summary(498588, 12)) == "Large Office"
+    assert determine_building_type(make_summary(53628, 2)) == "Unknown Building Type"
+    assert determine_building_type({"floor_area": "n/a"}) == "Unknown Building Type"
+
+
+def test_classify_buildings_matches_scalar_rules():
+    pytest.importorskip("pandas")
+    summaries = [
+        make_summary(area, floors, vav_count=vavs, cv_count=cvs, cooling_coils=coils)
+        for area in (0, 20000, 53627, 53628, 498587, 498588, 900000)
+        for floors in (0, 1, 2, 3, 11, 12, 40)
+        for vavs, cvs, coils in ((0, 0, 0), (3, 1, 6))
+    ]
+
+    result = classify_buildings(summaries_to_frame(summaries))
+
+    assert len(result) == len(summaries)
+    for summary, row in zip(summaries, result.itertuples()):
+        building_type = determine_building_type(summary)
+        assert row.matched_building_type == building_type
+        assert row.ecms == suggest_ecms(summary)
+        assert row.kpis == suggest_kpis(building_type)
@@ -0,0 +1,168 @@
+import json
+import os
+import shutil
+from brick_model_summarizer import load_graph_once, summarize_model
+from brick_model_summarizer.batch import (
+    JOURNAL_SUFFIX,
+    find_models,
+    load_state,
+    read_manifest,
+    summarize_incremental,
+    summarize_portfolio,
+)
+from tests.conftest import get_brick_model_file
+
+
+COMPONENTS = ["building_information", "zone_information"]
+
+
+def make_portfolio(tmp_path):
+    portfolio = tmp_path / "portfolio"
+    (portfolio / "site_b").mkdir(parents=True)
+    shutil.copy(get_brick_model_file("diggs.ttl"), portfolio / "diggs.ttl")
+    shutil.copy(
+        get_brick_model_file("original_my_building.ttl"),
+        portfolio / "site_b" / "my_building.ttl",
+    )
+    (portfolio / "broken.ttl").write_text("this is not turtle")
+    (portfolio / "notes.txt").write_text("not a model")
+    return portfolio
+
+
+def read_records(output):
+    with open(output, encoding="utf-8") as file:
+        return {record["model"]: record for record in map(json.loads, file)}
+
+
+def test_find_models_accepts_directories_and_globs(tmp_path):
+    portfolio = make_portfolio(tmp_path)
+
+    assert [os.path.basename(p) for p in find_models(portfolio)] == [
+        "broken.ttl",
+        "diggs.ttl",
+        "my_building.ttl",
+    ]
+    assert find_models(str(portfolio / "*.ttl")) == [
+        str(portfolio / "broken.ttl"),
+        str(portfolio / "diggs.ttl"),
+    ]
+
+
+def test_portfolio_streams_one_line_per_model(tmp_path):
+    portfolio = make_portfolio(tmp_path)
+    output = tmp_path / "summaries.jsonl"
+
+    stats = summarize_portfolio(portfolio, output, workers=1, components=COMPONENTS)
+
+    assert stats == {"models": 3, "skipped": 0, "summarized": 2, "failed": 1}
+    records = read_records(output)
+    diggs = records[str(portfolio / "diggs.ttl")]
+    expected = summarize_model(
+        load_graph_once(get_brick_model_file("diggs.ttl")), COMPONENTS
+    )
+    assert json.loads(json.dumps(expected)) == diggs["summary"]
+    assert "error" in records[str(portfolio / "broken.ttl")]
+
+
+def test_interrupted_portfolio_resumes(tmp_path):
+    portfolio = make_portfolio(tmp_path)
+    output = tmp_path / "summaries.jsonl"
+    summarize_portfolio(portfolio, output, workers=1, components=COMPONENTS)
+
+    # Simulate a crash after diggs was written but before its checkpoint,
+    # with my_building half written and never checkpointed
+    lines = output.read_text().splitlines(keepends=True)
+    diggs_line = next(line for line in lines if "diggs" in line)
+    output.write_text(diggs_line + lines[0][:20])
+    manifest = tmp_path / "summaries.jsonl.manifest"
+    manifest.write_text("")
+
+    stats = summarize_portfolio(portfolio, output, workers=2, components=COMPONENTS)
+
+    assert stats == {"models": 3, "skipped": 1, "summarized": 1, "failed": 1}
+    assert len(output.read_text().splitlines()) == 3
+    assert len(read_records(output)) == 3
+    assert set(read_manifest(str(manifest)).values()) == {"ok", "error"}
+
+    stats = summarize_portfolio(portfolio, output, workers=1, components=COMPONENTS)
+    assert stats["skipped"] == 3
+
+
+def test_incremental_run_only_summarizes_changed_models(tmp_path, monkeypatch):
+    portfolio = make_portfolio(tmp_path)
+    state = tmp_path / "state.json"
+    output = tmp_path / "snapshot.jsonl"
+
+    def run():
+        return summarize_incremental(
+            portfolio, state, output, workers=1, components=COMPONENTS
+        )
+
+    first = run()
+    assert (first["summarized"], first["failed"]) == (2, 1)
+    first_records = read_records(output)
+
+    # Touching a file without changing it does not trigger a re-summary
+    os.utime(portfolio / "diggs.ttl", ns=(0, 0))
+    assert run()["unchanged"] == 3
+    assert read_records(output) == first_records
+
+    # Failed models are only retried on request
+    retried = summarize_incremental(
+        portfolio, state, output, workers=1, components=COMPONENTS, retry_failed=True
+    )
+    assert (retried["unchanged"], retried["failed"]) == (2, 1)
+
+    with open(portfolio / "diggs.ttl", "a") as file:
+        file.write("\n# edited\n")
+    (portfolio / "site_b" / "my_building.ttl").unlink()
+    stats = run()
+    assert stats == {
+        "models": 2,
+        "unchanged": 1,
+        "summarized": 1,
+        "failed": 0,
+        "removed": 1,
+    }
+    assert sorted(os.path.basename(m) for m in read_records(output)) == [
+        "broken.ttl",
+        "diggs.ttl",
+    ]
+
+    # A new package version invalidates every stored summary
+    monkeypatch.setattr("brick_model_summarizer.batch.__version__", "999")
+    assert run()["unchanged"] == 0
+
+
+def test_incremental_run_survives_vanished_files(tmp_path, monkeypatch):
+    portfolio = make_portfolio(tmp_path)
+    missing = str(portfolio / "deleted.ttl")
+    found = find_models(portfolio) + [missing]
+    # The file is listed but gone by the time it is fingerprinted
+    monkeypatch.setattr("brick_model_summarizer.batch.find_models", lambda _: found)
+    state = tmp_path / "state.json"
+
+    def run():
+        return summarize_incremental(portfolio, state, workers=1, components=COMPONENTS)
+
+    assert run()["failed"] == 2
+    assert "error" in load_state(str(state))["models"][missing]["record"]
+    # Without a fingerprint the vanished file is tried again; broken.ttl is not
+    assert run()["failed"] == 1
+
+
+def test_interrupted_incremental_run_keeps_journaled_records(tmp_path, monkeypatch):
+    portfolio = make_portfolio(tmp_path)
+    state = str(tmp_path / "state.json")
+    # Simulate a crash: the state file is never rewritten
+    monkeypatch.setattr(
+        "brick_model_summarizer.batch.save_state", lambda state, path: None
+    )
+    summarize_incremental(portfolio, state, workers=1, components=COMPONENTS)
+    assert not os.path.exists(state)
+    assert len(load_state(state)["models"]) == 3
+
+    monkeypatch.undo()
+    stats = summarize_incremental(portfolio, state, workers=1, components=COMPONENTS)
+    assert stats["unchanged"] == 3
+    assert not os.path.exists(state + JOURNAL_SUFFIX)
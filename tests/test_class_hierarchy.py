@@ -0,0 +1,102 @@
+from rdflib import Graph
+from brick_model_summarizer import load_graph_once, summarize_model
+from brick_model_summarizer.class_hierarchy import (
+    load_class_hierarchy,
+    subclass_aware_index,
+)
+from brick_model_summarizer.compact_store import CompactTripleStore
+from brick_model_summarizer.graph_index import get_graph_index
+from brick_model_summarizer.utils import BRICK, RDF
+from tests.conftest import get_brick_model_file
+
+
+def parse_model(body):
+    """Parse a Turtle model body written with the brick: and : prefixes."""
+    prefixes = (
+        "@prefix brick: <https://brickschema.org/schema/Brick#> .\n"
+        "@prefix : <urn:test#> .\n"
+    )
+    return Graph().parse(data=prefixes + body, format="turtle")
+
+
+def typed_subjects(graph, brick_classes):
+    """Return the distinct subjects typed as any of brick_classes."""
+    return {
+        subject
+        for brick_class in brick_classes
+        for subject in graph.subjects(RDF.type, brick_class)
+    }
+
+
+def test_descendants_include_subclasses_and_aliases():
+    hierarchy = load_class_hierarchy()
+
+    chillers = hierarchy.descendants(BRICK.Chiller)
+    assert BRICK.Chiller in chillers
+    assert BRICK.Water_Cooled_Chiller in chillers
+    assert BRICK.Boiler not in chillers
+
+    # Deprecated alias of Air_Handling_Unit
+    assert BRICK.Air_Handler_Unit in hierarchy.descendants(BRICK.Air_Handling_Unit)
+
+    # Unknown classes only match themselves
+    assert hierarchy.descendants(BRICK.Not_A_Class) == {BRICK.Not_A_Class}
+
+
+def test_subclass_counts_match_graph_and_compact_store():
+    graph = load_graph_once(get_brick_model_file("bldg6.ttl"))
+    hierarchy = load_class_hierarchy()
+    index = subclass_aware_index(graph)
+    store = subclass_aware_index(CompactTripleStore.from_graph(graph))
+
+    for brick_class in ["Air_Handling_Unit", "Variable_Air_Volume_Box", "Point"]:
+        descendants = hierarchy.descendants(BRICK[brick_class])
+        expected = len(typed_subjects(graph, descendants))
+        assert index.count(BRICK[brick_class]) == expected
+        assert store.count(BRICK[brick_class]) == expected
+
+
+def test_include_subclasses_is_opt_in():
+    graph = load_graph_once(get_brick_model_file("bldg6.ttl"))
+    exact_ahus = get_graph_index(graph).count(BRICK.Air_Handling_Unit)
+
+    default = summarize_model(graph, ["ahu_information"])
+    inferred = summarize_model(graph, ["ahu_information"], include_subclasses=True)
+
+    assert default["ahu_information"]["total_ahus"] == exact_ahus
+    assert inferred["ahu_information"]["total_ahus"] > exact_ahus
+
+
+def test_subclass_counts_use_the_advertised_keys():
+    graph = parse_model(":chiller a brick:Water_Cooled_Chiller .")
+
+    default = summarize_model(graph, ["central_plant_information"])
+    inferred = summarize_model(
+        graph, ["central_plant_information"], include_subclasses=True
+    )
+
+    plant = default["central_plant_information"]
+    assert (plant["chiller_count"], plant["water_cooled_chiller_count"]) == (0, 1)
+    plant = inferred["central_plant_information"]
+    assert (plant["chiller_count"], plant["water_cooled_chiller_count"]) == (1, 1)
+    assert "chiller" not in plant and "water_cooled_chiller" not in plant
+
+
+def test_subclass_mode_counts_each_vav_box_once():
+    graph = parse_model(
+        ":ahu a brick:Air_Handling_Unit .\n"
+        ":vav a brick:Variable_Air_Volume_Box_With_Reheat ; brick:isPartOf :ahu .\n"
+    )
+
+    summary = summarize_model(
+        graph,
+        ["zone_information", "number_of_vav_boxes_per_ahu"],
+        include_subclasses=True,
+    )
+
+    zones = summary["zone_information"]
+    assert zones["total_variable_air_volume_boxes"] == 0
+    assert zones["total_variable_air_volume_boxes_with_reheat"] == 1
+    assert summary["number_of_vav_boxes_per_ahu"] == {
+        "ahu": {"Variable_Air_Volume_Box": 0, "Variable_Air_Volume_Box_With_Reheat": 1}
+    }
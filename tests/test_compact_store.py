@@ -0,0 +1,36 @@
+from brick_model_summarizer import load_graph_once, summarize_model
+from brick_model_summarizer.compact_store import CompactTripleStore, load_compact_store
+from brick_model_summarizer.graph_index import get_graph_index
+from brick_model_summarizer.utils import BRICK
+from tests.conftest import get_brick_model_file
+
+
+COMPONENTS = [
+    "ahu_information",
+    "zone_information",
+    "building_information",
+    "meter_information",
+    "central_plant_information",
+    "number_of_vav_boxes_per_ahu",
+]
+
+
+def test_compact_store_summarizes_like_graph():
+    for model in ["diggs.ttl", "acad.ttl", "original_my_building.ttl"]:
+        brick_model_file = get_brick_model_file(model)
+        graph = load_graph_once(brick_model_file)
+        store = load_compact_store(brick_model_file)
+
+        assert len(store) == len(graph)
+        assert summarize_model(store, COMPONENTS) == summarize_model(graph, COMPONENTS)
+
+
+def test_vectorized_counts_match_index():
+    graph = load_graph_once(get_brick_model_file("acad.ttl"))
+    store = CompactTripleStore.from_graph(graph)
+    index = get_graph_index(graph)
+
+    classes = [BRICK.HVAC_Zone, BRICK.Floor, BRICK.Not_A_Class, BRICK.Point]
+    assert store.counts(classes) == index.counts(classes)
+    assert store.counts(classes)[2] == 0
+    assert get_graph_index(store) is store
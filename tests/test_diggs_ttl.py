@@ -62,8 +62,8 @@ def test_hvac_system_counts():
 
     expected_hvac_system_counts = {
         "total_variable_air_volume_boxes": 59,
-        "water_pump": 4,
-        "hot_water_system": 1,
+        "water_pump_count": 4,
+        "hot_water_system_count": 1,
         "hvac_equipment_count": 9,
     }
 
@@ -72,8 +72,8 @@ def test_hvac_system_counts():
         "total_variable_air_volume_boxes": zone_info.get(
             "total_variable_air_volume_boxes", 0
         ),
-        "water_pump": central_plant_data.get("water_pump", 0),
-        "hot_water_system": central_plant_data.get("hot_water_system", 0),
+        "water_pump_count": central_plant_data.get("water_pump_count", 0),
+        "hot_water_system_count": central_plant_data.get("hot_water_system_count", 0),
         "hvac_equipment_count": building_data.get("hvac_equipment_count", 0),
     }
 
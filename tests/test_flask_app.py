@@ -0,0 +1,108 @@
+import importlib.util
+import json
+import os
+import time
+
+import pytest
+
+pytest.importorskip("flask")
+
+from brick_model_summarizer import load_graph_once, summarize_model
+from tests.conftest import get_brick_model_file
+
+
+def load_flask_app():
+    path = os.path.join(os.path.dirname(__file__), "..", "flask_app", "flask_app.py")
+    spec = importlib.util.spec_from_file_location("flask_app", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+flask_app = load_flask_app()
+MODEL = "bldg1.ttl"
+
+
+@pytest.fixture(scope="module")
+def summary():
+    """The summary of MODEL as the API returns it, tuples turned into lists."""
+    summary = summarize_model(load_graph_once(get_brick_model_file(MODEL)))
+    return json.loads(json.dumps(summary))
+
+
+@pytest.fixture
+def client():
+    """A test client whose session has uploaded MODEL and waited for its summary."""
+    client = flask_app.app.test_client()
+    client.get("/")
+    with open(get_brick_model_file(MODEL), "rb") as file:
+        response = client.post("/api/upload-ttl", data={"file": (file, MODEL)})
+    assert response.status_code == 202
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        status = client.get(response.json["status_url"]).json
+        if status["status"] in ("done", "failed"):
+            break
+        time.sleep(0.01)
+    assert status["status"] == "done"
+    return client
+
+
+def test_get_components_reads_csv_and_repeated_params(client, summary):
+    csv = client.get(
+        "/api/get-components?components=ahu_information, meter_information"
+    )
+    repeated = client.get(
+        "/api/get-components?component=ahu_information&component=meter_information"
+    )
+
+    expected = {
+        "ahu_information": summary["ahu_information"],
+        "meter_information": summary["meter_information"],
+    }
+    assert csv.status_code == repeated.status_code == 200
+    assert csv.json == repeated.json == expected
+
+
+def test_get_components_post_and_all(client, summary):
+    posted = client.post(
+        "/api/get-components", json={"components": ["building_information"]}
+    )
+    assert posted.status_code == 200
+    assert posted.json == {"building_information": summary["building_information"]}
+
+    for response in (
+        client.get("/api/get-components?components=all"),
+        client.get("/api/get-components"),
+        client.post("/api/get-components", json={"components": "all"}),
+    ):
+        assert response.status_code == 200
+        assert response.json == summary
+
+
+def test_get_components_rejects_invalid_requests(client):
+    invalid = client.get("/api/get-components?components=ahu_information,nope")
+    assert invalid.status_code == 400
+    assert "nope" in invalid.json["error"]
+    assert invalid.json["available_components"] == flask_app.AVAILABLE_COMPONENTS
+
+    for body in ({"components": 5}, ["ahu_information"], {"components": [1]}):
+        response = client.post("/api/get-components", json=body)
+        assert response.status_code == 400
+        assert "error" in response.json
+
+
+def test_get_components_requires_an_upload():
+    response = flask_app.app.test_client().get("/api/get-components")
+    assert response.status_code == 400
+
+
+def test_evicted_summary_asks_for_a_reupload(client):
+    with client.session_transaction() as session:
+        model_hash = session["model_hash"]
+    flask_app.shared_summaries.pop(model_hash)
+
+    response = client.get("/api/get-component?component=ahu_information")
+    assert response.status_code == 410
+    assert "re-upload" in response.json["error"]
@@ -0,0 +1,93 @@
+from difflib import get_close_matches
+import pytest
+from brick_model_summarizer.class_tag_checker import find_similar_classes
+from brick_model_summarizer.fuzzy_matcher import FuzzyMatcher, get_fuzzy_matcher
+from brick_model_summarizer.match_cache import MatchCache
+
+
+VOCABULARY = {
+    "Air_Handling_Unit",
+    "Air_Handler_Unit",
+    "Variable_Air_Volume_Box",
+    "Variable_Air_Volume_Box_With_Reheat",
+    "Zone_Air_Temperature_Sensor",
+    "Zone_Air_Temperature_Setpoint",
+    "Supply_Air_Temperature_Sensor",
+    "Chiller",
+    "Boiler",
+    "Fan",
+}
+
+TERMS = [
+    "Air_Handling_Unit",
+    "Air_Handlng_Unit",
+    "AHU",
+    "Variable_Air_Volume_Box_Reheat",
+    "Zone_Air_Temp_Sensor",
+    "Zone_Air_Temperature_Setpt",
+    "Chillr",
+    "Boilers",
+    "Fans",
+    "",
+    "Ünïcode_Chiller",
+]
+
+
+@pytest.mark.parametrize("cutoff", [0.6, 0.8, 0.9])
+@pytest.mark.parametrize("n", [1, 3])
+def test_close_matches_agree_with_difflib(cutoff, n):
+    matcher = FuzzyMatcher(VOCABULARY)
+    for term in TERMS:
+        assert matcher.close_matches(term, n=n, cutoff=cutoff) == get_close_matches(
+            term, VOCABULARY, n=n, cutoff=cutoff
+        ), term
+
+
+def test_find_similar_classes_skips_exact_names():
+    mismatches = find_similar_classes(TERMS, VOCABULARY)
+
+    assert [term for term, _, _ in mismatches] == [
+        "Air_Handlng_Unit",
+        "Variable_Air_Volume_Box_Reheat",
+        "Zone_Air_Temp_Sensor",
+        "Zone_Air_Temperature_Setpt",
+        "Chillr",
+        "Boilers",
+        "Fans",
+    ]
+    assert ("Chillr", "Chiller", 0.92) in mismatches
+
+
+def test_matcher_is_built_once_per_vocabulary():
+    assert get_fuzzy_matcher(VOCABULARY) is get_fuzzy_matcher(set(VOCABULARY))
+
+
+def test_match_cache_only_searches_new_terms(tmp_path, monkeypatch):
+    expected = find_similar_classes(TERMS, VOCABULARY)
+    database = tmp_path / "matches.sqlite"
+
+    cache = MatchCache(database)
+    assert find_similar_classes(TERMS, VOCABULARY, match_cache=cache) == expected
+    assert cache.hits == 0
+    cache.close()
+
+    # A new cache on the same file must answer every term without searching
+    monkeypatch.setattr(
+        "brick_model_summarizer.class_tag_checker.best_match",
+        lambda *args: pytest.fail("term was searched again"),
+    )
+    cache = MatchCache(database)
+    assert find_similar_classes(TERMS, VOCABULARY, match_cache=cache) == expected
+    assert cache.misses == 0
+    assert cache.hits == len(TERMS) - 1  # Air_Handling_Unit is a standard name
+
+
+def test_match_cache_is_keyed_by_vocabulary_and_cutoff(tmp_path):
+    cache = MatchCache(tmp_path / "matches.sqlite")
+    find_similar_classes(["Chillr"], VOCABULARY, match_cache=cache)
+
+    assert find_similar_classes(["Chillr"], {"Boiler"}, match_cache=cache) == []
+    assert find_similar_classes(
+        ["Chillr"], VOCABULARY, cutoff=0.95, match_cache=cache
+    ) == find_similar_classes(["Chillr"], VOCABULARY, cutoff=0.95)
+    assert cache.hits == 0
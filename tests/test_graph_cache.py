@@ -0,0 +1,84 @@
+import os
+import json
+from brick_model_summarizer import load_graph_once, get_zone_information
+from brick_model_summarizer.graph_cache import (
+    GraphCache,
+    CACHE_FILE_SUFFIX,
+    file_content_hash,
+    spool_stream,
+)
+from tests.conftest import get_brick_model_file
+
+
+def test_cached_graph_matches_parsed_graph(tmp_path):
+    brick_model_file = get_brick_model_file("diggs.ttl")
+
+    parsed = load_graph_once(brick_model_file)
+    first = load_graph_once(brick_model_file, cache_dir=tmp_path)
+    cached = load_graph_once(brick_model_file, cache_dir=tmp_path)
+
+    entry = tmp_path / (file_content_hash(brick_model_file) + CACHE_FILE_SUFFIX)
+    assert entry.exists()
+    assert len(cached) == len(first) == len(parsed)
+    assert get_zone_information(cached) == get_zone_information(parsed)
+
+
+def test_stale_stamp_is_rebuilt(tmp_path):
+    brick_model_file = get_brick_model_file("diggs.ttl")
+    load_graph_once(brick_model_file, cache_dir=tmp_path)
+
+    entry = tmp_path / (file_content_hash(brick_model_file) + CACHE_FILE_SUFFIX)
+    payload = entry.read_bytes().split(b"\n", 1)[1]
+    entry.write_bytes(json.dumps({"format": -1}).encode("utf-8") + b"\n" + payload)
+
+    cache = GraphCache(tmp_path)
+    assert cache.load(file_content_hash(brick_model_file)) is None
+    assert not entry.exists()
+
+    graph = load_graph_once(brick_model_file, cache_dir=tmp_path)
+    assert len(graph) > 0
+    assert cache.load(file_content_hash(brick_model_file)) is not None
+
+
+def test_load_survives_concurrent_eviction(tmp_path, monkeypatch):
+    brick_model_file = get_brick_model_file("bldg1.ttl")
+    parsed = load_graph_once(brick_model_file, cache_dir=tmp_path)
+    entry = tmp_path / (file_content_hash(brick_model_file) + CACHE_FILE_SUFFIX)
+
+    def evicted_utime(path, *args, **kwargs):
+        # Another process removes the entry between the read and the utime
+        os.remove(path)
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr("brick_model_summarizer.graph_cache.os.utime", evicted_utime)
+    graph = GraphCache(tmp_path).load(file_content_hash(brick_model_file))
+
+    assert len(graph) == len(parsed)
+    assert not entry.exists()
+
+
+def test_eviction_keeps_cache_within_budget(tmp_path):
+    models = ["diggs.ttl", "bldg3.ttl", "bldg1.ttl"]
+    for model in models:
+        load_graph_once(get_brick_model_file(model), cache_dir=tmp_path)
+
+    cache = GraphCache(tmp_path)
+    sizes = [size for _, size, _ in cache.entries()]
+    assert len(sizes) == len(models)
+
+    cache.max_bytes = max(sizes)
+    cache.evict()
+    assert sum(size for _, size, _ in cache.entries()) <= cache.max_bytes
+
+
+def test_spool_stream_copies_and_hashes(tmp_path):
+    model = get_brick_model_file("bldg1.ttl")
+
+    with open(model, "rb") as stream:
+        path, content_hash, size = spool_stream(stream, tmp_path, suffix=".ttl")
+
+    with open(path, "rb") as spooled, open(model, "rb") as original:
+        assert spooled.read() == original.read()
+    assert content_hash == file_content_hash(model)
+    assert size == os.path.getsize(model)
+    assert path.endswith(".ttl") and os.path.dirname(path) == str(tmp_path)
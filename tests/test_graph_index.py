@@ -0,0 +1,77 @@
+import pytest
+from brick_model_summarizer import load_graph_once, load_graph_index, summarize_model
+from brick_model_summarizer.graph_index import BaseIndex, GraphIndex, get_graph_index
+from brick_model_summarizer.timeseries_references import extract_timeseries_references
+from brick_model_summarizer.utils import BRICK
+from tests.conftest import get_brick_model_file
+
+
+def sparql_count(graph, brick_class):
+    query = f"""
+    PREFIX brick: <https://brickschema.org/schema/Brick#>
+    SELECT (COUNT(DISTINCT ?entity) AS ?count) WHERE {{
+        ?entity a brick:{brick_class} .
+    }}
+    """
+    for row in graph.query(query):
+        return int(row["count"])
+
+
+def test_type_counts_match_sparql():
+    """Index type counts must agree with the equivalent SPARQL COUNT queries."""
+    graph = load_graph_once(get_brick_model_file("acad.ttl"))
+    index = get_graph_index(graph)
+
+    for brick_class in ["HVAC_Zone", "Floor", "Air_Handler_Unit", "Zone", "Point"]:
+        assert index.count(BRICK[brick_class]) == sparql_count(graph, brick_class)
+
+
+def test_index_is_built_once_per_graph():
+    graph = load_graph_once(get_brick_model_file("diggs.ttl"))
+    index = get_graph_index(graph)
+
+    assert get_graph_index(graph) is index
+    assert get_graph_index(index) is index
+    assert isinstance(index, GraphIndex)
+
+
+def test_part_of_is_indexed_in_both_directions():
+    graph = load_graph_once(get_brick_model_file("diggs.ttl"))
+    index = get_graph_index(graph)
+
+    for child, parents in index.parents_by_subject.items():
+        for parent in parents:
+            assert child in index.parts_of(parent)
+
+
+def test_streamed_index_summarizes_like_full_graph(tmp_path):
+    """An index streamed from Turtle or N-Triples must give the same summary."""
+    brick_model_file = get_brick_model_file("acad.ttl")
+    graph = load_graph_once(brick_model_file)
+    components = [
+        "zone_information",
+        "building_information",
+        "meter_information",
+        "central_plant_information",
+    ]
+    expected = summarize_model(graph, components)
+
+    nt_file = tmp_path / "acad.nt"
+    graph.serialize(destination=str(nt_file), format="nt", encoding="utf-8")
+
+    for source in (brick_model_file, str(nt_file)):
+        index = load_graph_index(source)
+        assert isinstance(index, GraphIndex)
+        assert summarize_model(index, components) == expected
+        assert len(extract_timeseries_references(index)) == len(
+            extract_timeseries_references(graph)
+        )
+
+
+def test_incomplete_index_backend_cannot_be_created():
+    class CountOnlyIndex(BaseIndex):
+        def count(self, brick_class):
+            return 0
+
+    with pytest.raises(TypeError, match="subjects_of_type"):
+        CountOnlyIndex()
@@ -0,0 +1,72 @@
+import sys
+import time
+
+from brick_model_summarizer import load_graph_once, summarize_model
+from brick_model_summarizer.jobs import SummaryJobs
+from brick_model_summarizer.memory_cache import MemoryCache
+from tests.conftest import get_brick_model_file
+
+
+def wait_for(jobs, job_id, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = jobs.status(job_id)
+        if status["status"] in ("done", "failed"):
+            return status
+        time.sleep(0.01)
+    raise TimeoutError(job_id)
+
+
+def test_job_summarizes_upload_in_background(capsys):
+    results = MemoryCache()
+    jobs = SummaryJobs(results, max_workers=1)
+    path = get_brick_model_file("bldg1.ttl")
+    with open(path, "rb") as file:
+        data = file.read()
+    stdout = sys.stdout
+
+    job_id = jobs.submit("bldg1", data, "bldg1.ttl")
+    status = wait_for(jobs, job_id)
+    jobs.shutdown()
+
+    # Summarizers log instead of printing, and jobs leave sys.stdout alone
+    assert sys.stdout is stdout
+    assert capsys.readouterr().out == ""
+    assert status["status"] == "done"
+    assert set(status["timings"]) == {"queued", "parsing", "summarizing"}
+    assert results.get("bldg1") == summarize_model(load_graph_once(path))
+
+
+def test_jobs_reuse_results_and_report_failures():
+    results = MemoryCache()
+    results.put("known", {"building_information": {}})
+    jobs = SummaryJobs(results, max_workers=1)
+
+    cached = jobs.status(jobs.submit("known", b"", "known.ttl"))
+    failed = wait_for(jobs, jobs.submit("broken", b"not turtle", "broken.ttl"))
+    jobs.shutdown()
+
+    assert cached["status"] == "done"
+    assert failed["status"] == "failed"
+    assert "error" in failed
+    assert results.get("broken") is None
+    assert jobs.status("missing") is None
+
+
+def test_job_removes_spooled_upload(tmp_path):
+    results = MemoryCache()
+    jobs = SummaryJobs(results, max_workers=1)
+    spooled = tmp_path / "upload.ttl"
+    duplicate = tmp_path / "duplicate.ttl"
+    with open(get_brick_model_file("bldg2.ttl"), "rb") as file:
+        data = file.read()
+    for path in (spooled, duplicate):
+        path.write_bytes(data)
+
+    status = wait_for(jobs, jobs.submit("bldg2", str(spooled), "bldg2.ttl"))
+    jobs.submit("bldg2", str(duplicate), "bldg2.ttl")
+    jobs.shutdown()
+
+    assert status["status"] == "done"
+    assert results.get("bldg2")["building_information"]["number_of_floors"] == 2
+    assert list(tmp_path.iterdir()) == []
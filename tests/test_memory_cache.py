@@ -0,0 +1,69 @@
+import json
+
+from brick_model_summarizer import load_graph_once, summarize_model
+from brick_model_summarizer.memory_cache import (
+    BYTES_PER_SUMMARY_CHAR,
+    MemoryCache,
+    estimate_summary_bytes,
+)
+from tests.conftest import get_brick_model_file
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_respects_byte_budget():
+    cache = MemoryCache(max_bytes=100, ttl_seconds=None, sizer=len)
+    cache.put("a", "x" * 40)
+    cache.put("b", "x" * 40)
+    assert cache.get("a") == "x" * 40  # "b" is now least recently used
+
+    cache.put("c", "x" * 40)
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.total_bytes == 80
+    assert cache.get("b") is None
+    assert not cache.put("huge", "x" * 101)
+    assert cache.stats() == {
+        "entries": 2,
+        "bytes": 80,
+        "max_bytes": 100,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "expirations": 0,
+        "rejections": 1,
+    }
+
+
+def test_idle_entries_expire():
+    clock = FakeClock()
+    cache = MemoryCache(max_bytes=100, ttl_seconds=10, sizer=len, clock=clock)
+    cache.put("a", "aa")
+    cache.put("b", "bb")
+
+    clock.now = 8
+    assert cache.get("a") == "aa"  # refreshes "a"
+    clock.now = 15
+    assert cache.purge_expired() == 1
+    assert cache.get("a") == "aa"
+    clock.now = 30
+    assert cache.get("a") is None
+    assert cache.total_bytes == 0
+    assert cache.stats()["expirations"] == 2
+
+
+def test_summary_size_estimate():
+    summary = summarize_model(load_graph_once(get_brick_model_file("bldg1.ttl")))
+    cache = MemoryCache()
+
+    cache.put("model", summary)
+
+    assert cache.total_bytes == estimate_summary_bytes(summary)
+    assert cache.total_bytes == len(json.dumps(summary)) * BYTES_PER_SUMMARY_CHAR
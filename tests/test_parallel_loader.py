@@ -0,0 +1,41 @@
+from brick_model_summarizer import load_graph_once, summarize_model
+from brick_model_summarizer.parallel_loader import (
+    load_ntriples_parallel,
+    split_ntriples,
+)
+from tests.conftest import get_brick_model_file
+
+
+def write_ntriples(tmp_path, model):
+    graph = load_graph_once(get_brick_model_file(model))
+    nt_file = tmp_path / model.replace(".ttl", ".nt")
+    graph.serialize(destination=str(nt_file), format="nt", encoding="utf-8")
+    return graph, nt_file
+
+
+def test_chunks_cover_file_on_line_boundaries(tmp_path):
+    _, nt_file = write_ntriples(tmp_path, "acad.ttl")
+    data = nt_file.read_bytes()
+
+    ranges = split_ntriples(nt_file, 7)
+
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[start - 1 : start] == b"\n"
+
+
+def test_parallel_index_matches_graph_summary(tmp_path):
+    graph, nt_file = write_ntriples(tmp_path, "acad.ttl")
+    components = [
+        "zone_information",
+        "building_information",
+        "meter_information",
+        "central_plant_information",
+    ]
+
+    index = load_ntriples_parallel(nt_file, workers=2)
+    assert summarize_model(index, components) == summarize_model(graph, components)
+
+    parallel_graph = load_ntriples_parallel(nt_file, workers=2, as_graph=True)
+    assert len(parallel_graph) == len(graph)
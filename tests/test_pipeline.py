@@ -0,0 +1,103 @@
+import asyncio
+import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from brick_model_summarizer.batch import summarize_file
+from brick_model_summarizer.pipeline import (
+    LocalDirectorySource,
+    run_pipeline,
+    summarize_source,
+)
+from tests.conftest import get_brick_model_file
+
+
+COMPONENTS = ["building_information", "zone_information"]
+
+
+def make_portfolio(tmp_path):
+    portfolio = tmp_path / "portfolio"
+    portfolio.mkdir()
+    shutil.copy(get_brick_model_file("diggs.ttl"), portfolio / "diggs.ttl")
+    shutil.copy(
+        get_brick_model_file("original_my_building.ttl"),
+        portfolio / "my_building.ttl",
+    )
+    (portfolio / "broken.ttl").write_text("this is not turtle")
+    return portfolio
+
+
+def test_pipeline_matches_batch_records(tmp_path):
+    portfolio = make_portfolio(tmp_path)
+
+    result = summarize_source(portfolio, components=COMPONENTS, workers=2)
+
+    records = {record["model"]: record for record in result["records"]}
+    assert len(records) == 3
+    assert "error" in records[str(portfolio / "broken.ttl")]
+    diggs = str(portfolio / "diggs.ttl")
+    assert records[diggs]["summary"] == summarize_file(diggs, COMPONENTS)["summary"]
+    assert json.dumps(result["records"])
+    assert {name: stage["items"] for name, stage in result["stages"].items()} == {
+        "list": 3,
+        "fetch": 3,
+        "summarize": 3,
+        "sink": 3,
+    }
+
+
+def test_pipeline_backpressure_bounds_queues(tmp_path):
+    portfolio = make_portfolio(tmp_path)
+    received = []
+
+    async def slow_sink(record):
+        await asyncio.sleep(0.01)
+        received.append(record["model"])
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return await run_pipeline(
+                LocalDirectorySource(portfolio),
+                sink=slow_sink,
+                components=COMPONENTS,
+                workers=1,
+                fetchers=2,
+                queue_size=1,
+                executor=executor,
+            )
+
+    result = asyncio.run(run())
+
+    assert "records" not in result
+    assert sorted(received) == sorted(str(p) for p in portfolio.iterdir())
+    assert all(stage["max_queue"] <= 1 for stage in result["stages"].values())
+
+
+class FlakySource(LocalDirectorySource):
+    """Local source whose read fails for one model."""
+
+    async def read(self, key):
+        if key.endswith("my_building.ttl"):
+            raise OSError("connection reset")
+        return await super().read(key)
+
+
+def test_pipeline_records_read_errors_and_continues(tmp_path):
+    portfolio = make_portfolio(tmp_path)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        result = summarize_source(
+            FlakySource(portfolio),
+            components=COMPONENTS,
+            workers=1,
+            executor=executor,
+        )
+
+    records = {record["model"]: record for record in result["records"]}
+    assert len(records) == 3
+    assert records[str(portfolio / "my_building.ttl")]["error"] == (
+        "OSError: connection reset"
+    )
+    assert "summary" in records[str(portfolio / "diggs.ttl")]
+    assert result["stages"]["fetch"]["items"] == 3
+    assert result["stages"]["sink"]["items"] == 3
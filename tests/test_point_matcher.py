@@ -0,0 +1,37 @@
+import random
+from brick_model_summarizer.point_matcher import (
+    AHU_POINT_IDENTIFIERS,
+    VAV_POINT_IDENTIFIERS,
+    POINT_MATCHER,
+    PointMatcher,
+)
+
+
+def naive_hits(name, identifiers):
+    name = name.lower()
+    return frozenset(identifier for identifier in identifiers if identifier in name)
+
+
+def test_nested_identifiers_are_reported():
+    hits = POINT_MATCHER.match("AHU1_Active_Chilled_Beam_Heat_Wheel_VFD")
+    assert {"active_chilled_beam", "chilled_beam", "heat_wheel", "heat_wheel_vfd"} <= hits
+    assert "passive_chilled_beam" not in hits
+
+
+def test_matcher_agrees_with_substring_checks():
+    identifiers = AHU_POINT_IDENTIFIERS + VAV_POINT_IDENTIFIERS
+    pieces = list(identifiers) + ["ahu", "vav", "_", "zone", "air", "x1"]
+    rng = random.Random(7)
+
+    for _ in range(2000):
+        name = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 5)))
+        if rng.random() < 0.5:
+            name = name.upper()
+        assert POINT_MATCHER.match(name) == naive_hits(name, identifiers), name
+
+
+def test_overlapping_custom_identifiers():
+    matcher = PointMatcher(["abc", "bcd", "b", "abcd"])
+    assert matcher.match("xABCDx") == {"abc", "bcd", "b", "abcd"}
+    assert matcher.match("xbx") == {"b"}
+    assert matcher.match("nothing") == frozenset()
@@ -0,0 +1,53 @@
+import time
+
+import pytest
+from brick_model_summarizer import load_graph_once, summarize_model
+from brick_model_summarizer.queries import (
+    QUERY_REGISTRY,
+    QueryRegistry,
+    format_query_report,
+    query_report,
+)
+from brick_model_summarizer.zone_info import query_zone_setpoints
+from tests.conftest import get_brick_model_file
+
+
+def test_summary_records_every_query():
+    graph = load_graph_once(get_brick_model_file("bldg6.ttl"))
+    QUERY_REGISTRY.reset()
+
+    summarize_model(graph, ["zone_information", "building_information"])
+    report = {entry["query_id"]: entry for entry in query_report()}
+
+    for query_id in ["zone.setpoints", "zone.vav_per_ahu", "building.area"]:
+        assert report[query_id]["calls"] == 1
+    assert report["zone.setpoints"]["rows"] == len(query_zone_setpoints(graph))
+    # Dict results have no row count
+    assert report["zone.vav_per_ahu"]["rows"] is None
+    assert report["meters.counts"]["calls"] == 0
+    assert "zone.setpoints" in format_query_report()
+
+
+def test_nested_calls_report_self_time():
+    registry = QueryRegistry()
+
+    @registry.instrumented("inner")
+    def inner():
+        time.sleep(0.02)
+        return {"count": 1}
+
+    @registry.instrumented("outer")
+    def outer():
+        inner()
+        time.sleep(0.01)
+        return ["a", "b"]
+
+    outer()
+    report = {entry["query_id"]: entry for entry in registry.report()}
+
+    assert report["outer"]["total_seconds"] >= report["inner"]["total_seconds"]
+    assert report["outer"]["self_seconds"] == pytest.approx(
+        report["outer"]["total_seconds"] - report["inner"]["total_seconds"]
+    )
+    assert report["inner"]["self_seconds"] == report["inner"]["total_seconds"]
+    assert (report["outer"]["rows"], report["inner"]["rows"]) == (2, None)
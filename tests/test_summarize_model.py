@@ -0,0 +1,70 @@
+import pytest
+from brick_model_summarizer import (
+    load_graph_once,
+    summarize_model,
+    get_ahu_information,
+    get_zone_information,
+    get_building_information,
+    get_meter_information,
+    get_central_plant_information,
+    get_vav_boxes_per_ahu,
+)
+from brick_model_summarizer.summary import resolve_intermediates
+from brick_model_summarizer.utils import BRICK, RDF
+from rdflib import URIRef
+from tests.conftest import get_brick_model_file
+
+
+COMPONENT_GETTERS = {
+    "ahu_information": get_ahu_information,
+    "zone_information": get_zone_information,
+    "building_information": get_building_information,
+    "meter_information": get_meter_information,
+    "central_plant_information": get_central_plant_information,
+    "number_of_vav_boxes_per_ahu": get_vav_boxes_per_ahu,
+}
+
+
+@pytest.mark.parametrize("model", ["diggs.ttl", "original_my_building.ttl"])
+def test_summarize_model_matches_individual_getters(model):
+    """summarize_model must return exactly what the get_* wrappers return."""
+    graph = load_graph_once(get_brick_model_file(model))
+    # A separate graph, so the getters do not read summarize_model's memo
+    fresh_graph = load_graph_once(get_brick_model_file(model))
+
+    summary = summarize_model(graph, list(COMPONENT_GETTERS))
+
+    assert list(summary) == list(COMPONENT_GETTERS)
+    for component, getter in COMPONENT_GETTERS.items():
+        assert summary[component] == getter(fresh_graph), component
+
+
+def test_shared_intermediates_are_resolved_once():
+    """Components sharing an intermediate should only request it once."""
+    needed = resolve_intermediates(
+        ["zone_information", "number_of_vav_boxes_per_ahu"]
+    )
+    assert needed.count("vav_per_ahu") == 1
+
+
+def test_unknown_component_raises():
+    graph = load_graph_once(get_brick_model_file("diggs.ttl"))
+    with pytest.raises(ValueError):
+        summarize_model(graph, ["not_a_component"])
+
+
+def test_results_are_memoized_until_the_graph_changes():
+    graph = load_graph_once(get_brick_model_file("bldg6.ttl"))
+    zone_information = get_zone_information(graph)
+    vav_count = zone_information["total_variable_air_volume_boxes"]
+
+    assert get_zone_information(graph) is zone_information
+
+    vav = URIRef("urn:test#VAV-NEW")
+    graph.add((vav, RDF.type, BRICK.Variable_Air_Volume_Box))
+    assert get_zone_information(graph)["total_variable_air_volume_boxes"] == (
+        vav_count + 1
+    )
+
+    graph.remove((vav, None, None))
+    assert get_zone_information(graph)["total_variable_air_volume_boxes"] == vav_count
@@ -0,0 +1,113 @@
+import os
+
+from brick_model_summarizer.class_tag_checker import load_brick_classes, load_brick_tags
+from brick_model_summarizer.utils import BRICK
+from brick_model_summarizer.vocabulary import (
+    load_brick_vocabulary,
+    refresh_brick_vocabulary,
+)
+
+
+MINI_BRICK_TTL = """
+@prefix brick: <https://brickschema.org/schema/Brick#> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix tag: <https://brickschema.org/schema/BrickTag#> .
+@prefix rec: <https://w3id.org/rec#> .
+
+<https://brickschema.org/schema/1.9/Brick> a owl:Ontology ;
+    owl:versionInfo "1.9.0" .
+
+brick:Entity a owl:Class .
+brick:Equipment a owl:Class ; rdfs:subClassOf brick:Entity .
+brick:Chiller a owl:Class ; rdfs:subClassOf brick:Equipment ;
+    brick:hasAssociatedTag tag:Chiller, tag:Equipment .
+brick:Old_Chiller a owl:Class ; rdfs:subClassOf brick:Equipment ;
+    brick:aliasOf brick:Chiller .
+brick:Class a owl:Class ; rdfs:subClassOf brick:Entity .
+brick:System a owl:Class ; rdfs:subClassOf rec:Collection .
+brick:Hot_Water_System a owl:Class ; rdfs:subClassOf brick:System .
+
+tag:Chiller a brick:Tag ; rdfs:label "Chiller" .
+tag:Equipment a brick:Tag ; rdfs:label "Equipment" .
+"""
+
+
+def test_bundled_vocabulary_needs_no_local_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    classes = load_brick_classes()
+    tags = load_brick_tags()
+
+    assert isinstance(classes, frozenset)
+    assert "Air_Handling_Unit" in classes
+    assert "Air_Handler_Unit" not in classes
+    assert "AHU" in tags
+    assert load_brick_classes() is classes
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_refresh_replaces_vocabulary_atomically(tmp_path):
+    brick_ttl = tmp_path / "Brick.ttl"
+    brick_ttl.write_text(MINI_BRICK_TTL)
+    vocabulary_file = str(tmp_path / "vocabulary.json.gz")
+
+    vocabulary = refresh_brick_vocabulary(str(brick_ttl), vocabulary_file)
+
+    assert vocabulary.brick_version == "1.9.0"
+    assert vocabulary.classes == {
+        "Entity",
+        "Equipment",
+        "Chiller",
+        "System",
+        "Hot_Water_System",
+    }
+    assert vocabulary.tags == {"Chiller", "Equipment"}
+    assert vocabulary.aliases == {"Old_Chiller": "Chiller"}
+    assert vocabulary.class_tags["Chiller"] == {"Chiller", "Equipment"}
+    assert vocabulary.hierarchy.descendants(BRICK.Equipment) == {
+        BRICK.Equipment,
+        BRICK.Chiller,
+        BRICK.Old_Chiller,
+    }
+    assert load_brick_vocabulary(vocabulary_file) is vocabulary
+    # No temporary files are left behind
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "Brick.ttl",
+        "vocabulary.json.gz",
+    ]
+
+
+def test_compiled_vocabulary_is_reproducible(tmp_path):
+    brick_ttl = tmp_path / "Brick.ttl"
+    brick_ttl.write_text(MINI_BRICK_TTL)
+    first, second = tmp_path / "first.json.gz", tmp_path / "second.json.gz"
+
+    refresh_brick_vocabulary(str(brick_ttl), str(first))
+    refresh_brick_vocabulary(str(brick_ttl), str(second))
+
+    assert first.read_bytes() == second.read_bytes()
+
+
+# Classes of the list shipped in 0.4.1 that Brick itself has since dropped
+# or turned into aliases
+REMOVED_FROM_BRICK = {
+    "Building_Disconnect_Switch",
+    "Isolation_Switch",
+    "Lighting_Correlated_Color_Temperature_Sensor",
+    "Radioactivity_Concentration_Sensor",
+}
+
+
+def test_bundled_classes_keep_previous_class_list():
+    previous_path = os.path.join(
+        os.path.dirname(__file__), "data", "brick_classes_0_4_1.txt"
+    )
+    with open(previous_path, encoding="utf-8") as file:
+        previous = {line.strip() for line in file if line.strip()}
+
+    classes = load_brick_classes()
+
+    assert previous - REMOVED_FROM_BRICK <= classes
+    assert {"Chilled_Water_System", "Condenser_Water_Loop"} <= classes
+    assert not {"Class", "Tag"} & classes